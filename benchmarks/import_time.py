@@ -0,0 +1,84 @@
+"""
+Benchmarks import time of cryptodatapy.
+
+Each scenario runs in a fresh interpreter, so module caches don't carry over. The 'all data sources' scenario imports
+every data source module, which is what importing the package cost before data sources were loaded lazily.
+
+Usage
+-----
+python benchmarks/import_time.py [--runs 5]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+# heavy third party modules, reported when imported by a scenario
+heavy_modules = [
+    'ccxt', 'coinmetrics', 'investpy', 'dbnomics', 'pandas_datareader', 'yfinance', 'selenium', 'webdriver_manager',
+    'statsmodels', 'prophet',
+]
+
+scenarios = {
+    'import cryptodatapy': "import cryptodatapy",
+    'glassnode only': "import cryptodatapy\n"
+                      "from cryptodatapy.extract.registry import get_data_source\n"
+                      "get_data_source('glassnode')",
+    'all data sources': "import cryptodatapy\n"
+                        "from cryptodatapy.extract.registry import data_sources, get_data_source\n"
+                        "[get_data_source(source) for source in data_sources]\n"
+                        "import cryptodatapy.util.datacatalog, selenium, webdriver_manager.chrome\n"
+                        "import cryptodatapy.transform.od, prophet, statsmodels.tsa.seasonal",
+}
+
+timer = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed, ','.join(mod for mod in {heavy_modules!r} if mod in sys.modules))
+"""
+
+
+def time_import(code: str, runs: int):
+    """
+    Times code in fresh interpreters.
+
+    Parameters
+    ----------
+    code: str
+        Code to time.
+    runs: int
+        Number of runs.
+
+    Returns
+    -------
+    times: list
+        Elapsed time of each run, in seconds.
+    modules: str
+        Heavy modules imported by the code.
+    """
+    times, modules = [], ''
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, '-c', timer.format(code=code, heavy_modules=heavy_modules)],
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        times.append(float(out[0]))
+        modules = out[1] if len(out) > 1 else ''
+
+    return times, modules
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--runs', type=int, default=5, help='number of runs per scenario')
+    args = parser.parse_args()
+
+    # warm up file system cache
+    time_import(scenarios['all data sources'], 1)
+
+    print(f"{'scenario':<20}{'median (s)':>12}{'min (s)':>10}  heavy modules")
+    for name, code in scenarios.items():
+        times, modules = time_import(code, args.runs)
+        print(f"{name:<20}{statistics.median(times):>12.3f}{min(times):>10.3f}  {modules or '-'}")
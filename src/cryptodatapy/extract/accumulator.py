@@ -0,0 +1,87 @@
+from typing import Any, List, Optional, Sequence, Union
+
+import pandas as pd
+
+
+class Accumulator:
+    """
+    Collects pages of data (dataframes, series or lists of records) and materialises a single dataframe at the end,
+    instead of concatenating on every iteration of a loop, which copies all previous pages each time.
+    """
+
+    def __init__(self, columns: Optional[Sequence[str]] = None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        columns: list, optional, default None
+            Column names used when records are lists or tuples, e.g. ['date', 'open', 'high', 'low', 'close'].
+        """
+        self.columns = columns
+        self._frames: List[Union[pd.DataFrame, pd.Series]] = []
+        self._records: List[Any] = []
+
+    def __len__(self) -> int:
+        """
+        Returns number of pages and records collected.
+        """
+        return len(self._frames) + len(self._records)
+
+    @property
+    def empty(self) -> bool:
+        """
+        Returns True if no data has been collected.
+        """
+        return len(self) == 0
+
+    def add(self, data: Optional[Union[pd.DataFrame, pd.Series, List[Any]]]) -> None:
+        """
+        Adds a page of data.
+
+        Parameters
+        ----------
+        data: pd.DataFrame, pd.Series or list
+            Dataframe or series, or list of records (dicts, lists or tuples). None and empty pages are ignored.
+        """
+        if data is None:
+            return
+        elif isinstance(data, (pd.DataFrame, pd.Series)):
+            if not data.empty:
+                self._flush()
+                self._frames.append(data)
+        elif isinstance(data, list):
+            self._records.extend(data)
+        else:
+            raise TypeError("Data must be a dataframe, series or list of records.")
+
+    def _flush(self) -> None:
+        """
+        Converts records collected so far to a dataframe, preserving the order of pages.
+        """
+        if self._records:
+            self._frames.append(pd.DataFrame(self._records, columns=self.columns))
+            self._records = []
+
+    def to_frame(self, **kwargs) -> pd.DataFrame:
+        """
+        Materialises collected data into a single dataframe.
+
+        Parameters
+        ----------
+        **kwargs
+            Keyword arguments passed to pd.concat, e.g. axis=1.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with all collected data, empty if no data was collected.
+        """
+        self._flush()
+
+        if len(self._frames) == 0:
+            return pd.DataFrame(columns=self.columns)
+        elif len(self._frames) == 1 and isinstance(self._frames[0], pd.DataFrame):
+            return self._frames[0]
+
+        return pd.concat(self._frames, **kwargs)
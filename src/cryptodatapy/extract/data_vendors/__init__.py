@@ -1,5 +1,18 @@
-from cryptodatapy.extract.data_vendors.coinmetrics_api import CoinMetrics
-from cryptodatapy.extract.data_vendors.cryptocompare_api import CryptoCompare
-from cryptodatapy.extract.data_vendors.datavendor import DataVendor
-from cryptodatapy.extract.data_vendors.glassnode_api import Glassnode
-from cryptodatapy.extract.data_vendors.tiingo_api import Tiingo
+from cryptodatapy.extract.registry import lazy_getattr
+
+# exports imported on first access, so importing one data source doesn't import the others
+exports = {
+    "CoinMetrics": "coinmetrics_api",
+    "CryptoCompare": "cryptocompare_api",
+    "DataVendor": "datavendor",
+    "Glassnode": "glassnode_api",
+    "Tiingo": "tiingo_api",
+}
+
+
+def __getattr__(name):
+    return lazy_getattr(__name__, exports, name)
+
+
+def __dir__():
+    return sorted(list(globals()) + list(exports))
@@ -1,15 +1,24 @@
 import logging
-from time import sleep
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
+import pyarrow.dataset as ds
 from coinmetrics.api_client import CoinMetricsClient
 
+from cryptodatapy.extract.accumulator import Accumulator
 from cryptodatapy.extract.data_vendors.datavendor import DataVendor
 from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.extract.scheduler import scheduler
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData, WrangleInfo
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.datasink import ParquetSink
+from cryptodatapy.util.diskcache import disk_cache
 
 # data credentials
 data_cred = DataCredentials()
@@ -17,12 +26,37 @@ data_cred = DataCredentials()
 # CoinMetrics community API client:
 client = CoinMetricsClient()
 
+# catalog id sets shared by all instances, keyed by catalog data type
+catalog_indexes: Dict[str, Tuple[float, FrozenSet[str]]] = {}
+catalog_lock = threading.RLock()
+
 
 class CoinMetrics(DataVendor):
     """
     Retrieves data from Coin Metrics Python client API v4.
     """
 
+    # community api rate limit, 10 calls per 6 second sliding window
+    default_rate_limit = {'calls': 10, 'period': 6}
+
+    # number of date range and entity (assets, markets, etc.) shards of timeseries requests, fetched concurrently
+    time_shards = 1
+    entity_shards = 1
+    max_workers = 8
+
+    # params with comma-separated entities, by timeseries endpoint
+    entity_params = ['assets', 'markets', 'indexes', 'institutions']
+
+    # time-to-live of catalog metadata, in seconds
+    catalog_ttl = 86400
+
+    # id column of each catalog
+    catalog_ids = {'catalog_exchanges': 'exchange', 'catalog_indexes': 'index', 'catalog_assets': 'asset',
+                   'catalog_institutions': 'institution', 'catalog_markets': 'market', 'catalog_metrics': 'metric'}
+
+    # trades and quotes cols kept as strings when streamed to parquet
+    sink_id_cols = ['market', 'coin_metrics_id', 'side', 'date']
+
     def __init__(
             self,
             categories: Union[str, List[str]] = "crypto",
@@ -87,31 +121,71 @@ class CoinMetrics(DataVendor):
             rate_limit,
         )
 
-    @staticmethod
-    def req_meta(data_type: str) -> Dict[str, Any]:
+    def req_meta(self, data_type: str, refresh: bool = False) -> Optional[pd.DataFrame]:
         """
-        Request metadata.
+        Request metadata, served from the disk cache until it expires after catalog_ttl seconds.
 
         Parameters
         ----------
         data_type: str, {'catalog_exchanges', 'catalog_indexes', 'catalog_assets', 'catalog_institutions',
                          'catalog_markets', 'catalog_metrics' }
             Type of data to request metadata for.
+        refresh: bool, default False
+            Bypasses the disk cache and requests metadata from the API.
 
         Returns
         -------
-        meta: Any
-            Object with metadata.
+        meta: pd.DataFrame
+            Dataframe with metadata, or None if it could not be retrieved.
         """
-        try:
-            meta = getattr(client, data_type)()
+        key = f"coinmetrics_{data_type}"
 
-        except AssertionError as e:
-            logging.warning(e)
-            logging.warning(f"Failed to get metadata for {data_type}.")
+        # concurrent requests wait for the first one to fill the cache
+        with catalog_lock:
+            meta = None if refresh else disk_cache.get(key, ttl=self.catalog_ttl)
 
-        else:
-            return meta
+            if meta is None:
+                try:
+                    meta = scheduler.run(getattr(client, data_type), rate_limiter=self.rate_limiter)
+
+                except AssertionError as e:
+                    logging.warning(e)
+                    logging.warning(f"Failed to get metadata for {data_type}.")
+                    return None
+
+                meta = pd.DataFrame(meta)
+                disk_cache.set(key, meta)
+                catalog_indexes.pop(data_type, None)
+
+        return meta.copy(deep=False)
+
+    def get_catalog_index(self, data_type: str) -> FrozenSet[str]:
+        """
+        Gets the set of ids in a catalog, e.g. asset tickers in 'catalog_assets', for constant time lookups.
+
+        Parameters
+        ----------
+        data_type: str, {'catalog_exchanges', 'catalog_indexes', 'catalog_assets', 'catalog_institutions',
+                         'catalog_markets', 'catalog_metrics' }
+            Type of catalog.
+
+        Returns
+        -------
+        index: frozenset
+            Set of ids in the id column of the catalog, e.g. 'btc', 'CMBIBTC' or 'AdrActCnt'.
+        """
+        with catalog_lock:
+            if data_type in catalog_indexes and time.time() - catalog_indexes[data_type][0] <= self.catalog_ttl:
+                return catalog_indexes[data_type][1]
+
+            meta = self.req_meta(data_type)
+            col = self.catalog_ids[data_type]
+            if meta is not None and not meta.empty and col not in meta.columns:
+                logging.warning(f"No '{col}' column in {data_type} metadata.")
+            index = frozenset() if meta is None or col not in meta.columns else frozenset(meta[col])
+            catalog_indexes[data_type] = (time.time(), index)
+
+        return index
 
     def get_exchanges_info(self, as_list: bool = False) -> Union[List[str], pd.DataFrame]:
         """
@@ -341,9 +415,9 @@ class CoinMetrics(DataVendor):
         if self.fields is None:
             self.get_fields_info(as_list=True)
 
-    def req_data(self, data_type: str, params: Dict[str, Union[str, int]]) -> pd.DataFrame:
+    def iter_pages(self, data_type: str, params: Dict[str, Union[str, int]]) -> Iterator[pd.DataFrame]:
         """
-        Sends data request to Python client.
+        Sends data request to API and yields each page of the response as soon as it is received.
 
         Parameters
         ----------
@@ -352,42 +426,141 @@ class CoinMetrics(DataVendor):
         params: dict
             Dictionary containing parameter values for get request.
 
-        Returns
-        -------
+        Yields
+        ------
         df: pd.DataFrame
-            Dataframe with datetime, ticker/identifier, and field/col values.
+            Dataframe with datetime, ticker/identifier, and field/col values of a page.
         """
         # url
         url = self.base_url + data_type
 
         # data request
-        data_resp = DataRequest().get_req(url=url, params=params)
+        data_resp = DataRequest().get_req(url=url, params=params, rate_limiter=self.rate_limiter)
 
         # raise error if data is None
         if data_resp is None:
             raise Exception("Failed to fetch data after multiple attempts.")
-        # retrieve data
-        else:
-            # data
-            data, next_page_url = data_resp.get('data', []), data_resp.get('next_page_url')
 
-            # while loop
-            while next_page_url:
-                # wait to avoid exceeding rate limit
-                sleep(0.6)
+        yield pd.DataFrame(data_resp.get('data', []))
+        next_page_url = data_resp.get('next_page_url')
+
+        # while loop
+        while next_page_url:
+            # request next page
+            data_resp = DataRequest().get_req(url=next_page_url, params=None, rate_limiter=self.rate_limiter)
+            if data_resp is None:
+                raise Exception("Failed to fetch data after multiple attempts.")
+            next_page_url = data_resp.get('next_page_url')
+
+            yield pd.DataFrame(data_resp.get('data', []))
+
+    def get_shards(
+        self,
+        params: Dict[str, Union[str, int]],
+        time_shards: Optional[int] = None,
+        entity_shards: Optional[int] = None
+    ) -> List[Dict[str, Union[str, int]]]:
+        """
+        Splits the params of a timeseries request into shards of its date range and entities.
 
-                # request next page
-                next_page_data_resp = DataRequest(pause=0.6).get_req(url=next_page_url, params=None)
-                next_page_data, next_page_url = next_page_data_resp.get('data', []), next_page_data_resp.get(
-                    'next_page_url')
+        Date range shards exclude their end time, except for the last one, so observations aren't repeated.
 
-                # add data to list
-                data.extend(next_page_data)
+        Parameters
+        ----------
+        params: dict
+            Dictionary containing parameter values for get request.
+        time_shards: int, optional, default None
+            Number of date range shards. Requests without start and end times aren't split by date. If None,
+            time_shards attribute is used.
+        entity_shards: int, optional, default None
+            Number of shards of the comma-separated assets, markets, indexes or institutions. If None, entity_shards
+            attribute is used.
 
-            # convert to df
-            df = pd.DataFrame(data)
+        Returns
+        -------
+        shards: list
+            List of params dictionaries, one per shard.
+        """
+        time_shards = self.time_shards if time_shards is None else time_shards
+        entity_shards = self.entity_shards if entity_shards is None else entity_shards
+        if time_shards < 1 or entity_shards < 1:
+            raise ValueError("Number of shards must be a positive integer.")
+
+        # date range shards
+        time_params = [{}]
+        if time_shards > 1 and params.get('start_time') is not None:
+            start = pd.Timestamp(params['start_time'])
+            end = pd.Timestamp.utcnow().tz_localize(None) if params.get('end_time') is None \
+                else pd.Timestamp(params['end_time'])
+            dates = pd.date_range(start, end, periods=time_shards + 1)
+            dates = dates.floor('D') if params.get('frequency') == '1d' else dates.floor('s')
+            dates = dates.unique()
+            time_params = [
+                {'start_time': dates[i].isoformat(), 'end_time': dates[i + 1].isoformat(), 'end_inclusive': 'false'}
+                for i in range(len(dates) - 1)
+            ]
+            if time_params:
+                time_params[-1] = {'start_time': time_params[-1]['start_time'], 'end_time': params.get('end_time')}
+            else:
+                time_params = [{}]
+
+        # entity shards
+        entity_params = [{}]
+        key = next((key for key in self.entity_params if isinstance(params.get(key), str)), None)
+        if entity_shards > 1 and key is not None:
+            entities = params[key].split(',')
+            size = -(-len(entities) // entity_shards)
+            entity_params = [{key: ','.join(entities[i: i + size])} for i in range(0, len(entities), size)]
+
+        return [{**params, **time_param, **entity_param} for entity_param in entity_params
+                for time_param in time_params]
+
+    def req_data(
+        self,
+        data_type: str,
+        params: Dict[str, Union[str, int]],
+        time_shards: Optional[int] = None,
+        entity_shards: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Sends data request to Python client.
+
+        Requests split into shards are fetched concurrently, each following its own page cursor, and
+        concatenated in shard order.
 
-            return df
+        Parameters
+        ----------
+        data_type: str
+            Data type to retrieve.
+        params: dict
+            Dictionary containing parameter values for get request.
+        time_shards: int, optional, default None
+            Number of date range shards. If None, time_shards attribute is used.
+        entity_shards: int, optional, default None
+            Number of entity shards. If None, entity_shards attribute is used.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with datetime, ticker/identifier, and field/col values.
+        """
+        shards = self.get_shards(params, time_shards=time_shards, entity_shards=entity_shards)
+
+        # accumulate pages
+        pages = Accumulator()
+        if len(shards) == 1:
+            for page in self.iter_pages(data_type, params):
+                pages.add(page)
+
+        # fetch shards concurrently, keeping the caller's scheduler priority
+        else:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(shards)))) as executor:
+                futures = [executor.submit(copy_context().run, self.req_data, data_type, shard, 1, 1)
+                           for shard in shards]
+                for future in futures:
+                    pages.add(future.result())
+
+        return pages.to_frame(ignore_index=True)
 
     @staticmethod
     def wrangle_data_resp(data_req: DataRequest, data_resp: pd.DataFrame()):
@@ -439,6 +612,89 @@ class CoinMetrics(DataVendor):
 
         return df
 
+    def iter_tidy_data(self, data_req: DataRequest, data_type: str, params: dict) -> Iterator[pd.DataFrame]:
+        """
+        Gets data page by page and yields each page in tidy data format as soon as it is wrangled, e.g. for trades
+        and quotes, which are too large to hold in memory at once.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        data_type: str
+            Data type to retrieve, e.g. '/timeseries/market-trades'.
+        params: dict
+            Dictionary containing parameter values for get request.
+
+        Yields
+        ------
+        df: pd.DataFrame - MultiIndex
+            Dataframe with DatetimeIndex (level 0), ticker (level 1) and values for fields/col of a page, in tidy data
+            format.
+        """
+        for page in self.iter_pages(data_type, params):
+            if not page.empty:
+                yield self.wrangle_data_resp(data_req, page)
+
+    def iter_sink_pages(self, data_type: str, params: Dict[str, Union[str, int]]) -> Iterator[pd.DataFrame]:
+        """
+        Gets data page by page and yields each page with typed columns and a date column, ready to be written to
+        a Parquet dataset partitioned by market and date.
+
+        Parameters
+        ----------
+        data_type: str
+            Data type to retrieve, e.g. '/timeseries/market-trades'.
+        params: dict
+            Dictionary containing parameter values for get request.
+
+        Yields
+        ------
+        df: pd.DataFrame
+            Dataframe with market, time, date and values for fields/col of a page.
+        """
+        for page in self.iter_pages(data_type, params):
+            if page.empty:
+                continue
+            # convert values, keeping identifiers as strings
+            for col in page.columns:
+                if col in ['time', 'database_time']:
+                    page[col] = pd.to_datetime(page[col], utc=True)
+                elif col not in self.sink_id_cols:
+                    page[col] = pd.to_numeric(page[col], errors='coerce')
+            # partition col
+            page['date'] = page['time'].dt.strftime('%Y-%m-%d')
+
+            yield page
+
+    def sink_data(
+        self,
+        data_type: str,
+        params: Dict[str, Union[str, int]],
+        path: Union[str, Path]
+    ) -> ds.Dataset:
+        """
+        Gets data page by page and appends each page to a Parquet dataset partitioned by market and date, so
+        that data larger than memory, e.g. tick trades and quotes, never has to be held at once.
+
+        Parameters
+        ----------
+        data_type: str
+            Data type to retrieve, e.g. '/timeseries/market-trades'.
+        params: dict
+            Dictionary containing parameter values for get request.
+        path: str or Path
+            Root directory of the Parquet dataset.
+
+        Returns
+        -------
+        dataset: ds.Dataset
+            Lazy handle on the Parquet dataset, e.g. dataset.to_table(filter=ds.field('date') == '2024-01-01').
+        """
+        sink = ParquetSink(path, partition_cols=['market', 'date'])
+
+        return sink.write(self.iter_sink_pages(data_type, params))
+
     def check_tickers(self, data_req: DataRequest, data_type: str) -> List[str]:
         """
         Checks tickers for data availability.
@@ -463,23 +719,23 @@ class CoinMetrics(DataVendor):
 
         # check indexes
         if data_type == 'indexes':
-            self.get_indexes_info(as_list=True)
+            indexes = self.get_catalog_index('catalog_indexes')
             # avail tickers
-            tickers = [ticker for ticker in cm_data_req["tickers"] if ticker.upper() in self.indexes]
+            tickers = [ticker for ticker in cm_data_req["tickers"] if ticker.upper() in indexes]
 
         # check markets
         elif data_type == 'market_candles' or data_type == 'open_interest' or \
                 data_type == 'funding_rates' or data_type == 'trades' or data_type == 'quotes':
-            self.get_assets_info(as_list=True)
+            assets = self.get_catalog_index('catalog_assets')
             # avail tickers
             tickers = [ticker for asset, ticker in zip(cm_data_req["tickers"], cm_data_req["mkts"]) if
-                       asset in self.assets]
+                       asset in assets]
 
         # check assets
         elif data_type == 'asset_metrics':
-            self.get_assets_info(as_list=True)
+            assets = self.get_catalog_index('catalog_assets')
             # avail tickers
-            tickers = [ticker for ticker in cm_data_req["tickers"] if ticker in self.assets]
+            tickers = [ticker for ticker in cm_data_req["tickers"] if ticker in assets]
 
         # raise error if no tickers available
         if len(tickers) == 0:
@@ -515,14 +771,14 @@ class CoinMetrics(DataVendor):
         # check instution
         if data_type == 'institutions':
             # avail inst
-            inst_list = [val for key, val in self.get_inst_info(as_dict=True).items()][0]
-            fields = [field for field in cm_data_req["fields"] if field in inst_list]
+            inst_fields = set([val for key, val in self.get_inst_info(as_dict=True).items()][0])
+            fields = [field for field in cm_data_req["fields"] if field in inst_fields]
 
         # check on-chain metrics
         elif data_type == 'asset_metrics':
-            self.get_fields_info(data_type='on-chain', as_list=True)
+            onchain_fields = self.get_catalog_index('catalog_metrics')
             # avail fields
-            fields = [field for field in cm_data_req["fields"] if field in self.fields]
+            fields = [field for field in cm_data_req["fields"] if field in onchain_fields]
 
         # raise error if fields is empty
         if len(fields) == 0:
@@ -637,7 +893,6 @@ class CoinMetrics(DataVendor):
 
         # check tickers
         tickers = self.check_tickers(data_req, data_type='indexes')
-        sleep(0.6)
 
         # params
         params = {
@@ -678,7 +933,6 @@ class CoinMetrics(DataVendor):
 
         # check fields
         fields = self.check_fields(data_req, data_type='institutions')
-        sleep(0.6)
 
         # params
         params = {
@@ -720,7 +974,6 @@ class CoinMetrics(DataVendor):
 
         # check tickers
         tickers = self.check_tickers(data_req, data_type='market_candles')
-        sleep(0.6)
 
         # params
         params = {
@@ -761,11 +1014,9 @@ class CoinMetrics(DataVendor):
 
         # check tickers
         tickers = self.check_tickers(data_req, data_type='asset_metrics')
-        sleep(0.6)
 
         # check fields
         fields = self.check_fields(data_req, data_type='asset_metrics')
-        sleep(0.6)
 
         # params
         params = {
@@ -811,7 +1062,6 @@ class CoinMetrics(DataVendor):
 
         # check tickers
         tickers = self.check_tickers(data_req, data_type='open_interest')
-        sleep(0.6)
 
         # params
         params = {
@@ -852,7 +1102,6 @@ class CoinMetrics(DataVendor):
 
         # check tickers
         tickers = self.check_tickers(data_req, data_type='funding_rates')
-        sleep(0.6)
 
         # params
         params = {
@@ -871,7 +1120,11 @@ class CoinMetrics(DataVendor):
 
         return df
 
-    def get_trades(self, data_req: DataRequest) -> pd.DataFrame:
+    def get_trades(
+        self,
+        data_req: DataRequest,
+        path: Optional[Union[str, Path]] = None
+    ) -> Union[pd.DataFrame, ds.Dataset]:
         """
         Get trades (transactions) data.
 
@@ -879,11 +1132,15 @@ class CoinMetrics(DataVendor):
         ----------
         data_req: DataRequest
             Parameters of data request in CryptoDataPy format.
+        path: str or Path, optional, default None
+            Root directory of a Parquet dataset. If provided, pages are streamed to the dataset, partitioned by
+            market and date, instead of being gathered in memory.
 
         Returns
         -------
-        df: pd.DataFrame - MultiIndex
-            DataFrame with DatetimeIndex (level 0), ticker (level 1), and bid/ask price and size values (cols).
+        df: pd.DataFrame - MultiIndex or ds.Dataset
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and bid/ask price and size values (cols), or
+            lazy handle on the Parquet dataset if path is provided.
         """
         # convert data request parameters to Coin Metrics format
         cm_data_req = ConvertParams(data_req).to_coinmetrics()
@@ -893,7 +1150,6 @@ class CoinMetrics(DataVendor):
 
         # check tickers
         tickers = self.check_tickers(data_req, data_type='trades')
-        sleep(0.6)
 
         # params
         params = {
@@ -904,6 +1160,10 @@ class CoinMetrics(DataVendor):
             'page_size': 10000,
         }
 
+        # stream to parquet dataset
+        if path is not None:
+            return self.sink_data(data_type='/timeseries/market-trades', params=params, path=path)
+
         # get tidy data
         df = self.get_tidy_data(data_req,
                                 data_type='/timeseries/market-trades',
@@ -912,7 +1172,11 @@ class CoinMetrics(DataVendor):
 
         return df
 
-    def get_quotes(self, data_req: DataRequest) -> pd.DataFrame:
+    def get_quotes(
+        self,
+        data_req: DataRequest,
+        path: Optional[Union[str, Path]] = None
+    ) -> Union[pd.DataFrame, ds.Dataset]:
         """
         Get quotes (order book) data.
 
@@ -920,11 +1184,15 @@ class CoinMetrics(DataVendor):
         ----------
         data_req: DataRequest
             Parameters of data request in CryptoDataPy format.
+        path: str or Path, optional, default None
+            Root directory of a Parquet dataset. If provided, pages are streamed to the dataset, partitioned by
+            market and date, instead of being gathered in memory.
 
         Returns
         -------
-        df: pd.DataFrame - MultiIndex
-            DataFrame with DatetimeIndex (level 0), ticker (level 1), and bid/ask price and size values (cols).
+        df: pd.DataFrame - MultiIndex or ds.Dataset
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and bid/ask price and size values (cols), or
+            lazy handle on the Parquet dataset if path is provided.
         """
         # convert data request parameters to Coin Metrics format
         cm_data_req = ConvertParams(data_req).to_coinmetrics()
@@ -934,7 +1202,6 @@ class CoinMetrics(DataVendor):
 
         # check tickers
         tickers = self.check_tickers(data_req, data_type='quotes')
-        sleep(0.6)
 
         # params
         params = {
@@ -946,6 +1213,10 @@ class CoinMetrics(DataVendor):
             'page_size': 10000,
         }
 
+        # stream to parquet dataset
+        if path is not None:
+            return self.sink_data(data_type='/timeseries/market-quotes', params=params, path=path)
+
         # get tidy data
         df = self.get_tidy_data(data_req,
                                 data_type='/timeseries/market-quotes',
@@ -972,44 +1243,39 @@ class CoinMetrics(DataVendor):
         # convert data request parameters to Coin Metrics format
         cm_data_req = ConvertParams(data_req).to_coinmetrics()
 
-        # check if fields available
-        self.get_fields_info(as_list=True)
-        sleep(0.6)
-        # if not all([field in self.fields for field in cm_data_req["fields"]]):
-        #     raise ValueError(
-        #         "Some selected fields are not available. Check available fields with"
-        #         " get_fields_info method and try again."
-        #     )
+        # field sets, from cached catalogs
+        ohlcv_fields = {'price_open', 'price_close', 'price_high', 'price_low', 'vwap', 'volume',
+                        'candle_usd_volume', 'candle_trades_count'}
+        oc_fields = self.get_catalog_index('catalog_metrics') - ohlcv_fields
+        # institution fields, only looked up for fields not in the market or on-chain catalogs
+        if not all([field in ohlcv_fields or field in oc_fields for field in cm_data_req["fields"]]):
+            inst_fields = set([val for key, val in self.get_inst_info(as_dict=True).items()][0])
+            oc_fields = oc_fields | (inst_fields - ohlcv_fields)
 
-        # field lists
-        ohlcv_list = ['price_open', 'price_close', 'price_high', 'price_low', 'vwap', 'volume',
-                      'candle_usd_volume', 'candle_trades_count']
-        oc_list = [field for field in self.fields if field not in ohlcv_list]
+        # ticker sets, from cached catalogs
+        indexes = self.get_catalog_index('catalog_indexes')
+        assets = self.get_catalog_index('catalog_assets')
 
         # empty df
         df = pd.DataFrame()
 
         # get indexes data
-        self.get_indexes_info(as_list=True)
-        sleep(0.6)
-        if any([ticker.upper() in self.indexes for ticker in cm_data_req["tickers"]]) and any(
-                [field in ohlcv_list for field in cm_data_req["fields"]]
+        if any([ticker.upper() in indexes for ticker in cm_data_req["tickers"]]) and any(
+                [field in ohlcv_fields for field in cm_data_req["fields"]]
         ):
             df0 = self.get_indexes(data_req)
             df = pd.concat([df, df0])
 
         # get OHLCV data
-        self.get_assets_info(as_list=True)
-        sleep(0.6)
-        if any([ticker in self.assets for ticker in cm_data_req["tickers"]]) and any(
-                [field in ohlcv_list for field in cm_data_req["fields"]]
+        if any([ticker in assets for ticker in cm_data_req["tickers"]]) and any(
+                [field in ohlcv_fields for field in cm_data_req["fields"]]
         ):
             df1 = self.get_ohlcv(data_req)
             df = pd.concat([df, df1])
 
         # get on-chain data
-        if any([ticker in self.assets for ticker in cm_data_req["tickers"]]) and any(
-                [field in oc_list for field in cm_data_req["fields"]]
+        if any([ticker in assets for ticker in cm_data_req["tickers"]]) and any(
+                [field in oc_fields for field in cm_data_req["fields"]]
         ):
             df2 = self.get_onchain(data_req)
             df = pd.concat([df, df2], axis=1)
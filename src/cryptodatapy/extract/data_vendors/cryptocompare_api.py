@@ -1,9 +1,12 @@
 import logging
-from time import sleep
-from typing import Dict, Optional, Union, Any
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import pandas as pd
 
+from cryptodatapy.extract.accumulator import Accumulator
 from cryptodatapy.extract.data_vendors.datavendor import DataVendor
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.transform.convertparams import ConvertParams
@@ -20,12 +23,31 @@ urls = {'exchanges_info': 'exchanges/general', 'indexes_info': 'index/list', 'as
         'news': 'v2/news/?lang=EN', 'news_sources': 'news/feeds', 'rate_limit_info': 'rate/limit',
         'top_mkt_cap_info': 'top/mktcapfull?', 'indexes': 'index/'}
 
+# length of one observation in seconds, by frequency
+freq_secs = {'histominute': 60, 'histohour': 3600, 'histoday': 86400}
+
 
 class CryptoCompare(DataVendor):
     """
     Retrieves data from CryptoCompare API.
     """
 
+    # free tier rate limit, replaced by live rate limit info when available
+    default_rate_limit = {'calls': 20, 'period': 1}
+
+    # metadata loaded on first access, rate limit is always requested live
+    metadata_loaders = {
+        'exchanges': ('get_exchanges_info', {'as_list': True}, True),
+        'indexes': ('get_indexes_info', {'as_list': True}, True),
+        'assets': ('get_assets_info', {'as_list': True}, True),
+        'markets': ('get_markets_info', {'as_list': True}, True),
+        'fields': ('get_fields_info', {'data_type': None}, True),
+        'rate_limit': ('get_rate_limit_info', {}, False),
+    }
+
+    # maximum number of tickers fetched concurrently
+    max_workers = 8
+
     def __init__(
             self,
             categories=None,
@@ -87,18 +109,6 @@ class CryptoCompare(DataVendor):
             raise TypeError("Set your CryptoCompare api key in environment variables as 'CRYPTOCOMPARE_API_KEY' or "
                             "add it as an argument when instantiating the class. To get an api key, visit: "
                             "https://min-api.cryptocompare.com/")
-        if exchanges is None:
-            self.exchanges = self.get_exchanges_info(as_list=True)
-        if indexes is None:
-            self.indexes = self.get_indexes_info(as_list=True)
-        if assets is None:
-            self.assets = self.get_assets_info(as_list=True)
-        if markets is None:
-            self.markets = self.get_markets_info(as_list=True)
-        if fields is None:
-            self.fields = self.get_fields_info(data_type=None)
-        if rate_limit is None:
-            self.rate_limit = self.get_rate_limit_info()
 
     def req_meta(self, info_type: str) -> Dict[str, Any]:
         """
@@ -116,7 +126,8 @@ class CryptoCompare(DataVendor):
         meta: dictionary
             Metadata in JSON format.
         """
-        return DataRequest().get_req(url=self.base_url + urls[info_type], params={'api_key': self.api_key})
+        return DataRequest().get_req(url=self.base_url + urls[info_type], params={'api_key': self.api_key},
+                                     rate_limiter=self.rate_limiter)
 
     def get_exchanges_info(self, as_list: bool = False) -> Union[list[str], pd.DataFrame]:
         """
@@ -227,7 +238,8 @@ class CryptoCompare(DataVendor):
         """
         Get request for on-chain info.
         """
-        return DataRequest().get_req(url=self.base_url + urls['on-chain_info'], params={'api_key': self.api_key})
+        return DataRequest().get_req(url=self.base_url + urls['on-chain_info'], params={'api_key': self.api_key},
+                                     rate_limiter=self.rate_limiter)
 
     def get_onchain_info(self) -> list[str]:
         """
@@ -294,7 +306,8 @@ class CryptoCompare(DataVendor):
         Get request for rate limit info.
         """
         return DataRequest().get_req(url=self.base_url.replace('data', 'stats') + urls['rate_limit_info'],
-                                     params={'api_key': self.api_key})
+                                     params={'api_key': self.api_key},
+                                     rate_limiter=self.rate_limiter)
 
     def get_rate_limit_info(self) -> pd.DataFrame:
         """
@@ -353,7 +366,8 @@ class CryptoCompare(DataVendor):
                                          'limit': n,
                                          'tsym': 'USD',
                                          'api_key': self.api_key
-                                     })
+                                     },
+                                     rate_limiter=self.rate_limiter)
 
     def get_top_mkt_cap_info(self, n: int = 100) -> list[str]:
         """
@@ -401,6 +415,7 @@ class CryptoCompare(DataVendor):
         """
         # convert data req params
         cc_data_req = ConvertParams(data_req).to_cryptocompare()
+        limit = self.get_limit(cc_data_req, data_type)
 
         # set params
         if data_type == 'indexes':
@@ -408,7 +423,7 @@ class CryptoCompare(DataVendor):
             params = {
                 'indexName': ticker,
                 'toTs': cc_data_req['end_date'],
-                'limit': self.max_obs_per_call,
+                'limit': limit,
                 'api_key': self.api_key
             }
         elif data_type == 'ohlcv':
@@ -416,7 +431,7 @@ class CryptoCompare(DataVendor):
             params = {
                 'fsym': ticker,
                 'tsym': cc_data_req['quote_ccy'],
-                'limit': self.max_obs_per_call,
+                'limit': limit,
                 'e': cc_data_req['exch'],
                 'toTs': cc_data_req['end_date'],
                 'api_key': self.api_key
@@ -426,7 +441,7 @@ class CryptoCompare(DataVendor):
             url = self.base_url + f"blockchain/histo/day?"
             params = {
                 'fsym': ticker,
-                'limit': self.max_obs_per_call,
+                'limit': limit,
                 'toTs': cc_data_req['end_date'],
                 'api_key': self.api_key
             }
@@ -435,7 +450,7 @@ class CryptoCompare(DataVendor):
             url = self.base_url + "social/coin/" + cc_data_req['freq'][:5] + '/' + cc_data_req['freq'][5:]
             params = {
                 'coinId': int(self.get_assets_info().loc[ticker.upper(), 'Id']),
-                'limit': self.max_obs_per_call,
+                'limit': limit,
                 'toTs': cc_data_req['end_date'],
                 'api_key': self.api_key
             }
@@ -446,6 +461,29 @@ class CryptoCompare(DataVendor):
 
         return {'url': url, 'params': params}
 
+    def get_limit(self, cc_data_req: Dict[str, Any], data_type: str) -> int:
+        """
+        Gets the number of observations to request per call, so short date ranges, e.g. incremental updates, are
+        fetched with a single small call.
+
+        Parameters
+        ----------
+        cc_data_req: dict
+            Parameters of data request in CryptoCompare format.
+        data_type: str, {'indexes', 'ohlcv', 'on-chain', 'social'}
+            Data type to retrieve.
+
+        Returns
+        -------
+        limit: int
+            Number of observations per call, at most the maximum number of observations per call.
+        """
+        # on-chain data is daily
+        freq = 'histoday' if data_type == 'on-chain' else cc_data_req['freq']
+        n_obs = math.ceil((int(cc_data_req['end_date']) - int(cc_data_req['start_date'])) / freq_secs.get(freq, 86400)) + 1
+
+        return max(1, min(self.max_obs_per_call, n_obs))
+
     def req_data(self, data_req: DataRequest, data_type: str, ticker: str) -> Dict[str, Any]:
         """
         Submits get request to CryptoCompare API.
@@ -469,11 +507,112 @@ class CryptoCompare(DataVendor):
         url, params = urls_params['url'], urls_params['params']
 
         # data req
-        data_resp = DataRequest().get_req(url=url, params=params)
+        data_resp = DataRequest().get_req(url=url, params=params, rate_limiter=self.rate_limiter)
 
         return data_resp
 
-    def get_all_data_hist(self, data_req: DataRequest, data_type: str, ticker: str) -> pd.DataFrame:
+    def get_windows(self, data_req: DataRequest, data_type: str) -> List[int]:
+        """
+        Plans the end timestamps (toTs) of the pages needed to cover the requested date range, from the frequency,
+        start date, end date and maximum number of observations per call.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        data_type: str, {'indexes', 'ohlcv', 'on-chain', 'social'}
+            Data type to retrieve.
+
+        Returns
+        -------
+        windows: list
+            List of page end timestamps, in seconds since epoch, from most recent to oldest.
+        """
+        # convert data req params
+        cc_data_req = ConvertParams(data_req).to_cryptocompare()
+
+        # page length in seconds, on-chain data is daily
+        freq = 'histoday' if data_type == 'on-chain' else cc_data_req['freq']
+        window = self.max_obs_per_call * freq_secs[freq]
+
+        # windows
+        start_date, end_date = int(cc_data_req['start_date']), int(cc_data_req['end_date'])
+        n_windows = max(1, math.ceil((end_date - start_date) / window))
+
+        return [end_date - i * window for i in range(n_windows)]
+
+    def get_page(self, url: str, params: Dict[str, Union[str, int]], data_type: str) -> pd.DataFrame:
+        """
+        Submits get request for a single page of data.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url for get request.
+        params: dict
+            Dictionary containing parameter values for get request.
+        data_type: str, {'indexes', 'ohlcv', 'on-chain', 'social'}
+            Data type to retrieve.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with page of data, empty if request failed.
+        """
+        # data req
+        data_resp = DataRequest().get_req(url=url, params=params, rate_limiter=self.rate_limiter)
+
+        if not data_resp:
+            return pd.DataFrame()
+        elif data_type == 'indexes' or data_type == 'social':
+            return pd.DataFrame(data_resp['Data'])
+        else:
+            return pd.DataFrame(data_resp['Data']['Data'])
+
+    def get_all_data_hist_windows(self, data_req: DataRequest, data_type: str, ticker: str) -> pd.DataFrame:
+        """
+        Retrieves entire data history by fetching precomputed page windows concurrently, then stitching and
+        deduplicating the pages.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        data_type: str, {'indexes', 'ohlcv', 'on-chain', 'social'}
+            Data type to retrieve.
+        ticker: str
+            Ticker symbol.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with entire data history retrieved.
+        """
+        # set params
+        urls_params = self.set_urls_params(data_req, data_type, ticker)
+        url, params = urls_params['url'], urls_params['params']
+
+        # page windows
+        windows = self.get_windows(data_req, data_type)
+
+        # fetch pages concurrently, keeping the caller's scheduler priority
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(windows)))) as executor:
+            futures = [executor.submit(copy_context().run, self.get_page, url, {**params, 'toTs': to_ts}, data_type)
+                       for to_ts in windows]
+            pages = [future.result() for future in futures]
+
+        # stitch pages
+        acc = Accumulator()
+        for page in pages:
+            acc.add(page)
+        if acc.empty:
+            return pd.DataFrame()
+        df = acc.to_frame().drop_duplicates(subset='time').sort_values('time').reset_index(drop=True)
+
+        return df
+
+    def get_all_data_hist(self, data_req: DataRequest, data_type: str, ticker: str,
+                          parallel: Optional[bool] = None) -> pd.DataFrame:
         """
         Submits get requests to API until entire data history has been collected. Only necessary when
         number of observations is larger than the maximum number of observations per call.
@@ -486,6 +625,9 @@ class CryptoCompare(DataVendor):
             Data type to retrieve.
         ticker: str
             Ticker symbol.
+        parallel: bool, optional, default None
+            Fetches precomputed page windows concurrently instead of walking back one page at a time. If None,
+            windows are fetched concurrently for minute frequency data only, where the date range is bounded.
 
         Returns
         -------
@@ -496,12 +638,18 @@ class CryptoCompare(DataVendor):
         # convert data req params
         cc_data_req = ConvertParams(data_req).to_cryptocompare()
 
+        # parallel windows
+        if parallel is None:
+            parallel = cc_data_req['freq'] == 'histominute'
+        if parallel:
+            return self.get_all_data_hist_windows(data_req, data_type, ticker)
+
         # set params
         urls_params = self.set_urls_params(data_req, data_type, ticker)
         url, params = urls_params['url'], urls_params['params']
 
-        # create empty df
-        df = pd.DataFrame()
+        # accumulate pages
+        pages = Accumulator()
         # while loop condition
         missing_vals = True
 
@@ -509,7 +657,7 @@ class CryptoCompare(DataVendor):
         while missing_vals:
 
             # data req
-            data_resp = DataRequest().get_req(url=url, params=params)
+            data_resp = DataRequest().get_req(url=url, params=params, rate_limiter=self.rate_limiter)
 
             # add data resp to df
             if data_resp:
@@ -517,20 +665,19 @@ class CryptoCompare(DataVendor):
                     df1 = pd.DataFrame(data_resp['Data'])
                 else:
                     df1 = pd.DataFrame(data_resp['Data']['Data'])
-                df = pd.concat([df, df1])  # add data to empty df
+                pages.add(df1)  # add page
 
                 # check if all data has been extracted
                 if len(df1) < (self.max_obs_per_call - 1) or df1.time[0] <= cc_data_req['start_date'] or \
                         all(df1.drop(columns=['time']).iloc[0] == 0) or \
                         all(df1.drop(columns=['time']).iloc[0].astype(str) == 'nan'):
                     missing_vals = False
-                # reset end date and pause before calling API again
+                # reset end date before calling API again, rate limiter paces requests
                 else:
                     # change end date
                     params['toTs'] = df1.time[0]
-                    sleep(0.1)
 
-        return df
+        return pages.to_frame()
 
     @staticmethod
     def wrangle_data_resp(data_req: DataRequest, data_resp: pd.DataFrame) -> pd.DataFrame:
@@ -577,10 +724,11 @@ class CryptoCompare(DataVendor):
 
         return df
 
-    def get_all_tickers(self, data_req: DataRequest, data_type: str) -> pd.DataFrame:
+    def iter_tickers(self, data_req: DataRequest, data_type: str, max_workers: Optional[int] = None) \
+            -> Iterator[pd.DataFrame]:
         """
-        Loops list of tickers, retrieves data in tidy format for each ticker and stores it in a
-        multiindex dataframe.
+        Retrieves data in tidy format for each ticker concurrently, with a bounded pool of worker threads sharing
+        the vendor rate limiter, and yields each ticker's data as soon as it is retrieved.
 
         Parameters
         ----------
@@ -588,33 +736,76 @@ class CryptoCompare(DataVendor):
             Parameters of data request in CryptoDataPy format.
         data_type: str, {'indexes', 'ohlcv', 'on-chain', 'social'}
             Data type to retrieve.
+        max_workers: int, optional, default None
+            Maximum number of tickers fetched concurrently. If None, max_workers attribute is used.
 
-        Returns
-        -------
+        Yields
+        ------
         df: pd.DataFrame - MultiIndex
-            Dataframe with DatetimeIndex (level 0), ticker (level 1) and values for fields (cols), in tidy data format.
+            Dataframe with DatetimeIndex (level 0), ticker (level 1) and values for fields (cols) of a ticker, in
+            tidy data format, in order of completion.
         """
         # convert data request parameters to CryptoCompare format
         cc_data_req = ConvertParams(data_req).to_cryptocompare()
+        tickers = cc_data_req['tickers']
+
+        # number of workers
+        if max_workers is None:
+            max_workers = self.max_workers
+        max_workers = max(1, min(max_workers, len(tickers)))
+
+        # submit tickers to worker pool, keeping the caller's scheduler priority
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(copy_context().run, self.get_tidy_data, data_req, data_type, ticker): ticker
+                       for ticker in tickers}
+
+            # yield results as they complete
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    df0 = future.result()
+                except Exception:
+                    logging.info(f"Failed to get {data_type} data for {ticker} after many attempts.")
+                else:
+                    # add ticker to index
+                    df0['ticker'] = ticker
+                    df0.set_index(['ticker'], append=True, inplace=True)
+                    yield df0
 
-        # empty df to add data
-        df = pd.DataFrame()
+    def get_all_tickers(self, data_req: DataRequest, data_type: str, max_workers: Optional[int] = None) \
+            -> pd.DataFrame:
+        """
+        Retrieves data in tidy format for each ticker concurrently, with a bounded pool of worker threads sharing
+        the vendor rate limiter, and stores it in a multiindex dataframe.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        data_type: str, {'indexes', 'ohlcv', 'on-chain', 'social'}
+            Data type to retrieve.
+        max_workers: int, optional, default None
+            Maximum number of tickers fetched concurrently. If None, max_workers attribute is used.
 
-        # loop through tickers
-        for ticker in cc_data_req['tickers']:
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            Dataframe with DatetimeIndex (level 0), ticker (level 1) and values for fields (cols), in tidy data format,
+            with tickers in requested order.
+        """
+        # ticker dfs in order of completion
+        ticker_dfs = {}
+        for df0 in self.iter_tickers(data_req, data_type, max_workers=max_workers):
+            if not df0.empty:
+                ticker_dfs[df0.index.get_level_values('ticker')[0]] = df0
 
-            try:
-                df0 = self.get_tidy_data(data_req, data_type, ticker)
-            except Exception:
-                logging.info(f"Failed to get {data_type} data for {ticker} after many attempts.")
-            else:
-                # add ticker to index
-                df0['ticker'] = ticker
-                df0.set_index(['ticker'], append=True, inplace=True)
-                # concat df and df1
-                df = pd.concat([df, df0])
+        # concat in requested order
+        dfs = Accumulator()
+        for ticker in ConvertParams(data_req).to_cryptocompare()['tickers']:
+            if ticker in ticker_dfs:
+                dfs.add(ticker_dfs[ticker])
 
-        return df
+        return dfs.to_frame()
 
     def get_indexes(self, data_req: DataRequest) -> pd.DataFrame:
         """
@@ -778,6 +969,66 @@ class CryptoCompare(DataVendor):
             raise ValueError("Some fields are not available. "
                              "Check fields attribute to see all available fields.")
 
+    def get_data_types(self, data_req: DataRequest) -> List[str]:
+        """
+        Gets the data types needed for the tickers and fields of the data request.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+
+        Returns
+        -------
+        data_types: list
+            List of data types, e.g. ['ohlcv', 'on-chain'].
+        """
+        # convert data request parameters to CryptoCompare format
+        cc_data_req = ConvertParams(data_req).to_cryptocompare()
+        tickers, fields = cc_data_req['tickers'], cc_data_req['fields']
+
+        # tickers and fields lists of each data type
+        market_fields = self.get_fields_info(data_type='market')
+        data_types = {
+            'indexes': (self.indexes, market_fields),
+            'ohlcv': (self.assets, market_fields),
+            'on-chain': (self.assets, self.get_fields_info(data_type='on-chain')),
+            'social': (self.assets, self.get_fields_info(data_type='off-chain')),
+        }
+        # on-chain data is daily, social media data daily or hourly
+        if cc_data_req['freq'] != 'histoday':
+            del data_types['on-chain']
+        if cc_data_req['freq'] == 'histominute':
+            del data_types['social']
+
+        return [
+            data_type for data_type, (tickers_list, fields_list) in data_types.items()
+            if any([ticker in tickers_list for ticker in tickers]) and any([field in fields_list for field in fields])
+        ]
+
+    def iter_data(self, data_req: DataRequest) -> Iterator[pd.DataFrame]:
+        """
+        Yields market, on-chain or social media data for each data type and ticker, as soon as it is retrieved.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+
+        Yields
+        ------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and values for the OHLCV, on-chain or social
+            fields (cols) of a ticker, in tidy format.
+        """
+        # check data req params
+        self.check_params(data_req)
+
+        for data_type in self.get_data_types(data_req):
+            for df in self.iter_tickers(data_req, data_type):
+                # filter df for desired fields
+                yield df.loc[:, [field for field in data_req.fields if field in df.columns]].sort_index()
+
     def get_data(self, data_req: DataRequest) -> pd.DataFrame:
         """
         Get either market, on-chain or social media data.
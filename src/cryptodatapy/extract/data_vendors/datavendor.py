@@ -1,9 +1,12 @@
+import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 
 from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.extract.ratelimiter import RateLimiter, convert_rate_limit, get_rate_limiter, rate_limiters
+from cryptodatapy.util.diskcache import disk_cache
 
 
 class DataVendor(ABC):
@@ -12,12 +15,18 @@ class DataVendor(ABC):
     data vendor subclass.
     """
 
+    # rate limit used when the rate_limit attribute does not specify one, in calls per period (seconds)
+    default_rate_limit: Dict[str, float] = {'calls': 1, 'period': 1}
+
+    # metadata attributes loaded lazily on first access, as attr: (method, kwargs, disk cache) items
+    metadata_loaders: Dict[str, Tuple[str, Dict[str, Any], bool]] = {}
+
     def __init__(
         self,
         categories,
         exchanges,
-        assets,
         indexes,
+        assets,
         markets,
         market_types,
         fields,
@@ -29,8 +38,8 @@ class DataVendor(ABC):
     ):
         self.categories = categories
         self.exchanges = exchanges
-        self.assets = assets
         self.indexes = indexes
+        self.assets = assets
         self.markets = markets
         self.market_types = market_types
         self.fields = fields
@@ -86,8 +95,10 @@ class DataVendor(ABC):
     @property
     def exchanges(self):
         """
-        Returns a list of available exchanges for the data vendor.
+        Returns a list of available exchanges for the data vendor, loaded on first access.
         """
+        if self._exchanges is None and 'exchanges' in self.metadata_loaders:
+            self.exchanges = self.load_metadata('exchanges')
         return self._exchanges
 
     @exchanges.setter
@@ -122,8 +133,10 @@ class DataVendor(ABC):
     @property
     def indexes(self):
         """
-        Returns a list of available indices for the data vendor.
+        Returns a list of available indices for the data vendor, loaded on first access.
         """
+        if self._indexes is None and 'indexes' in self.metadata_loaders:
+            self.indexes = self.load_metadata('indexes')
         return self._indexes
 
     @indexes.setter
@@ -156,8 +169,10 @@ class DataVendor(ABC):
     @property
     def assets(self):
         """
-        Returns a list of available assets for the data vendor.
+        Returns a list of available assets for the data vendor, loaded on first access.
         """
+        if self._assets is None and 'assets' in self.metadata_loaders:
+            self.assets = self.load_metadata('assets')
         return self._assets
 
     @assets.setter
@@ -190,8 +205,10 @@ class DataVendor(ABC):
     @property
     def markets(self):
         """
-        Returns a list of available markets for the data vendor.
+        Returns a list of available markets for the data vendor, loaded on first access.
         """
+        if self._markets is None and 'markets' in self.metadata_loaders:
+            self.markets = self.load_metadata('markets')
         return self._markets
 
     @markets.setter
@@ -262,8 +279,10 @@ class DataVendor(ABC):
     @property
     def fields(self):
         """
-        Returns a list of available fields for the data vendor.
+        Returns a list of available fields for the data vendor, loaded on first access.
         """
+        if self._fields is None and 'fields' in self.metadata_loaders:
+            self.fields = self.load_metadata('fields')
         return self._fields
 
     @fields.setter
@@ -383,8 +402,10 @@ class DataVendor(ABC):
     @property
     def rate_limit(self):
         """
-        Returns the number of API calls made and remaining.
+        Returns the number of API calls made and remaining, loaded on first access.
         """
+        if self._rate_limit is None and 'rate_limit' in self.metadata_loaders:
+            self.rate_limit = self.load_metadata('rate_limit')
         return self._rate_limit
 
     @rate_limit.setter
@@ -394,6 +415,32 @@ class DataVendor(ABC):
         """
         self._rate_limit = limit
 
+        # update shared rate limiter
+        params = convert_rate_limit(limit)
+        if params is not None:
+            self.rate_limiter.set_rate(**params)
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """
+        Returns the token bucket rate limiter shared by all instances of the data vendor with the same api key.
+
+        Rate and burst size are set from the rate_limit attribute (calls per second, dict with calls and period
+        or dataframe with calls made and left by period), falling back on default_rate_limit. Data vendors with
+        live rate limit info, e.g. CryptoCompare calls left by period, load it to seed the rate limiter when it is
+        created.
+        """
+        source, key = self.__class__.__name__.lower(), getattr(self, '_api_key', None)
+        created = (source, key) not in rate_limiters
+        params = convert_rate_limit(getattr(self, '_rate_limit', None)) or convert_rate_limit(self.default_rate_limit)
+        rate_limiter = get_rate_limiter(source, key, **params)
+
+        # seed new rate limiter with live quota, requested under the default rate limit
+        if created and getattr(self, '_rate_limit', None) is None and 'rate_limit' in self.metadata_loaders:
+            self.rate_limit = self.load_metadata('rate_limit')
+
+        return rate_limiter
+
     @abstractmethod
     def get_rate_limit_info(self):
         """
@@ -401,12 +448,86 @@ class DataVendor(ABC):
         """
         # to be implemented by subclasses
 
+    def load_metadata(self, attr: str, refresh: bool = False) -> Any:
+        """
+        Loads a metadata attribute from the disk cache or, if missing or expired, from the data vendor.
+
+        Parameters
+        ----------
+        attr: str, {'exchanges', 'indexes', 'assets', 'markets', 'fields', 'rate_limit'}
+            Metadata attribute to load.
+        refresh: bool, default False
+            Bypasses the disk cache and requests metadata from the data vendor.
+
+        Returns
+        -------
+        meta: Any
+            Metadata for attribute, or None if it could not be loaded.
+        """
+        method, kwargs, cache = self.metadata_loaders[attr]
+        key = f"{self.__class__.__name__.lower()}_{attr}"
+
+        # disk cache
+        if cache and not refresh:
+            meta = disk_cache.get(key)
+            if meta is not None:
+                return meta
+
+        # data vendor
+        try:
+            meta = getattr(self, method)(**kwargs)
+        except Exception as e:
+            logging.warning(f"Failed to load {attr} metadata: {e}")
+            return None
+
+        if cache and meta is not None:
+            disk_cache.set(key, meta)
+
+        return meta
+
+    def refresh_metadata(self, attrs: Optional[Union[str, List[str]]] = None) -> None:
+        """
+        Reloads metadata attributes from the data vendor and updates the disk cache.
+
+        Parameters
+        ----------
+        attrs: str or list, optional, default None
+            Metadata attributes to refresh, e.g. ['assets', 'fields']. If None, all lazily loaded attributes
+            are refreshed.
+        """
+        if attrs is None:
+            attrs = list(self.metadata_loaders)
+        elif isinstance(attrs, str):
+            attrs = [attrs]
+
+        for attr in attrs:
+            setattr(self, attr, self.load_metadata(attr, refresh=True))
+
     @abstractmethod
     def get_data(self, data_req: DataRequest) -> pd.DataFrame:
         """
         Submits get data request to API.
         """
         # to be implemented by subclasses
+
+    def iter_data(self, data_req: DataRequest) -> Iterator[pd.DataFrame]:
+        """
+        Yields data in tidy format as it is retrieved, e.g. one dataframe per ticker.
+
+        Data sources which don't stream yield the entire data request as a single dataframe.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+
+        Yields
+        ------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1) and values for fields (cols), in tidy format.
+        """
+        yield self.get_data(data_req)
+
     @staticmethod
     @abstractmethod
     def wrangle_data_resp(data_req: DataRequest, data_resp: Union[Dict[str, Any], pd.DataFrame], **kwargs) \
@@ -1,7 +1,10 @@
-from typing import Optional, Any, Union, Dict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Optional, Any, Union, Dict, Iterator
 
 import pandas as pd
 
+from cryptodatapy.extract.accumulator import Accumulator
 from cryptodatapy.extract.data_vendors.datavendor import DataVendor
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.transform.convertparams import ConvertParams
@@ -21,6 +24,18 @@ class Glassnode(DataVendor):
     Retrieves data from Glassnode API.
     """
 
+    # rate limit of standard api plans, in calls per minute
+    default_rate_limit = {'calls': 600, 'period': 60, 'capacity': 10}
+
+    # maximum number of tickers, and fields per ticker, requested concurrently
+    max_workers = 8
+
+    # metadata loaded on first access
+    metadata_loaders = {
+        'assets': ('get_assets_info', {'as_list': True}, True),
+        'fields': ('get_fields_info', {'data_type': None, 'as_list': True}, True),
+    }
+
     def __init__(
             self,
             categories=None,
@@ -82,10 +97,6 @@ class Glassnode(DataVendor):
             raise TypeError("Set your Glassnode api key in environment variables as 'GLASSNODE_API_KEY' or "
                             "add it as an argument when instantiating the class. To get an api key, visit: "
                             "https://docs.glassnode.com/basic-api/api-key")
-        if assets is None:
-            self.assets = self.get_assets_info(as_list=True)
-        if fields is None:
-            self.fields = self.get_fields_info(data_type=None, as_list=True)
 
     def get_exchanges_info(self) -> None:
         """
@@ -108,7 +119,8 @@ class Glassnode(DataVendor):
         dict: dictionary
             Data response with asset info in json format.
         """
-        return DataRequest().get_req(url=self.base_url + urls['assets_info'], params={'api_key': self.api_key})
+        return DataRequest().get_req(url=self.base_url + urls['assets_info'], params={'api_key': self.api_key},
+                                     rate_limiter=self.rate_limiter)
 
     def get_assets_info(self, as_list: bool = False) -> Union[list[str], pd.DataFrame]:
         """
@@ -147,7 +159,8 @@ class Glassnode(DataVendor):
             Data response with fields info in json format.
         """
         return DataRequest().get_req(url=self.base_url.replace('v1', 'v2') + urls['fields_info'],
-                                     params={'api_key': self.api_key})
+                                     params={'api_key': self.api_key},
+                                     rate_limiter=self.rate_limiter)
 
     def get_fields_info(self, data_type: Optional[str] = None, as_list: bool = False) -> Union[list[str], pd.DataFrame]:
         """
@@ -210,7 +223,7 @@ class Glassnode(DataVendor):
             'c': gn_data_req['quote_ccy']
         }
         # data req
-        data_resp = DataRequest().get_req(url=url, params=params)
+        data_resp = DataRequest().get_req(url=url, params=params, rate_limiter=self.rate_limiter)
 
         return data_resp
 
@@ -268,7 +281,9 @@ class Glassnode(DataVendor):
 
     def get_all_fields(self, data_req: DataRequest, ticker: str) -> pd.DataFrame:
         """
-        Loops list of tickers, retrieves data in tidy format for each ticker and stores it in a dataframe.
+        Retrieves data in tidy format for each field of a ticker, concurrently, and stores it in a dataframe.
+
+        Requests are dispatched under the Glassnode rate limit by the shared scheduler.
 
         Parameters
         ----------
@@ -285,25 +300,27 @@ class Glassnode(DataVendor):
         # convert data request parameters to CryptoCompare format
         gn_data_req = ConvertParams(data_req).to_glassnode()
 
-        df = pd.DataFrame()  # empty fields df
+        fields = []  # fields to request
         counter = 0  # ohlc counter to avoid requesting OHLC data multiples times
 
         for field in gn_data_req['fields']:  # loop through fields
-
-            df0 = None
-
-            # get tidy data
             if field == 'market/price_usd_ohlc' and counter == 0:
-                df0 = self.get_tidy_data(data_req, ticker, field)
+                fields.append(field)
                 counter += 1
             elif field != 'market/price_usd_ohlc':
-                df0 = self.get_tidy_data(data_req, ticker, field)
+                fields.append(field)
 
-            # add field to fields df
-            if df0 is not None:
-                df = pd.concat([df, df0], axis=1)
+        # fetch fields concurrently, keeping the caller's scheduler priority
+        dfs = Accumulator()  # fields dfs
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(fields)))) as executor:
+            futures = [executor.submit(copy_context().run, self.get_tidy_data, data_req, ticker, field)
+                       for field in fields]
 
-        return df
+            # add fields to fields dfs, in requested order
+            for future in futures:
+                dfs.add(future.result())
+
+        return dfs.to_frame(axis=1)
 
     def check_params(self, data_req: DataRequest) -> None:
         """
@@ -334,20 +351,23 @@ class Glassnode(DataVendor):
 
         return None
 
-    def get_data(self, data_req: DataRequest) -> pd.DataFrame:
+    def iter_data(self, data_req: DataRequest) -> Iterator[pd.DataFrame]:
         """
-        Get market, on-chain or off-chain data.
+        Yields market, on-chain or off-chain data for each ticker, as soon as it is retrieved.
+
+        Tickers are requested concurrently, and so are their fields, so the whole ticker x field grid is fetched
+        under the Glassnode rate limit. Tickers are yielded in requested order.
 
         Parameters
         ----------
         data_req: DataRequest
             Data request parameters in CryptoDataPy format.
 
-        Returns
-        -------
+        Yields
+        ------
         df: pd.DataFrame - MultiIndex
             DataFrame with DatetimeIndex (level 0), ticker (level 1), and values for market, on-chain and/or
-            off-chain fields (cols), in tidy data format.
+            off-chain fields (cols) of a ticker, in tidy data format.
         """
         # convert data request parameters to CryptoCompare format
         gn_data_req = ConvertParams(data_req).to_glassnode()
@@ -355,19 +375,53 @@ class Glassnode(DataVendor):
         # check params
         self.check_params(data_req)
 
-        # empty df to add data
-        df = pd.DataFrame()
+        # submit tickers to worker pool, keeping the caller's scheduler priority
+        tickers = gn_data_req['tickers']
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(tickers)))) as executor:
+            futures = [executor.submit(copy_context().run, self.get_all_fields, data_req, ticker)
+                       for ticker in tickers]
+
+            try:
+                for ticker, future in zip(tickers, futures):  # loop tickers
+
+                    # get all fields for ticker
+                    df = future.result()
+                    if df.empty:
+                        continue
+                    # add ticker to index
+                    df['ticker'] = ticker.upper()
+                    df.set_index(['ticker'], append=True, inplace=True)
+
+                    # filter df for desired fields
+                    yield df.loc[:, [field for field in data_req.fields if field in df.columns]].sort_index()
 
-        # loop through tickers and fields
-        for ticker in gn_data_req['tickers']:  # loop tickers
+            # cancel pending tickers if the generator is closed early
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def get_data(self, data_req: DataRequest) -> pd.DataFrame:
+        """
+        Get market, on-chain or off-chain data.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Data request parameters in CryptoDataPy format.
+
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and values for market, on-chain and/or
+            off-chain fields (cols), in tidy data format.
+        """
+        # accumulate ticker dfs
+        dfs = Accumulator()
+        for df0 in self.iter_data(data_req):
+            dfs.add(df0)
 
-            # get all fields for ticker
-            df0 = self.get_all_fields(data_req, ticker)
-            # add ticker to index
-            df0['ticker'] = ticker.upper()
-            df0.set_index(['ticker'], append=True, inplace=True)
-            # stack ticker dfs
-            df = pd.concat([df, df0])
+        # concat ticker dfs
+        df = dfs.to_frame()
 
         # filter df for desired fields and typecast
         fields = [field for field in data_req.fields if field in df.columns]
@@ -1,8 +1,9 @@
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 
+from cryptodatapy.extract.accumulator import Accumulator
 from cryptodatapy.extract.data_vendors.datavendor import DataVendor
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.transform.convertparams import ConvertParams
@@ -18,6 +19,23 @@ class Tiingo(DataVendor):
     Retrieves data from Tiingo API.
     """
 
+    # rate limit of power plan, in calls per hour
+    default_rate_limit = {'calls': 10000, 'period': 3600, 'capacity': 10}
+
+    # data types whose endpoints accept comma-separated ticker lists
+    batch_data_types = ['crypto', 'fx']
+
+    # limits of multi-ticker requests: tickers per request, characters in tickers param and observations per response
+    max_batch_tickers = 100
+    max_batch_chars = 1500
+    max_batch_obs = 100000
+
+    # metadata loaded on first access
+    metadata_loaders = {
+        'exchanges': ('get_exchanges_info', {}, True),
+        'assets': ('get_assets_info', {'as_list': True}, True),
+    }
+
     def __init__(
             self,
             categories=None,
@@ -112,10 +130,6 @@ class Tiingo(DataVendor):
             raise TypeError("Set your Tiingo api key in environment variables as 'TIINGO_API_KEY' or "
                             "add it as an argument when instantiating the class. To get an api key, visit: "
                             "https://www.tiingo.com/")
-        if exchanges is None:
-            self.exchanges = self.get_exchanges_info()
-        if assets is None:
-            self.assets = self.get_assets_info(as_list=True)
         if fields is None:
             self.fields = self.get_fields_info()
 
@@ -248,7 +262,8 @@ class Tiingo(DataVendor):
                                      headers={
                                          "Content-Type": "application/json",
                                          "Authorization": f"Token {self.api_key}",
-                                     })
+                                     },
+                                     rate_limiter=self.rate_limiter)
 
     def get_crypto_info(self, as_list: bool = False) -> Union[List[str], pd.DataFrame]:
         """
@@ -466,7 +481,7 @@ class Tiingo(DataVendor):
         data_type: str, {'eqty', 'iex', 'crypto', 'fx'}
             Data type to retrieve.
         ticker: str
-            Ticker symbol.
+            Ticker symbol, or comma-separated ticker symbols for data types which accept ticker lists.
 
         Returns
         -------
@@ -478,7 +493,8 @@ class Tiingo(DataVendor):
         url, params, headers = urls_params['url'], urls_params['params'], urls_params['headers']
 
         # data req
-        data_resp = DataRequest().get_req(url=url, params=params, headers=headers)
+        data_resp = DataRequest().get_req(url=url, params=params, headers=headers,
+                                          rate_limiter=self.rate_limiter)
 
         return data_resp
 
@@ -531,73 +547,193 @@ class Tiingo(DataVendor):
 
         return df
 
-    def get_all_tickers(self, data_req: DataRequest, data_type: str) -> pd.DataFrame:
+    def get_batches(self, data_req: DataRequest, tickers: List[str]) -> List[List[str]]:
         """
-        Loops list of tickers, retrieves data in tidy format for each ticker and stores it in a
-        multiindex dataframe.
+        Groups tickers into batches for multi-ticker requests, sized to the url length and response size limits.
 
         Parameters
         ----------
         data_req: DataRequest
             Parameters of data request in CryptoDataPy format.
-        data_type: str, {'eqty', 'iex', 'crypto', 'fx'}
-            Data type to retrieve.
+        tickers: list
+            Ticker symbols in Tiingo format, e.g. ['btcusd', 'ethusd'].
 
         Returns
         -------
-        df: pd.DataFrame - MultiIndex
-            Dataframe with DatetimeIndex (level 0), ticker (level 1) and values for fields (cols), in tidy data format.
+        batches: list
+            List of ticker lists, one per request.
         """
-        # convert data request parameters to CryptoCompare format
+        # convert data req params
         tg_data_req = ConvertParams(data_req).to_tiingo()
 
-        # empty df to add data
-        df = pd.DataFrame()
+        # estimate number of observations per ticker
+        start_date = pd.Timestamp(tg_data_req['start_date'] or '2010-01-01')
+        end_date = pd.Timestamp(tg_data_req['end_date'])
+        start_date, end_date = [date.tz_convert(None) if date.tz is not None else date
+                                for date in [start_date, end_date]]
+        try:
+            obs = max(int((end_date - start_date) / pd.Timedelta(tg_data_req['freq'])) + 1, 1)
+        except ValueError:
+            obs = self.max_batch_obs
+        batch_size = max(1, min(self.max_batch_tickers, self.max_batch_obs // obs))
+
+        # group tickers
+        batches, batch, chars = [], [], 0
+        for ticker in tickers:
+            if batch and (len(batch) == batch_size or chars + len(ticker) + 1 > self.max_batch_chars):
+                batches.append(batch)
+                batch, chars = [], 0
+            batch.append(ticker)
+            chars += len(ticker) + 1
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    @staticmethod
+    def split_data_resp(data_resp: List[Dict[str, Any]], data_type: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Splits the data response of a multi-ticker request into the data response of each ticker.
+
+        Parameters
+        ----------
+        data_resp: list
+            Data response from multi-ticker data request in JSON format.
+        data_type: str, {'crypto', 'fx'}
+            Data type retrieved.
+
+        Returns
+        -------
+        data_resps: dict
+            Dictionary with tickers in Tiingo format as keys and data responses as values.
+        """
+        data_resps = {}
+
+        # crypto responses have one item with price data per ticker, fx responses one record per ticker and date
+        for item in data_resp:
+            data_resps.setdefault(item['ticker'].lower(), []).append(item)
 
         if data_type == 'crypto':
-            # loop through mkts
-            for mkt, ticker in zip(tg_data_req['mkts'], data_req.tickers):
+            data_resps = {ticker: items[:1] for ticker, items in data_resps.items()}
+
+        return data_resps
+
+    def iter_batches(self, data_req: DataRequest, data_type: str, tickers: List[Tuple[str, str]]) \
+            -> Iterator[pd.DataFrame]:
+        """
+        Retrieves data for batches of tickers with multi-ticker requests and yields it for each ticker, in tidy
+        format.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        data_type: str, {'crypto', 'fx'}
+            Data type to retrieve.
+        tickers: list
+            List of (Tiingo ticker, ticker) tuples, e.g. [('btcusd', 'btc')].
+
+        Yields
+        ------
+        df: pd.DataFrame - MultiIndex
+            Dataframe with DatetimeIndex (level 0), ticker (level 1) and values for fields (cols) of a ticker, in tidy
+            data format.
+        """
+        index_tickers = {tg_ticker.lower(): ticker for tg_ticker, ticker in tickers}
+
+        for batch in self.get_batches(data_req, list(index_tickers)):
+
+            # get batch data
+            try:
+                data_resps = self.split_data_resp(self.req_data(data_req, data_type, ','.join(batch)), data_type)
+            except Exception:
+                logging.info(f"Failed to get {data_type} data for {batch} after many attempts.")
+                continue
+
+            # wrangle each ticker
+            for tg_ticker in batch:
+                ticker = index_tickers[tg_ticker]
                 try:
-                    df0 = self.get_tidy_data(data_req, data_type, mkt)
-                    print(df0)
+                    df0 = self.wrangle_data_resp(data_req, data_resps[tg_ticker], data_type)
                 except Exception:
-                    logging.info(f"Failed to get {data_type} data for {ticker} after many attempts.")
+                    logging.info(f"Failed to get {data_type} data for {ticker}.")
                 else:
                     # add ticker to index
                     df0['ticker'] = ticker.upper()
                     df0.set_index(['ticker'], append=True, inplace=True)
-                    # concat df and df1
-                    df = pd.concat([df, df0])
+                    yield df0
 
-        elif data_type == 'fx':
-            # loop through mkts
-            for mkt, ticker in zip(tg_data_req['mkts'], data_req.tickers):
-                try:
-                    df0 = self.get_tidy_data(data_req, data_type, mkt)
-                except Exception:
-                    logging.info(f"Failed to get {data_type} data for {mkt} after many attempts.")
-                else:
-                    # add ticker to index
-                    df0['ticker'] = mkt.upper()
-                    df0.set_index(['ticker'], append=True, inplace=True)
-                    # concat df and df1
-                    df = pd.concat([df, df0])
+    def iter_tickers(self, data_req: DataRequest, data_type: str) -> Iterator[pd.DataFrame]:
+        """
+        Loops list of tickers, retrieves data in tidy format for each ticker and yields it as soon as it is
+        retrieved.
+
+        Tickers of data types whose endpoints accept ticker lists (batch_data_types) are requested in batches.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        data_type: str, {'eqty', 'iex', 'crypto', 'fx'}
+            Data type to retrieve.
+
+        Yields
+        ------
+        df: pd.DataFrame - MultiIndex
+            Dataframe with DatetimeIndex (level 0), ticker (level 1) and values for fields (cols) of a ticker, in tidy
+            data format.
+        """
+        # convert data request parameters to CryptoCompare format
+        tg_data_req = ConvertParams(data_req).to_tiingo()
 
+        # source tickers and index tickers
+        if data_type == 'crypto':
+            tickers = zip(tg_data_req['mkts'], data_req.tickers)
+        elif data_type == 'fx':
+            tickers = zip(tg_data_req['mkts'], tg_data_req['mkts'])
         else:
-            # loop through mkts
-            for tg_ticker, dr_ticker in zip(tg_data_req['tickers'], data_req.tickers):
-                try:
-                    df0 = self.get_tidy_data(data_req, data_type, tg_ticker)
-                except Exception:
-                    logging.info(f"Failed to get {data_type} data for {dr_ticker} after many attempts.")
-                else:
-                    # add ticker to index
-                    df0['ticker'] = dr_ticker.upper()
-                    df0.set_index(['ticker'], append=True, inplace=True)
-                    # concat df and df1
-                    df = pd.concat([df, df0])
+            tickers = zip(tg_data_req['tickers'], data_req.tickers)
 
-        return df
+        # multi-ticker requests
+        if data_type in self.batch_data_types:
+            yield from self.iter_batches(data_req, data_type, list(tickers))
+            return
+
+        # loop through tickers
+        for tg_ticker, ticker in tickers:
+            try:
+                df0 = self.get_tidy_data(data_req, data_type, tg_ticker)
+            except Exception:
+                logging.info(f"Failed to get {data_type} data for {ticker} after many attempts.")
+            else:
+                # add ticker to index
+                df0['ticker'] = ticker.upper()
+                df0.set_index(['ticker'], append=True, inplace=True)
+                yield df0
+
+    def get_all_tickers(self, data_req: DataRequest, data_type: str) -> pd.DataFrame:
+        """
+        Loops list of tickers, retrieves data in tidy format for each ticker and stores it in a
+        multiindex dataframe.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        data_type: str, {'eqty', 'iex', 'crypto', 'fx'}
+            Data type to retrieve.
+
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            Dataframe with DatetimeIndex (level 0), ticker (level 1) and values for fields (cols), in tidy data format.
+        """
+        # accumulate ticker dfs
+        dfs = Accumulator()
+        for df0 in self.iter_tickers(data_req, data_type):
+            dfs.add(df0)
+
+        return dfs.to_frame()
 
     def get_eqty(self, data_req: DataRequest) -> pd.DataFrame:
         """
@@ -743,6 +879,56 @@ class Tiingo(DataVendor):
                 f"Selected fields are not available. Use fields attribute to see available fields."
             )
 
+    def get_data_type(self, data_req: DataRequest) -> Optional[str]:
+        """
+        Gets the data type of the data request category and frequency.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+
+        Returns
+        -------
+        data_type: str, {'eqty', 'iex', 'crypto', 'fx'}
+            Data type to retrieve, or None if the category isn't available.
+        """
+        if data_req.cat == "eqty":
+            # intraday eqty data from IEX
+            if data_req.freq in self.frequencies[:self.frequencies.index('d')]:
+                return 'iex'
+            return 'eqty'
+        elif data_req.cat in ['crypto', 'fx']:
+            return data_req.cat
+
+        return None
+
+    def iter_data(self, data_req: DataRequest) -> Iterator[pd.DataFrame]:
+        """
+        Yields market data (eqty, fx, crypto) for each ticker, as soon as it is retrieved.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+
+        Yields
+        ------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and values for market or series data
+            for selected fields (cols) of a ticker, in tidy format.
+        """
+        # check data req params
+        self.check_params(data_req)
+
+        data_type = self.get_data_type(data_req)
+        if data_type is None:
+            return
+
+        for df in self.iter_tickers(data_req, data_type):
+            # filter df for desired fields
+            yield df.loc[:, [field for field in data_req.fields if field in df.columns]].sort_index()
+
     def get_data(self, data_req: DataRequest) -> pd.DataFrame:
         """
         Get market data (eqty, fx, crypto).
@@ -1,5 +1,6 @@
+import hashlib
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from time import sleep
 
 import pandas as pd
@@ -7,6 +8,11 @@ import requests
 import logging
 import pytz
 
+from cryptodatapy.extract.httpclient import http_client
+from cryptodatapy.extract.ratelimiter import RateLimiter
+from cryptodatapy.extract.retry import RetryPolicy, retry_counter
+from cryptodatapy.extract.scheduler import scheduler
+
 
 class DataRequest:
     """
@@ -77,7 +83,8 @@ class DataRequest:
         trials: int, optional, default 3
             Number of times to try data request.
         pause: float,  optional, default 0.1
-            Number of seconds to pause between data requests.
+            Number of seconds to wait before retrying a failed data request, backing off exponentially after each
+            attempt. Requests are paced by each data source's rate limiter, e.g. the exchange rate limit for CCXT.
         source_tickers: list or str, optional, default None
             List or string of ticker symbols for assets or time series in the format used by the
             data source. If None, tickers will be converted from CryptoDataPy to data source format.
@@ -510,14 +517,14 @@ class DataRequest:
     @property
     def pause(self):
         """
-        Returns number of seconds to pause between data requests.
+        Returns number of seconds to wait before retrying a failed data request.
         """
         return self._pause
 
     @pause.setter
     def pause(self, pause):
         """
-        Sets number of seconds to pause between data requests.
+        Sets number of seconds to wait before retrying a failed data request.
         """
         if pause is None:
             self._pause = pause
@@ -670,10 +677,31 @@ class DataRequest:
                 "Source fields must be a string or list of strings (fields) in data source's format."
             )
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        Returns a stable hash of the data request parameters, which changes when any parameter changes.
+        """
+        def canonical(value: Any) -> Any:
+            if isinstance(value, (list, tuple)):
+                return tuple(canonical(val) for val in value)
+            elif isinstance(value, dict):
+                return tuple(sorted((key, canonical(val)) for key, val in value.items()))
+            elif isinstance(value, datetime):
+                return pd.Timestamp(value).isoformat()
+            return value
+
+        params = tuple(sorted((key.lstrip('_'), canonical(val)) for key, val in vars(self).items()))
+
+        return hashlib.sha1(repr(params).encode()).hexdigest()
+
     def get_req(self, url: str, params: Dict[str, Union[str, int]],
-                headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                rate_limiter: Optional[RateLimiter] = None,
+                retry_policy: Optional[RetryPolicy] = None) -> Dict[str, Any]:
         """
-        Submits get request to API.
+        Submits get request to API through the shared, pooled HTTP client.
 
         Parameters
         ----------
@@ -683,74 +711,77 @@ class DataRequest:
             Dictionary containing parameter values for get request.
         headers: dict, optional, default None
             Dictionary containing headers for get request.
+        timeout: float or tuple, optional, default None
+            Timeout in seconds for get request. If None, the HTTP client's default timeout is used.
+        rate_limiter: RateLimiter, optional, default None
+            Rate limiter of the data source. Each attempt is dispatched by the shared scheduler once a token is
+            available.
+        retry_policy: RetryPolicy, optional, default None
+            Policy for retrying failed attempts. If None, retries up to trials attempts with jittered exponential
+            backoff starting at pause seconds.
 
         Returns
         -------
         resp: dict
             Data response in JSON format.
         """
-        # set number of attempts
-        attempts, resp = 0, None
+        # retry policy
+        if retry_policy is None:
+            retry_policy = RetryPolicy(max_attempts=max(self.trials or 1, 1), backoff=self.pause or 0.0)
 
-        # run a while loop in case the attempt fails
-        while attempts < self.trials:
+        for attempt in range(1, retry_policy.max_attempts + 1):
+            resp = None
 
-            # get request
+            # get request, dispatched by the shared scheduler under the rate limit
             try:
-                resp = requests.get(url, params=params, headers=headers)
+                resp = scheduler.run(http_client.get, url, params=params, headers=headers, timeout=timeout,
+                                     rate_limiter=rate_limiter)
                 # check for status code
                 resp.raise_for_status()
 
                 return resp.json()
 
-            # handle HTTP errors
-            except requests.exceptions.HTTPError as http_err:
-                status_code = resp.status_code
-
-                # Tailored handling for different status codes
-                if status_code == 400:
-                    logging.warning(f"Bad Request (400): {resp.text}")
-                elif status_code == 401:
-                    logging.warning("Unauthorized (401): Check the authentication credentials.")
-                elif status_code == 403:
-                    logging.warning("Forbidden (403): You do not have permission to access this resource.")
-                elif status_code == 404:
-                    logging.warning("Not Found (404): The requested resource could not be found.")
-                elif status_code == 500:
-                    logging.error("Internal Server Error (500): The server encountered an error.")
-                elif status_code == 503:
-                    logging.error("Service Unavailable (503): The server is temporarily unavailable.")
-                else:
-                    logging.error(f"HTTP error occurred: {http_err} (Status Code: {status_code})")
-                    logging.error(f"Response Content: {resp.text}")
-
-                # Increment attempts and log warning
-                attempts += 1
-                logging.warning(f"Attempt #{attempts}: Failed to get data due to: {http_err}")
-                sleep(self.pause)  # Pause before retrying
-                if attempts == self.trials:
-                    logging.error("Max attempts reached. Unable to fetch data.")
+            except Exception as e:
+                # log HTTP errors
+                if isinstance(e, requests.exceptions.HTTPError):
+                    status_code = resp.status_code
+                    if status_code == 400:
+                        logging.warning(f"Bad Request (400): {resp.text}")
+                    elif status_code == 401:
+                        logging.warning("Unauthorized (401): Check the authentication credentials.")
+                    elif status_code == 403:
+                        logging.warning("Forbidden (403): You do not have permission to access this resource.")
+                    elif status_code == 404:
+                        logging.warning("Not Found (404): The requested resource could not be found.")
+                    elif status_code == 429:
+                        logging.warning("Too Many Requests (429): The API rate limit was exceeded.")
+                    elif status_code == 500:
+                        logging.error("Internal Server Error (500): The server encountered an error.")
+                    elif status_code == 503:
+                        logging.error("Service Unavailable (503): The server is temporarily unavailable.")
+                    else:
+                        logging.error(f"HTTP error occurred: {e} (Status Code: {status_code})")
+                        logging.error(f"Response Content: {resp.text}")
+
+                # fail fast on errors which can't succeed on a later attempt
+                if not retry_policy.is_retryable(e):
+                    logging.error(f"Unable to fetch data due to non-retryable error: {e}")
                     break
-
-            # handle non-HTTP exceptions (e.g., network issues)
-            except requests.exceptions.RequestException as req_err:
-                attempts += 1
-                logging.warning(f"Request error on attempt #{attempts}: {req_err}. "
-                                f"Retrying after {self.pause} seconds...")
-                sleep(self.pause)
-                if attempts == self.trials:
-                    logging.error("Max attempts reached. Unable to fetch data due to request errors.")
+                if attempt == retry_policy.max_attempts:
+                    logging.error(f"Max attempts reached. Unable to fetch data due to: {e}")
                     break
 
-            # handle other exceptions
-            except Exception as e:
-                attempts += 1
-                logging.warning(f"An unexpected error occurred: {e}. "
-                                f"Retrying after {self.pause} seconds...")
-                sleep(self.pause)
-                if attempts == self.trials:
-                    logging.error("Max attempts reached. Unable to fetch data due to request errors.")
-                    break
+                # pause all requests to the data source if it sent rate limit headers
+                retry_after = retry_policy.get_retry_after(resp)
+                if retry_after is not None and rate_limiter is not None:
+                    rate_limiter.pause(retry_after)
+
+                # backoff before retrying
+                wait = retry_policy.get_wait(attempt, resp)
+                retry_counter.add(url, e)
+                logging.warning(f"Attempt #{attempt}: Failed to get data due to: {e}. "
+                                f"Retrying after {wait:.2f} seconds...")
+                sleep(wait)
 
         # return None if the API call fails
         return None
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Optional
+
+
+class BackgroundLoop:
+    """
+    Event loop running on a background thread, reused to run coroutines from synchronous code, including notebooks
+    where an event loop is already running on the main thread.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Returns the event loop, starting its thread on first use.
+        """
+        with self._lock:
+            if self._loop is None or self._loop.is_closed() or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name='cryptodatapy-event-loop', daemon=True
+                )
+                self._thread.start()
+
+        return self._loop
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        Runs a coroutine on the background event loop and waits for its result.
+
+        Parameters
+        ----------
+        coro: Awaitable
+            Coroutine to run.
+        timeout: float, optional, default None
+            Maximum time to wait for the result, in seconds.
+
+        Returns
+        -------
+        result: Any
+            Result of the coroutine.
+        """
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Can't wait for a coroutine from the background event loop's own thread.")
+
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    def stop(self) -> None:
+        """
+        Stops the background event loop and its thread.
+        """
+        with self._lock:
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+            self._loop, self._thread = None, None
+
+
+# shared background event loop
+background_loop = BackgroundLoop()
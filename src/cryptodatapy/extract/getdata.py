@@ -1,16 +1,19 @@
-from typing import Optional
+import asyncio
+import inspect
+import logging
+from contextvars import copy_context
+from copy import deepcopy
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import pandas as pd
 
-from cryptodatapy.extract.data_vendors.coinmetrics_api import CoinMetrics
-from cryptodatapy.extract.data_vendors.cryptocompare_api import CryptoCompare
-from cryptodatapy.extract.data_vendors.glassnode_api import Glassnode
-from cryptodatapy.extract.data_vendors.tiingo_api import Tiingo
+from cryptodatapy.extract.accumulator import Accumulator
 from cryptodatapy.extract.datarequest import DataRequest
-from cryptodatapy.extract.libraries.ccxt_api import CCXT
-from cryptodatapy.extract.libraries.dbnomics_api import DBnomics
-from cryptodatapy.extract.libraries.investpy_api import InvestPy
-from cryptodatapy.extract.libraries.pandasdr_api import PandasDataReader
-from cryptodatapy.extract.web.aqr import AQR
+from cryptodatapy.extract.eventloop import background_loop
+from cryptodatapy.extract.registry import get_data_source
+from cryptodatapy.extract.scheduler import current_priority, scheduler
+from cryptodatapy.util.coverage import CoverageIndex, Interval
+from cryptodatapy.util.datastore import DataStore
 
 
 class GetData:
@@ -18,7 +21,11 @@ class GetData:
     Retrieves data from selected data source.
     """
 
-    def __init__(self, data_req: DataRequest, api_key: Optional[str] = None):
+    # maximum number of concurrent requests per data source in batches
+    max_concurrency = {'ccxt': 2, 'glassnode': 2, 'tiingo': 2, 'cryptocompare': 2, 'coinmetrics': 2}
+    default_max_concurrency = 4
+
+    def __init__(self, data_req: DataRequest, api_key: Optional[str] = None, store: Optional[DataStore] = None):
         """
         Constructor
 
@@ -28,9 +35,13 @@ class GetData:
             Parameters of data request in CryptoDataPy format.
         api_key: str
             Api key for data source if required.
+        store: DataStore, optional, default None
+            Local data store. If provided, series are served from the store and only missing date ranges are
+            requested from the data source.
         """
         self.data_req = data_req
         self.api_key = api_key
+        self.store = store
 
     def get_meta(self, attr: str = None, method: str = None, **kwargs) -> pd.DataFrame:
         """
@@ -83,23 +94,6 @@ class GetData:
         1INCHUP	        1INCHUP	       None	        1INCHUP	        8
         AAVE	        AAVE	       None	        AAVE	        8
         """
-        # data source objects
-        data_source_dict = {
-            "cryptocompare": CryptoCompare,
-            "coinmetrics": CoinMetrics,
-            "ccxt": CCXT,
-            "glassnode": Glassnode,
-            "tiingo": Tiingo,
-            "investpy": InvestPy,
-            "dbnomics": DBnomics,
-            "yahoo": PandasDataReader,
-            "fred": PandasDataReader,
-            "av-daily": PandasDataReader,
-            "av-forex-daily": PandasDataReader,
-            "famafrench": PandasDataReader,
-            "aqr": AQR
-        }
-
         # available attr and methods
         valid_attr = [
             "source_type",
@@ -132,7 +126,7 @@ class GetData:
         ]
 
         # data source
-        ds = data_source_dict[self.data_req.source]
+        ds = get_data_source(self.data_req.source)
         # instantiate ds obj
         if self.api_key is not None:
             ds = ds(api_key=self.api_key)
@@ -192,31 +186,380 @@ class GetData:
                     ETH	        2410	    9164	    0.140147
         2016-01-03	BTC	        394047	    142463	    0.091947
         """
-        # data source objects
-        data_source_dict = {
-            "cryptocompare": CryptoCompare,
-            "coinmetrics": CoinMetrics,
-            "ccxt": CCXT,
-            "glassnode": Glassnode,
-            "tiingo": Tiingo,
-            "investpy": InvestPy,
-            "dbnomics": DBnomics,
-            "yahoo": PandasDataReader,
-            "fred": PandasDataReader,
-            "av-daily": PandasDataReader,
-            "av-forex-daily": PandasDataReader,
-            "famafrench": PandasDataReader,
-            "aqr": AQR
-        }
+        if self.store is not None:
+            return self.get_stored_series(method=method)
+
+        return self.fetch_series(self.data_req, method=method)
+
+    def fetch_series(self, data_req: DataRequest, method: str = "get_data") -> pd.DataFrame:
+        """
+        Get requested data from data source.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        method: str, default 'get_data'
+            Gets the specified method from the data source object.
+
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and field (cols) values.
+        """
+        df = self.call_data_source(data_req, method=method)
+        # async data sources, e.g. CCXT, run on the background event loop
+        if inspect.isawaitable(df):
+            df = background_loop.run(df)
+
+        return df
+
+    def iter_series(self, method: str = "get_data") -> Iterator[pd.DataFrame]:
+        """
+        Get requested data as a stream of dataframes, e.g. one per ticker, yielded as soon as each is retrieved and
+        wrangled, so they can be stored or processed without waiting for the entire data request.
+
+        Data sources which don't stream, and methods other than 'get_data', yield a single dataframe. If a data store
+        is provided, each dataframe is also written to the store, with the requested date range as its coverage.
+
+        Parameters
+        ----------
+        method: str, default 'get_data'
+            Gets the specified method from the data source object.
+
+        Yields
+        ------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and field (cols) values.
+        """
+        if method == "get_data":
+            dfs = self.call_data_source(self.data_req, method="iter_data")
+        else:
+            dfs = [self.call_data_source(self.data_req, method=method)]
+
+        # requested date range
+        if self.store is not None:
+            coverage = CoverageIndex()
+            coverage.add(self.data_req.fields, *self.store.get_date_range(self.data_req.start_date,
+                                                                          self.data_req.end_date))
 
+        written = set()
+        for df in dfs:
+            # async data sources, e.g. CCXT, run on the background event loop
+            if inspect.isawaitable(df):
+                df = background_loop.run(df)
+            if self.store is not None and isinstance(df, pd.DataFrame) and isinstance(df.index, pd.MultiIndex):
+                tickers = [str(ticker) for ticker in df.index.get_level_values(1).unique()]
+                self.store.write(self.store_source, self.data_req.freq, df, coverage=coverage, tickers=tickers)
+                written.update(ticker.lower() for ticker in tickers)
+            yield df
+
+        # once the stream is complete, record coverage of requested tickers without observations
+        if self.store is not None:
+            tickers = [ticker for ticker in self.data_req.tickers if ticker.lower() not in written]
+            self.store.write(self.store_source, self.data_req.freq, pd.DataFrame(), coverage=coverage, tickers=tickers)
+
+    def call_data_source(self, data_req: DataRequest, method: str = "get_data"):
+        """
+        Calls the method of the data source object.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        method: str, default 'get_data'
+            Gets the specified method from the data source object.
+
+        Returns
+        -------
+        df: pd.DataFrame or Awaitable
+            DataFrame, or coroutine returning the DataFrame for async data sources.
+        """
         # data source
-        ds = data_source_dict[self.data_req.source]
+        ds = get_data_source(data_req.source)
         # instantiate ds obj
         if self.api_key is not None:
             ds = ds(api_key=self.api_key)
         else:
             ds = ds()
-        # get data
-        df = getattr(ds, method)(self.data_req)
 
-        return df
+        return getattr(ds, method)(data_req)
+
+    async def aget_series(self, method: str = "get_data") -> pd.DataFrame:
+        """
+        Get requested data without blocking the event loop.
+
+        Async data sources, e.g. CCXT, are awaited directly, while synchronous data sources and the data store run
+        in the default executor, keeping the scheduler priority of the calling context.
+
+        Parameters
+        ----------
+        method: str, default 'get_data'
+            Gets the specified method from the data source object.
+
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and field (cols) values.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self.store is not None:
+            return await loop.run_in_executor(
+                None, copy_context().run, partial(self.get_stored_series, method=method)
+            )
+
+        if inspect.iscoroutinefunction(getattr(get_data_source(self.data_req.source), method, None)):
+            return await self.call_data_source(self.data_req, method=method)
+
+        return await loop.run_in_executor(
+            None, copy_context().run, partial(self.fetch_series, self.data_req, method=method)
+        )
+
+    @classmethod
+    async def aget_batch(
+        cls,
+        data_reqs: List[DataRequest],
+        method: str = "get_data",
+        api_keys: Optional[Dict[str, str]] = None,
+        store: Optional[DataStore] = None,
+        priority: Optional[str] = None,
+    ) -> List[pd.DataFrame]:
+        """
+        Get data for many data requests, across data sources, concurrently.
+
+        Requests to the same data source are limited to its maximum concurrency (max_concurrency), so the batch takes
+        about as long as its slowest data source.
+
+        Parameters
+        ----------
+        data_reqs: list
+            List of data requests in CryptoDataPy format.
+        method: str, default 'get_data'
+            Gets the specified method from the data source objects.
+        api_keys: dict, optional, default None
+            Dictionary with data sources as keys and api keys as values, e.g. {'glassnode': 'my_key'}.
+        store: DataStore, optional, default None
+            Local data store, shared by all data requests.
+        priority: str, {'interactive', 'backfill'}, optional, default None
+            Scheduler priority class of the batch's HTTP requests. If None, the priority of the calling context is
+            used.
+
+        Returns
+        -------
+        dfs: list
+            List of DataFrames, in the order of the data requests. Failed requests return an empty DataFrame.
+        """
+        api_keys = api_keys or {}
+        semaphores = {
+            source: asyncio.Semaphore(cls.max_concurrency.get(source, cls.default_max_concurrency))
+            for source in {data_req.source for data_req in data_reqs}
+        }
+
+        async def get_series(data_req: DataRequest) -> pd.DataFrame:
+            async with semaphores[data_req.source]:
+                try:
+                    return await cls(data_req, api_key=api_keys.get(data_req.source), store=store).aget_series(
+                        method=method
+                    )
+                except Exception as e:
+                    logging.warning(f"Failed to get data from {data_req.source}: {e}")
+                    return pd.DataFrame()
+
+        with scheduler.priority(priority):
+            return list(await asyncio.gather(*[get_series(data_req) for data_req in data_reqs]))
+
+    @classmethod
+    def get_batch(
+        cls,
+        data_reqs: List[DataRequest],
+        method: str = "get_data",
+        api_keys: Optional[Dict[str, str]] = None,
+        store: Optional[DataStore] = None,
+        priority: Optional[str] = None,
+    ) -> List[pd.DataFrame]:
+        """
+        Get data for many data requests, across data sources, concurrently, from synchronous code.
+
+        Runs aget_batch on the shared background event loop, so it can also be called from notebooks.
+
+        Parameters
+        ----------
+        data_reqs: list
+            List of data requests in CryptoDataPy format.
+        method: str, default 'get_data'
+            Gets the specified method from the data source objects.
+        api_keys: dict, optional, default None
+            Dictionary with data sources as keys and api keys as values, e.g. {'glassnode': 'my_key'}.
+        store: DataStore, optional, default None
+            Local data store, shared by all data requests.
+        priority: str, {'interactive', 'backfill'}, optional, default None
+            Scheduler priority class of the batch's HTTP requests. If None, the priority of the calling context is
+            used.
+
+        Returns
+        -------
+        dfs: list
+            List of DataFrames, in the order of the data requests. Failed requests return an empty DataFrame.
+        """
+        # the background event loop doesn't share the calling context
+        if priority is None:
+            priority = current_priority.get()
+
+        return background_loop.run(
+            cls.aget_batch(data_reqs, method=method, api_keys=api_keys, store=store, priority=priority)
+        )
+
+    @property
+    def store_source(self) -> str:
+        """
+        Returns the data store partition of the data request, e.g. 'ccxt_binance_perpetual_future'.
+        """
+        data_req = self.data_req
+        parts = [data_req.source, data_req.exch, data_req.quote_ccy]
+        if data_req.mkt_type != 'spot':
+            parts.append(data_req.mkt_type)
+
+        return "_".join(str(part) for part in parts if part is not None)
+
+    def get_missing_requests(self) -> List[Tuple[DataRequest, CoverageIndex]]:
+        """
+        Gets data requests for the date ranges missing from the data store, grouping tickers with the same missing
+        ranges, e.g. only 2017 and 2024 when the store holds 2018 to 2023.
+
+        Returns
+        -------
+        requests: list
+            List of data requests for missing date ranges, with the coverage index of each request.
+        """
+        data_req = self.data_req
+        start, end = self.store.get_date_range(data_req.start_date, data_req.end_date)
+
+        # tickers by missing date range
+        missing: Dict[Interval, List[str]] = {}
+        for ticker in data_req.tickers:
+            for date_range in self.store.get_missing(
+                    self.store_source, data_req.freq, ticker, data_req.fields, start, end
+            ):
+                missing.setdefault(date_range, []).append(ticker)
+
+        requests = []
+        for (range_start, range_end), tickers in missing.items():
+            req = deepcopy(data_req)
+            # source tickers and markets are aligned with all tickers
+            if data_req.source_tickers is None and data_req.markets is None:
+                req.tickers = tickers
+            # keep open-ended dates open, so vendors use their own defaults
+            req.start_date = None if data_req.start_date is None and range_start == start else range_start
+            req.end_date = None if data_req.end_date is None and range_end == end else range_end
+            req.source_start_date, req.source_end_date = None, None
+            coverage = CoverageIndex()
+            coverage.add(data_req.fields, range_start, range_end)
+            requests.append((req, coverage))
+
+        return requests
+
+    def get_stored_series(self, method: str = "get_data") -> pd.DataFrame:
+        """
+        Get requested data from the data store, requesting missing date ranges from the data source and writing them
+        to the store.
+
+        Parameters
+        ----------
+        method: str, default 'get_data'
+            Gets the specified method from the data source object.
+
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and field (cols) values.
+        """
+        for data_req, coverage in self.get_missing_requests():
+            df = self.fetch_series(data_req, method=method)
+            # series without date and ticker index can't be stored
+            if not isinstance(df, pd.DataFrame) or (not df.empty and not isinstance(df.index, pd.MultiIndex)):
+                return df
+            self.store.write(self.store_source, self.data_req.freq, df, coverage=coverage, tickers=data_req.tickers)
+
+        return self.store.read(
+            self.store_source,
+            self.data_req.freq,
+            self.data_req.tickers,
+            fields=self.data_req.fields,
+            start_date=self.data_req.start_date,
+            end_date=self.data_req.end_date,
+        )
+
+    def get_updates(
+        self,
+        last_dates: Optional[Dict[str, Union[str, pd.Timestamp]]] = None,
+        method: str = "get_data"
+    ) -> pd.DataFrame:
+        """
+        Get observations newer than the last timestamp of each ticker, e.g. for daily refreshes.
+
+        Tickers with the same last timestamp are requested together, from their last timestamp, which each data source
+        converts to its own cursor, e.g. 'toTs' and 'limit' for CryptoCompare, 's' for Glassnode, 'since' for CCXT or
+        'start_time' for CoinMetrics. Tickers without a last timestamp are requested from the data request start date.
+
+        Parameters
+        ----------
+        last_dates: dict, optional, default None
+            Dictionary with tickers as keys and last timestamps as values. If None, the last stored timestamps of the
+            data store are used.
+        method: str, default 'get_data'
+            Gets the specified method from the data source object.
+
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and field (cols) values, with only observations
+            after each ticker's last timestamp, ready to append.
+        """
+        data_req = self.data_req
+        if last_dates is None:
+            if self.store is None:
+                raise ValueError("Provide last dates or a data store to get updates.")
+            last_dates = {
+                ticker: self.store.get_last_date(self.store_source, data_req.freq, ticker)
+                for ticker in data_req.tickers
+            }
+        last_dates = {
+            ticker.lower(): None if date is None else CoverageIndex.to_date(date) for ticker, date in last_dates.items()
+        }
+
+        # tickers by last date
+        tickers_by_date: Dict[Optional[pd.Timestamp], List[str]] = {}
+        for ticker in data_req.tickers:
+            tickers_by_date.setdefault(last_dates.get(ticker.lower()), []).append(ticker)
+
+        deltas = Accumulator()
+        for last_date, tickers in tickers_by_date.items():
+            req = deepcopy(data_req)
+            # source tickers and markets are aligned with all tickers
+            if data_req.source_tickers is None and data_req.markets is None:
+                req.tickers = tickers
+            if last_date is not None:
+                req.start_date = last_date
+            req.source_start_date, req.source_end_date = None, None
+            df = self.fetch_series(req, method=method)
+            if not isinstance(df, pd.DataFrame) or df.empty or not isinstance(df.index, pd.MultiIndex):
+                continue
+
+            # store refreshes the last, possibly incomplete, observation
+            if self.store is not None:
+                coverage = CoverageIndex()
+                coverage.add(data_req.fields, *self.store.get_date_range(req.start_date, req.end_date))
+                self.store.write(self.store_source, data_req.freq, df, coverage=coverage, tickers=req.tickers)
+
+            # observations after each ticker's last date
+            dates = df.index.get_level_values(0)
+            dates = dates.tz_convert(None) if dates.tz is not None else dates
+            thresholds = pd.DatetimeIndex([
+                last_dates.get(str(ticker).lower()) or pd.NaT for ticker in df.index.get_level_values(1)
+            ])
+            deltas.add(df[thresholds.isna() | (dates > thresholds)])
+
+        df = deltas.to_frame()
+
+        return df if df.empty else df.sort_index()
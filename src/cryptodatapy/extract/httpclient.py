@@ -0,0 +1,175 @@
+import threading
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HTTPClient:
+    """
+    Shared HTTP client which keeps a pooled, keep-alive session for each host.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        pool_block: bool = False,
+        timeout: Optional[Union[float, Tuple[float, float]]] = (10.0, 60.0),
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        pool_connections: int, default 10
+            Number of connection pools to cache per session.
+        pool_maxsize: int, default 20
+            Maximum number of connections to keep alive in each pool, i.e. per host.
+        pool_block: bool, default False
+            Blocks when no free connection is available in the pool instead of opening a throwaway connection.
+        timeout: float or tuple, optional, default (10.0, 60.0)
+            Default timeout in seconds for requests, as a single value or a (connect, read) tuple.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = timeout
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        """
+        Gets the scheme and host of a url, which keys the session pools.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url.
+
+        Returns
+        -------
+        host: str
+            Scheme and network location of url, e.g. 'https://min-api.cryptocompare.com'.
+        """
+        split_url = urlsplit(url)
+
+        return f"{split_url.scheme}://{split_url.netloc}"
+
+    def create_session(self) -> requests.Session:
+        """
+        Creates a session with pooled adapters mounted for http and https.
+
+        Returns
+        -------
+        session: requests.Session
+            Session with keep-alive connection pools.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize,
+                              pool_block=self.pool_block)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+        Gets the session for the url's host, creating it on first use.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url.
+
+        Returns
+        -------
+        session: requests.Session
+            Session for the host of the url.
+        """
+        host = self.get_host(url)
+
+        with self._lock:
+            if host not in self._sessions:
+                self._sessions[host] = self.create_session()
+
+            return self._sessions[host]
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Union[str, int]]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+    ) -> requests.Response:
+        """
+        Submits get request through the pooled session for the url's host.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url for get request.
+        params: dict, optional, default None
+            Dictionary containing parameter values for get request.
+        headers: dict, optional, default None
+            Dictionary containing headers for get request.
+        timeout: float or tuple, optional, default None
+            Timeout in seconds for the request. If None, the client's default timeout is used.
+
+        Returns
+        -------
+        resp: requests.Response
+            Response object.
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        return self.get_session(url).get(url, params=params, headers=headers, timeout=timeout)
+
+    def configure(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+    ) -> None:
+        """
+        Changes pool sizes and/or default timeout. Open sessions are closed so that new settings take effect.
+
+        Parameters
+        ----------
+        pool_connections: int, optional, default None
+            Number of connection pools to cache per session.
+        pool_maxsize: int, optional, default None
+            Maximum number of connections to keep alive in each pool.
+        pool_block: bool, optional, default None
+            Blocks when no free connection is available in the pool.
+        timeout: float or tuple, optional, default None
+            Default timeout in seconds for requests.
+        """
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if pool_block is not None:
+            self.pool_block = pool_block
+        if timeout is not None:
+            self.timeout = timeout
+
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes all sessions and their connection pools.
+        """
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+
+# shared http client used by all data requests
+http_client = HTTPClient()
@@ -1,5 +1,18 @@
-from cryptodatapy.extract.libraries.ccxt_api import CCXT
-from cryptodatapy.extract.libraries.dbnomics_api import DBnomics
-from cryptodatapy.extract.libraries.investpy_api import InvestPy
-from cryptodatapy.extract.libraries.library import Library
-from cryptodatapy.extract.libraries.pandasdr_api import PandasDataReader
+from cryptodatapy.extract.registry import lazy_getattr
+
+# exports imported on first access, so importing one data source doesn't import the others
+exports = {
+    "CCXT": "ccxt_api",
+    "DBnomics": "dbnomics_api",
+    "InvestPy": "investpy_api",
+    "Library": "library",
+    "PandasDataReader": "pandasdr_api",
+}
+
+
+def __getattr__(name):
+    return lazy_getattr(__name__, exports, name)
+
+
+def __dir__():
+    return sorted(list(globals()) + list(exports))
@@ -1,17 +1,22 @@
+import asyncio
 import logging
+import math
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
-import asyncio
 import ccxt
 import ccxt.async_support as ccxt_async
 from tqdm.asyncio import tqdm  # Progress bar for async
 
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.libraries.library import Library
+from cryptodatapy.extract.ratelimiter import RateLimiter, get_rate_limiter
+from cryptodatapy.extract.retry import RetryPolicy
+from cryptodatapy.extract.scheduler import scheduler
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.diskcache import disk_cache
 
 # data credentials
 data_cred = DataCredentials()
@@ -21,6 +26,9 @@ class CCXT(Library):
     """
     Retrieves data from CCXT API.
     """
+    # max number of tickers fetched concurrently
+    max_concurrency = 10
+
     def __init__(
             self,
             categories: Union[str, List[str]] = "crypto",
@@ -91,6 +99,49 @@ class CCXT(Library):
         self.data_req = None
         self.data = pd.DataFrame()
 
+    def load_markets(self, exch: str, reload: bool = False) -> Dict[str, Any]:
+        """
+        Loads markets and currencies of an exchange from the disk cache, or from the exchange if they are not cached
+        or have expired, and shares them between the sync and async exchange instances.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        reload: bool, default False
+            Reloads markets from the exchange and updates the cache.
+
+        Returns
+        -------
+        markets: dict
+            Dictionary of markets on the exchange, keyed by symbol.
+        """
+        # inst exch
+        if self.exchange is None:
+            self.exchange = getattr(ccxt, exch)()
+        if self.exchange_async is None:
+            self.exchange_async = getattr(ccxt_async, exch)()
+
+        key = f"ccxt_{exch}_markets"
+
+        # markets already loaded
+        if self.exchange.markets and not reload:
+            markets = (self.exchange.markets, self.exchange.currencies)
+        else:
+            markets = None if reload else disk_cache.get(key)
+            if markets is None:
+                self.exchange.load_markets(reload=reload)
+                markets = (self.exchange.markets, self.exchange.currencies)
+                disk_cache.set(key, markets)
+            else:
+                self.exchange.set_markets(*markets)
+
+        # async exchange doesn't need to load markets again
+        if not self.exchange_async.markets or reload:
+            self.exchange_async.set_markets(*markets)
+
+        return self.exchange.markets
+
     def get_exchanges_info(self) -> List[str]:
         """
         Get exchanges info.
@@ -139,7 +190,7 @@ class CCXT(Library):
                     self.exchange = getattr(ccxt, exch)()
 
             # get assets on exchange and create df
-            self.exchange.load_markets()
+            self.load_markets(exch)
             self.assets = pd.DataFrame(self.exchange.currencies).T
             self.assets.index.name = "ticker"
 
@@ -187,7 +238,7 @@ class CCXT(Library):
                     self.exchange = getattr(ccxt, exch)()
 
             # get assets on exchange
-            self.markets = pd.DataFrame(self.exchange.load_markets()).T
+            self.markets = pd.DataFrame(self.load_markets(exch)).T
             self.markets.index.name = "ticker"
 
             # quote ccy
@@ -287,6 +338,88 @@ class CCXT(Library):
 
         return self.rate_limit
 
+    def get_rate_limiter(self, exch: str) -> RateLimiter:
+        """
+        Gets the rate limiter shared by all requests to an exchange.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+
+        Returns
+        -------
+        rate_limiter: RateLimiter
+            Token bucket rate limiter for the exchange, refilled at the exchange's rate limit.
+        """
+        # inst exch
+        if self.exchange_async is None:
+            self.exchange_async = getattr(ccxt_async, exch)()
+
+        # exchange rate limit is the delay in milliseconds between requests
+        return get_rate_limiter('ccxt', exch, rate=1000 / self.exchange_async.rateLimit)
+
+    def get_concurrency(self, exch: str) -> int:
+        """
+        Gets the number of tickers to fetch concurrently from an exchange.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+
+        Returns
+        -------
+        concurrency: int
+            Number of requests the exchange allows per second, capped at max_concurrency.
+        """
+        # inst exch
+        if self.exchange_async is None:
+            self.exchange_async = getattr(ccxt_async, exch)()
+
+        return max(1, min(self.max_concurrency, math.ceil(1000 / self.exchange_async.rateLimit)))
+
+    async def _fetch_all(self, fetch, tickers: List[str], exch: str, desc: str, **kwargs) -> List:
+        """
+        Fetches data for a list of tickers concurrently, bounded by a semaphore.
+
+        Parameters
+        ----------
+        fetch: coroutine function
+            Method which fetches data for a single ticker, e.g. _fetch_ohlcv.
+        tickers: list
+            List of ticker symbols.
+        exch: str
+            Name of exchange.
+        desc: str
+            Description of progress bar.
+        **kwargs
+            Keyword arguments passed to fetch.
+
+        Returns
+        -------
+        data: list
+            List of data responses for each ticker, in the same order as tickers.
+        """
+        semaphore = asyncio.Semaphore(self.get_concurrency(exch))
+
+        # create progress bar
+        pbar = tqdm(total=len(tickers), desc=desc, unit="ticker")
+
+        async def fetch_ticker(ticker: str) -> List:
+            async with semaphore:
+                data_resp = await fetch(ticker, exch=exch, **kwargs)
+            pbar.update(1)
+            return data_resp
+
+        try:
+            data = await asyncio.gather(*[fetch_ticker(ticker) for ticker in tickers])
+        finally:
+            pbar.close()
+            await self.exchange_async.close()
+
+        return list(data)
+
     def get_metadata(self, exch: str) -> None:
         """
         Get CCXT metadata.
@@ -305,7 +438,7 @@ class CCXT(Library):
                 self.exchange = getattr(ccxt, exch)()
 
         # load markets
-        self.exchange.load_markets()
+        self.load_markets(exch)
 
         if self.exchanges is None:
             self.exchanges = self.get_exchanges_info()
@@ -322,16 +455,129 @@ class CCXT(Library):
         if self.rate_limit is None:
             self.rate_limit = self.exchange.rateLimit
 
+    def get_time_shards(self, freq: str, start_date: int, end_date: int) -> List[List[int]]:
+        """
+        Splits a date range into shards which can be fetched concurrently.
+
+        Parameters
+        ----------
+        freq: str
+            Frequency of data, e.g. '1m', '5m', '1h', '1d'.
+        start_date: int
+            Start date in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+
+        Returns
+        -------
+        shards: list
+            List of [start, end) date ranges in milliseconds since Unix epoch, each spanning a whole number of calls.
+        """
+        # time span of a single call
+        call_ms = ccxt.Exchange.parse_timeframe(freq) * 1000 * self.max_obs_per_call
+        n_calls = max(1, math.ceil((end_date - start_date) / call_ms))
+
+        # split calls evenly across shards
+        n_shards = min(n_calls, self.max_concurrency)
+        shard_ms = math.ceil(n_calls / n_shards) * call_ms
+
+        return [[shard_start, min(shard_start + shard_ms, end_date)]
+                for shard_start in range(start_date, end_date, shard_ms)]
+
+    async def _fetch_ohlcv_shard(self,
+                                 ticker: str,
+                                 freq: str,
+                                 start_date: int,
+                                 end_date: int,
+                                 exch: str,
+                                 trials: int = 3,
+                                 pause: float = 0.1
+                                 ) -> List:
+        """
+        Fetches OHLCV data for a specific ticker over a single shard, paging forward from the start date.
+
+        Parameters
+        ----------
+        ticker: str
+            Ticker symbol.
+        freq: str
+            Frequency of data, e.g. '1m', '5m', '1h', '1d'.
+        start_date: int
+            Start date in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+        exch: str
+            Name of exchange.
+        trials: int, default 3
+            Number of attempts to fetch data.
+        pause: float, default 0.1
+            Number of seconds to wait before retrying a failed request, backing off exponentially after each attempt.
+
+        Returns
+        -------
+        data: list
+            List of timestamps with OHLCV data.
+        """
+        attempts = 0
+        data = []
+        rate_limiter = self.get_rate_limiter(exch)
+
+        # while loop to fetch all data
+        while start_date < end_date and attempts < trials:
+
+            # wait for rate limit
+            await scheduler.acquire_async(rate_limiter)
+
+            try:
+                data_resp = await getattr(self.exchange_async, 'fetchOHLCV')(
+                    ticker,
+                    freq,
+                    since=start_date,
+                    limit=self.max_obs_per_call,
+                    params={'until': end_date}
+                )
+
+            except Exception as e:
+                logging.warning(
+                    f"Failed to get OHLCV data from {self.exchange_async.id} for {ticker} on attempt #{attempts+1}."
+                )
+                logging.warning(e)
+                attempts += 1
+                if attempts == trials:
+                    logging.warning(
+                        f"Failed to get OHLCV data from {self.exchange_async.id} "
+                        f"for {ticker} after {trials} attempts."
+                    )
+                    return data
+
+                # back off before retrying
+                retry_policy = RetryPolicy(max_attempts=max(trials or 1, 1), backoff=pause or 0.0)
+                await asyncio.sleep(retry_policy.get_wait(attempts))
+                continue
+
+            else:
+                # check if data resp is empty
+                if len(data_resp):
+                    # next start date
+                    start_date = data_resp[-1][0] + 1
+                    data.extend(data_resp)
+
+                else:
+                    break
+
+        return data
+
     async def _fetch_ohlcv(self,
                            ticker: str,
                            freq: str,
                            start_date: str,
                            end_date: str,
                            exch: str,
-                           trials: int = 3
+                           trials: int = 3,
+                           pause: float = 0.1
                            ) -> List:
         """
-        Fetches OHLCV data for a specific ticker.
+        Fetches OHLCV data for a specific ticker, splitting the date range into shards fetched concurrently.
 
         Parameters
         ----------
@@ -347,15 +593,14 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
+        pause: float, default 0.1
+            Number of seconds to wait before retrying a failed request, backing off exponentially after each attempt.
 
         Returns
         -------
         data: list
             List of timestamps with OHLCV data.
         """
-        attempts = 0
-        data = []
-
         # inst exch
         if self.exchange_async is None:
             self.exchange_async = getattr(ccxt_async, exch)()
@@ -363,46 +608,20 @@ class CCXT(Library):
         # fetch data
         if self.exchange_async.has['fetchOHLCV']:
 
-            # while loop to fetch all data
-            while start_date < end_date and attempts < trials:
-
-                try:
-                    data_resp = await getattr(self.exchange_async, 'fetchOHLCV')(
-                        ticker,
-                        freq,
-                        since=start_date,
-                        limit=self.max_obs_per_call,
-                        params={'until': end_date}
-                    )
-
-                except Exception as e:
-                    logging.warning(
-                        f"Failed to get OHLCV data from {self.exchange_async.id} for {ticker} on attempt #{attempts+1}."
-                    )
-                    logging.warning(e)
-                    attempts += 1
-                    if attempts == trials:
-                        logging.warning(
-                            f"Failed to get OHLCV data from {self.exchange_async.id} "
-                            f"for {ticker} after {trials} attempts."
-                        )
-                        return data
-
-                    await asyncio.sleep(self.exchange_async.rateLimit / 1000)
-                    continue
-
-                else:
-                    # check if data resp is empty
-                    if len(data_resp):
-                        # next start date
-                        start_date = data_resp[-1][0] + 1
-                        data.extend(data_resp)
-                        await asyncio.sleep(self.exchange_async.rateLimit / 1000)
+            # fetch shards
+            shards = self.get_time_shards(freq, start_date, end_date)
+            data_resp = await asyncio.gather(
+                *[self._fetch_ohlcv_shard(ticker, freq, shard[0], shard[1], exch, trials=trials,
+                                          pause=pause) for shard in shards]
+            )
 
-                    else:
-                        break
+            # merge shards, dropping overlaps at shard boundaries
+            data = {}
+            for shard_data in data_resp:
+                for row in shard_data:
+                    data.setdefault(row[0], row)
 
-            return data
+            return [data[ts] for ts in sorted(data)]
 
         else:
             logging.warning(f"OHLCV data is not available for {self.exchange_async.id}.")
@@ -415,7 +634,7 @@ class CCXT(Library):
                               end_date: str,
                               exch: str,
                               trials: int = 3,
-                              pause: int = 0.5
+                              pause: float = 0.1
                               ):
         """
         Fetches OHLCV data for a list of tickers.
@@ -434,8 +653,8 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
-        pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+        pause: float, default 0.1
+            Number of seconds to wait before retrying a failed request, backing off exponentially after each attempt.
 
         Returns
         -------
@@ -446,28 +665,17 @@ class CCXT(Library):
         if self.exchange_async is None:
             self.exchange_async = getattr(ccxt_async, exch)()
 
-        data = []
-
-        # create progress bar
-        pbar = tqdm(total=len(tickers), desc="Fetching OHLCV data", unit="ticker")
-
-        # loop through tickers
-        for ticker in tickers:
-            data_resp = await self._fetch_ohlcv(ticker, freq, start_date, end_date, trials=trials, exch=exch)
-            data.append(data_resp)
-            pbar.update(1)
-            await asyncio.sleep(pause)  # pause between ticker requests to respect the rate limit
-
-        await self.exchange_async.close()
-
-        return data
+        return await self._fetch_all(self._fetch_ohlcv, tickers, exch, "Fetching OHLCV data",
+                                     freq=freq, start_date=start_date, end_date=end_date, trials=trials,
+                                     pause=pause)
 
     async def _fetch_funding_rates(self,
                                    ticker: str,
                                    start_date: str,
                                    end_date: str,
                                    exch: str,
-                                   trials: int = 3
+                                   trials: int = 3,
+                                   pause: float = 0.1
                                    ) -> List:
         """
         Fetches funding rates data for a specific ticker.
@@ -482,6 +690,8 @@ class CCXT(Library):
             End date in integers in milliseconds since Unix epoch.
         trials: int, default 3
             Number of attempts to fetch data.
+        pause: float, default 0.1
+            Number of seconds to wait before retrying a failed request, backing off exponentially after each attempt.
 
         Returns
         -------
@@ -497,10 +707,14 @@ class CCXT(Library):
 
         # fetch data
         if self.exchange_async.has['fetchFundingRateHistory']:
+            rate_limiter = self.get_rate_limiter(exch)
 
             # while loop to get all data
             while start_date < end_date and attempts < trials:
 
+                # wait for rate limit
+                await scheduler.acquire_async(rate_limiter)
+
                 try:
                     data_resp = await getattr(self.exchange_async, 'fetchFundingRateHistory')(
                         ticker,
@@ -523,7 +737,9 @@ class CCXT(Library):
                         )
                         return data
 
-                    await asyncio.sleep(self.exchange_async.rateLimit / 1000)
+                    # back off before retrying
+                    retry_policy = RetryPolicy(max_attempts=max(trials or 1, 1), backoff=pause or 0.0)
+                    await asyncio.sleep(retry_policy.get_wait(attempts))
                     continue
 
                 else:
@@ -532,7 +748,6 @@ class CCXT(Library):
                         # next start date
                         start_date = data_resp[-1]['timestamp'] + 1
                         data.extend(data_resp)
-                        await asyncio.sleep(self.exchange_async.rateLimit / 1000)
                     else:
                         break
 
@@ -548,7 +763,7 @@ class CCXT(Library):
                                       end_date: str,
                                       exch: str,
                                       trials: int = 3,
-                                      pause: int = 0.5
+                                      pause: float = 0.1
                                       ):
         """
         Fetches funding rates data for a list of tickers.
@@ -565,8 +780,8 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
-        pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+        pause: float, default 0.1
+            Number of seconds to wait before retrying a failed request, backing off exponentially after each attempt.
 
         Returns
         -------
@@ -577,21 +792,9 @@ class CCXT(Library):
         if self.exchange_async is None:
             self.exchange_async = getattr(ccxt_async, exch)()
 
-        data = []
-
-        # create progress bar
-        pbar = tqdm(total=len(tickers), desc="Fetching funding rates", unit="ticker")
-
-        # loop through tickers
-        for ticker in tickers:
-            data_resp = await self._fetch_funding_rates(ticker, start_date, end_date, trials=trials, exch=exch)
-            data.append(data_resp)
-            pbar.update(1)
-            await asyncio.sleep(pause)  # pause between ticker requests to respect the rate limit
-
-        await self.exchange_async.close()
-
-        return data
+        return await self._fetch_all(self._fetch_funding_rates, tickers, exch, "Fetching funding rates",
+                                     start_date=start_date, end_date=end_date, trials=trials,
+                                     pause=pause)
 
     async def _fetch_open_interest(self,
                                    ticker: str,
@@ -599,7 +802,8 @@ class CCXT(Library):
                                    start_date: str,
                                    end_date: str,
                                    exch: str,
-                                   trials: int = 3
+                                   trials: int = 3,
+                                   pause: float = 0.1
                                    ) -> List:
         """
         Fetches open interest data for a specific ticker.
@@ -618,6 +822,8 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
+        pause: float, default 0.1
+            Number of seconds to wait before retrying a failed request, backing off exponentially after each attempt.
 
         Returns
         -------
@@ -634,10 +840,14 @@ class CCXT(Library):
 
         # fetch data
         if self.exchange_async.has['fetchOpenInterestHistory']:
+            rate_limiter = self.get_rate_limiter(exch)
 
             # while loop to get all data
             while start_date < end_date and attempts < trials:
 
+                # wait for rate limit
+                await scheduler.acquire_async(rate_limiter)
+
                 try:
                     data_resp = await getattr(self.exchange_async, 'fetchOpenInterestHistory')(
                         ticker,
@@ -661,7 +871,9 @@ class CCXT(Library):
                         )
                         return data
 
-                    await asyncio.sleep(self.exchange_async.rateLimit / 1000)
+                    # back off before retrying
+                    retry_policy = RetryPolicy(max_attempts=max(trials or 1, 1), backoff=pause or 0.0)
+                    await asyncio.sleep(retry_policy.get_wait(attempts))
                     continue
 
                 else:
@@ -670,7 +882,6 @@ class CCXT(Library):
                         # next start date
                         start_date = data_resp[-1]['timestamp'] + 1
                         data.extend(data_resp)
-                        await asyncio.sleep(self.exchange_async.rateLimit / 1000)
                     else:
                         break
 
@@ -687,7 +898,7 @@ class CCXT(Library):
                                       end_date: str,
                                       exch: str,
                                       trials: int = 3,
-                                      pause: int = 0.5
+                                      pause: float = 0.1
                                       ):
 
         """
@@ -707,8 +918,8 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
-        pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+        pause: float, default 0.1
+            Number of seconds to wait before retrying a failed request, backing off exponentially after each attempt.
 
         Returns
         -------
@@ -719,21 +930,9 @@ class CCXT(Library):
         if self.exchange_async is None:
             self.exchange_async = getattr(ccxt_async, exch)()
 
-        data = []
-
-        # create progress bar
-        pbar = tqdm(total=len(tickers), desc="Fetching open interest", unit="ticker")
-
-        # loop through tickers
-        for ticker in tickers:
-            data_resp = await self._fetch_open_interest(ticker, freq, start_date, end_date, trials=trials, exch=exch)
-            data.append(data_resp)
-            pbar.update(1)
-            await asyncio.sleep(pause)  # pause between ticker requests to respect the rate limit
-
-        await self.exchange_async.close()
-
-        return data
+        return await self._fetch_all(self._fetch_open_interest, tickers, exch, "Fetching open interest",
+                                     freq=freq, start_date=start_date, end_date=end_date, trials=trials,
+                                     pause=pause)
 
     def convert_params(self, data_req: DataRequest) -> DataRequest:
         """
@@ -3,6 +3,7 @@ from typing import Dict, List, Optional
 import dbnomics
 import pandas as pd
 
+from cryptodatapy.extract.accumulator import Accumulator
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.libraries.library import Library
 from cryptodatapy.transform.convertparams import ConvertParams
@@ -264,8 +265,8 @@ class DBnomics(Library):
         # check params
         self.check_params(data_req)
 
-        # emtpy df
-        df = pd.DataFrame()
+        # ticker dfs
+        dfs = Accumulator()
 
         # get data from dbnomics
         for db_ticker, dr_ticker in zip(db_data_req["tickers"], data_req.tickers):
@@ -280,7 +281,10 @@ class DBnomics(Library):
                 df0["ticker"] = db_ticker
             df0.set_index(["ticker"], append=True, inplace=True)
             # stack ticker dfs
-            df = pd.concat([df, df0])
+            dfs.add(df0)
+
+        # concat ticker dfs
+        df = dfs.to_frame()
 
         # check if df empty
         if df.empty:
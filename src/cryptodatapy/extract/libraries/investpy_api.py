@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Union
 import investpy
 import pandas as pd
 
+from cryptodatapy.extract.accumulator import Accumulator
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.libraries.library import Library
 from cryptodatapy.transform.convertparams import ConvertParams
@@ -425,14 +426,14 @@ class InvestPy(Library):
         ip_data_req = ConvertParams(data_req).to_investpy()
         # remove dup ctys
         ctys = list(set(ip_data_req['ctys']))
-        # ctys df
-        df = pd.DataFrame()
+        # ctys dfs
+        dfs = Accumulator()
 
         for cty in ctys:
             df0 = self.get_econ_calendar(cty)
-            df = pd.concat([df, df0])
+            dfs.add(df0)
 
-        return df
+        return dfs.to_frame()
 
     def get_macro(self, data_req: DataRequest, econ_cal: pd.DataFrame) -> pd.DataFrame:
         """
@@ -453,8 +454,8 @@ class InvestPy(Library):
         # convert data req params to InvestPy format
         ip_data_req = ConvertParams(data_req).to_investpy()
 
-        # emtpy df
-        df = pd.DataFrame()
+        # ticker dfs
+        dfs = Accumulator()
 
         # loop through tickers, countries
         for dr_ticker, ip_ticker, cty in zip(data_req.tickers, ip_data_req["tickers"], ip_data_req["ctys"]):
@@ -467,9 +468,9 @@ class InvestPy(Library):
             df1["ticker"] = dr_ticker
             df1.set_index(["ticker"], append=True, inplace=True)
             # stack ticker dfs
-            df = pd.concat([df, df1])
+            dfs.add(df1)
 
-        return df.sort_index()
+        return dfs.to_frame().sort_index()
 
     def check_params(self, data_req: DataRequest) -> None:
         """
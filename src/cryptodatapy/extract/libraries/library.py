@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import pandas as pd
 
@@ -398,6 +398,24 @@ class Library(ABC):
         """
         # to be implemented by subclasses
 
+    def iter_data(self, data_req: DataRequest) -> Iterator[pd.DataFrame]:
+        """
+        Yields data in tidy format as it is retrieved, e.g. one dataframe per ticker.
+
+        Data sources which don't stream yield the entire data request as a single dataframe.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+
+        Yields
+        ------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1) and values for fields (cols), in tidy format.
+        """
+        yield self.get_data(data_req)
+
     @staticmethod
     @abstractmethod
     def wrangle_data_resp(data_req: DataRequest, data_resp: Union[Dict[str, Any], pd.DataFrame]) \
@@ -6,6 +6,7 @@ import yfinance as yf
 import pandas_datareader.data as web
 from pandas_datareader import wb
 
+from cryptodatapy.extract.accumulator import Accumulator
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.libraries.library import Library
 from cryptodatapy.transform.convertparams import ConvertParams
@@ -270,21 +271,25 @@ class PandasDataReader(Library):
 
             # fama-french
             elif data_req.source == "famafrench":
+                dfs = Accumulator()
                 for ticker in self.data_req.source_tickers:
                     df1 = web.DataReader(ticker,
                                          self.data_req.source,
                                          self.data_req.source_start_date,
                                          self.data_req.source_end_date)
-                    self.data = pd.concat([self.data, df1[0]], axis=1)
+                    dfs.add(df1[0])
+                self.data = dfs.to_frame(axis=1)
 
             # world bank
             elif data_req.source == "wb":
+                dfs = Accumulator()
                 for ticker in self.data_req.source_tickers:
                     df1 = wb.download(indicator=ticker,
                                       country=self.data_req.countries,
                                       start=self.data_req.source_start_date,
                                       end=self.data_req.source_end_date)
-                    self.data = pd.concat([self.data, df1], axis=1)
+                    dfs.add(df1)
+                self.data = dfs.to_frame(axis=1)
 
             # other pdr data
             else:
@@ -0,0 +1,350 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import pandas as pd
+
+# length of rate limit periods in seconds
+periods = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400, 'month': 2592000}
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter shared across threads and coroutines.
+
+    Quotas over longer windows, e.g. calls per day or month, are enforced by stacked buckets, one per window,
+    which must all have a token before a call is made.
+    """
+
+    # monotonic clock, in seconds
+    clock: Callable[[], float] = staticmethod(time.monotonic)
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        windows: Optional[List[Dict[str, Optional[float]]]] = None
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        rate: float
+            Number of tokens (API calls) added to the bucket per second.
+        capacity: float, optional, default None
+            Maximum number of tokens in the bucket, i.e. the burst size. If None, capacity is set to
+            max(rate, 1).
+        windows: list, optional, default None
+            Rate, capacity and tokens of a bucket for each longer quota window, e.g. calls per hour and per day.
+        """
+        self._lock = threading.Lock()
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = self.capacity
+        self.updated = self.clock()
+        self.windows: List[RateLimiter] = []
+        self.set_windows(windows)
+
+    @property
+    def rate(self):
+        """
+        Returns number of tokens added per second.
+        """
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float):
+        """
+        Sets number of tokens added per second.
+        """
+        if not isinstance(rate, (int, float)) or rate <= 0:
+            raise ValueError("Rate must be a positive number of calls per second.")
+        self._rate = float(rate)
+
+    @property
+    def capacity(self):
+        """
+        Returns maximum number of tokens in the bucket.
+        """
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity: Optional[float]):
+        """
+        Sets maximum number of tokens in the bucket.
+        """
+        if capacity is None:
+            self._capacity = max(self.rate, 1.0)
+        elif isinstance(capacity, (int, float)) and capacity >= 1:
+            self._capacity = float(capacity)
+        else:
+            raise ValueError("Capacity must be a number greater than or equal to 1.")
+
+    def set_windows(self, windows: Optional[List[Dict[str, Optional[float]]]]) -> None:
+        """
+        Sets the buckets of longer quota windows, updating existing buckets in place.
+
+        Parameters
+        ----------
+        windows: list, optional
+            Rate, capacity and tokens of a bucket for each window. If None, windows are left unchanged.
+        """
+        if windows is None:
+            return
+
+        if len(windows) == len(self.windows):
+            for window, params in zip(self.windows, windows):
+                window.set_rate(**params)
+        else:
+            self.windows = []
+            for params in windows:
+                window = RateLimiter(rate=params['rate'], capacity=params.get('capacity'))
+                if params.get('tokens') is not None:
+                    window.tokens = min(params['tokens'], window.capacity)
+                self.windows.append(window)
+
+    def set_rate(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        tokens: Optional[float] = None,
+        windows: Optional[List[Dict[str, Optional[float]]]] = None
+    ) -> None:
+        """
+        Updates rate, capacity and, optionally, the number of available tokens and the longer quota windows.
+
+        Parameters
+        ----------
+        rate: float
+            Number of tokens added to the bucket per second.
+        capacity: float, optional, default None
+            Maximum number of tokens in the bucket.
+        tokens: float, optional, default None
+            Number of tokens currently available, e.g. calls left reported by the API.
+        windows: list, optional, default None
+            Rate, capacity and tokens of a bucket for each longer quota window.
+        """
+        with self._lock:
+            self._refill()
+            self.rate = rate
+            self.capacity = capacity
+            if tokens is not None:
+                self.tokens = tokens
+            self.tokens = min(self.tokens, self.capacity)
+        self.set_windows(windows)
+
+    def _refill(self) -> None:
+        """
+        Adds tokens accrued since the last update. Must be called with the lock held.
+        """
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Takes tokens from the bucket and returns how long the caller must wait before using them.
+
+        Tokens are reserved immediately, so concurrent callers queue behind each other instead of
+        all waking up at once.
+
+        Parameters
+        ----------
+        tokens: float, default 1
+            Number of tokens to take.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds to wait before submitting the request.
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= tokens
+            wait = max(-self.tokens / self.rate, 0.0)
+
+        # longer quota windows
+        for window in self.windows:
+            wait = max(wait, window.reserve(tokens))
+
+        return wait
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """
+        Takes tokens from the bucket only if they are available now, without reserving them otherwise.
+
+        Parameters
+        ----------
+        tokens: float, default 1
+            Number of tokens to take.
+
+        Returns
+        -------
+        wait: float
+            0 if tokens were taken, otherwise number of seconds until they are available.
+        """
+        buckets = [self] + self.windows
+        with self._lock:
+            for window in self.windows:
+                window._lock.acquire()
+            try:
+                # wait for the slowest bucket, taking tokens only if all have them
+                for bucket in buckets:
+                    bucket._refill()
+                wait = max(max((tokens - bucket.tokens) / bucket.rate, 0.0) for bucket in buckets)
+                if wait == 0:
+                    for bucket in buckets:
+                        bucket.tokens -= tokens
+            finally:
+                for window in self.windows:
+                    window._lock.release()
+
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Empties the bucket so no tokens are available for a number of seconds, e.g. when the API returns a
+        Retry-After header.
+
+        Parameters
+        ----------
+        seconds: float
+            Number of seconds to pause for.
+        """
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Blocks the calling thread until tokens are available.
+
+        Parameters
+        ----------
+        tokens: float, default 1
+            Number of tokens to take.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """
+        Suspends the calling coroutine until tokens are available.
+
+        Parameters
+        ----------
+        tokens: float, default 1
+            Number of tokens to take.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        return wait
+
+
+def convert_rate_limit(rate_limit: Any) -> Optional[Dict[str, float]]:
+    """
+    Converts a data source rate_limit attribute to token bucket parameters.
+
+    Parameters
+    ----------
+    rate_limit: int, float, dict or pd.DataFrame
+        Rate limit as calls per second, a dict with 'calls' and 'period' (seconds) keys, or a dataframe
+        with calls made and calls left by period (e.g. CryptoCompare rate limit info).
+
+    Returns
+    -------
+    params: dict or None
+        Dictionary with rate, capacity and tokens values, or None if rate limit cannot be converted.
+    """
+    if isinstance(rate_limit, bool) or rate_limit is None:
+        return None
+
+    # calls per second
+    elif isinstance(rate_limit, (int, float)) and rate_limit > 0:
+        return {'rate': float(rate_limit), 'capacity': None, 'tokens': None, 'windows': None}
+
+    # calls per period
+    elif isinstance(rate_limit, dict) and 'calls' in rate_limit:
+        period = rate_limit.get('period', 1)
+        return {'rate': rate_limit['calls'] / period, 'capacity': rate_limit.get('capacity', rate_limit['calls']),
+                'tokens': None, 'windows': None}
+
+    # calls made and left by period, one bucket per period
+    elif isinstance(rate_limit, pd.DataFrame) and {'calls_made', 'calls_left'}.issubset(rate_limit.columns):
+        buckets = []
+        for period, row in rate_limit.iterrows():
+            if period not in periods:
+                continue
+            quota = float(row.calls_made + row.calls_left)
+            if quota > 0:
+                buckets.append((periods[period], {'rate': quota / periods[period], 'capacity': max(quota, 1.0),
+                                                  'tokens': float(row.calls_left)}))
+            if row.calls_left <= 0:
+                logging.warning(f"API rate limit reached for current {period}.")
+        if len(buckets) == 0:
+            return None
+        # refill at the shortest window's quota, enforcing longer windows with stacked buckets
+        buckets = [bucket for _, bucket in sorted(buckets, key=lambda bucket: bucket[0])]
+        return {**buckets[0], 'windows': buckets[1:]}
+
+    else:
+        return None
+
+
+# rate limiters shared by all instances, keyed by data source and api key
+rate_limiters: Dict[Tuple[Hashable, ...], RateLimiter] = {}
+rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(source: str, key: Optional[Hashable] = None, rate: float = 1.0,
+                     capacity: Optional[float] = None, tokens: Optional[float] = None,
+                     windows: Optional[List[Dict[str, Optional[float]]]] = None) -> RateLimiter:
+    """
+    Gets the shared rate limiter for a data source and api key, creating it on first use.
+
+    Parameters
+    ----------
+    source: str
+        Name of data source, e.g. 'cryptocompare', 'glassnode', 'ccxt'.
+    key: hashable, optional, default None
+        Api key or other identifier which shares a quota, e.g. exchange name for CCXT.
+    rate: float, default 1.0
+        Number of calls per second, used when creating the rate limiter.
+    capacity: float, optional, default None
+        Burst size, used when creating the rate limiter.
+    tokens: float, optional, default None
+        Number of calls currently available, used when creating the rate limiter.
+    windows: list, optional, default None
+        Rate, capacity and tokens of a bucket for each longer quota window, used when creating the rate limiter.
+
+    Returns
+    -------
+    rate_limiter: RateLimiter
+        Rate limiter shared by all requests to the data source with the same key.
+    """
+    with rate_limiters_lock:
+        if (source, key) not in rate_limiters:
+            rate_limiter = RateLimiter(rate=rate, capacity=capacity, windows=windows)
+            if tokens is not None:
+                rate_limiter.tokens = min(tokens, rate_limiter.capacity)
+            rate_limiters[(source, key)] = rate_limiter
+
+        return rate_limiters[(source, key)]
@@ -0,0 +1,71 @@
+from importlib import import_module
+from typing import Dict, Type
+
+# data source classes by source name, as 'module:class' import paths resolved on first use
+data_sources = {
+    "cryptocompare": "cryptodatapy.extract.data_vendors.cryptocompare_api:CryptoCompare",
+    "coinmetrics": "cryptodatapy.extract.data_vendors.coinmetrics_api:CoinMetrics",
+    "ccxt": "cryptodatapy.extract.libraries.ccxt_api:CCXT",
+    "glassnode": "cryptodatapy.extract.data_vendors.glassnode_api:Glassnode",
+    "tiingo": "cryptodatapy.extract.data_vendors.tiingo_api:Tiingo",
+    "investpy": "cryptodatapy.extract.libraries.investpy_api:InvestPy",
+    "dbnomics": "cryptodatapy.extract.libraries.dbnomics_api:DBnomics",
+    "yahoo": "cryptodatapy.extract.libraries.pandasdr_api:PandasDataReader",
+    "fred": "cryptodatapy.extract.libraries.pandasdr_api:PandasDataReader",
+    "av-daily": "cryptodatapy.extract.libraries.pandasdr_api:PandasDataReader",
+    "av-forex-daily": "cryptodatapy.extract.libraries.pandasdr_api:PandasDataReader",
+    "famafrench": "cryptodatapy.extract.libraries.pandasdr_api:PandasDataReader",
+    "aqr": "cryptodatapy.extract.web.aqr:AQR",
+}
+
+# resolved data source classes
+resolved: Dict[str, Type] = {}
+
+
+def get_data_source(source: str) -> Type:
+    """
+    Gets the class of a data source, importing its module on first use.
+
+    Parameters
+    ----------
+    source: str
+        Name of data source, e.g. 'cryptocompare', 'glassnode', 'ccxt'.
+
+    Returns
+    -------
+    data_source: type
+        Data source class, e.g. CryptoCompare.
+    """
+    if source not in resolved:
+        if source not in data_sources:
+            raise ValueError(
+                f"{source} is not a supported data source. Select from: {list(data_sources)}."
+            )
+        module, name = data_sources[source].split(":")
+        resolved[source] = getattr(import_module(module), name)
+
+    return resolved[source]
+
+
+def lazy_getattr(package: str, exports: Dict[str, str], name: str):
+    """
+    Resolves a lazily exported package attribute (PEP 562), importing its module on first access.
+
+    Parameters
+    ----------
+    package: str
+        Name of package, e.g. 'cryptodatapy.extract.libraries'.
+    exports: dict
+        Dictionary with exported names as keys and submodule names as values, e.g. {'CCXT': 'ccxt_api'}.
+    name: str
+        Name of attribute.
+
+    Returns
+    -------
+    attr: Any
+        Exported attribute.
+    """
+    if name not in exports:
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return getattr(import_module(f"{package}.{exports[name]}"), name)
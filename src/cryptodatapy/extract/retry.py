@@ -0,0 +1,214 @@
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple, Union
+
+import requests
+
+from cryptodatapy.extract.httpclient import HTTPClient
+
+
+class RetryPolicy:
+    """
+    Retry policy for HTTP requests, with exponential backoff, full jitter and rate limit headers.
+    """
+
+    # status codes which may succeed on a later attempt
+    retry_statuses: Tuple[int, ...] = (408, 425, 429, 500, 502, 503, 504)
+
+    # headers with the number of seconds (or epoch time) until the rate limit resets
+    reset_headers: Tuple[str, ...] = ('X-RateLimit-Reset', 'RateLimit-Reset', 'X-Rate-Limit-Reset')
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.1,
+        multiplier: float = 2.0,
+        max_backoff: float = 60.0,
+        jitter: bool = True,
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        max_attempts: int, default 3
+            Maximum number of attempts, including the first one.
+        backoff: float, default 0.1
+            Number of seconds to wait before the first retry.
+        multiplier: float, default 2.0
+            Factor by which the wait increases after each retry.
+        max_backoff: float, default 60.0
+            Maximum number of seconds to wait between attempts, unless the data source asks for longer.
+        jitter: bool, default True
+            Waits a random time between 0 and the backoff, so clients which failed together don't retry together.
+        """
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise ValueError("Max attempts must be a positive integer.")
+        if backoff < 0 or multiplier < 1 or max_backoff < 0:
+            raise ValueError("Backoff and max backoff must be non-negative and multiplier at least 1.")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Classifies a failed attempt as retryable or fatal.
+
+        Client errors, e.g. bad request (400), unauthorized (401) or not found (404), can't succeed on a later
+        attempt, while rate limits, server errors, timeouts and connection errors may.
+
+        Parameters
+        ----------
+        error: Exception
+            Exception raised by the attempt.
+
+        Returns
+        -------
+        retryable: bool
+            True if the request should be retried.
+        """
+        if isinstance(error, requests.exceptions.HTTPError):
+            return error.response is not None and error.response.status_code in self.retry_statuses
+
+        return isinstance(error, requests.exceptions.RequestException)
+
+    @classmethod
+    def get_retry_after(cls, resp: Optional[requests.Response]) -> Optional[float]:
+        """
+        Gets the number of seconds the data source asks to wait before the next request.
+
+        Parameters
+        ----------
+        resp: requests.Response, optional
+            Response of the failed attempt.
+
+        Returns
+        -------
+        retry_after: float or None
+            Number of seconds to wait, or None if the response has no rate limit headers.
+        """
+        if resp is None:
+            return None
+
+        # seconds or HTTP date
+        retry_after = resp.headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                try:
+                    return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+                except (TypeError, ValueError):
+                    return None
+
+        # rate limit reset, in seconds or epoch time
+        if resp.status_code == 429:
+            for header in cls.reset_headers:
+                try:
+                    reset = float(resp.headers[header])
+                except (KeyError, ValueError):
+                    continue
+                return max(reset - time.time(), 0.0) if reset > 1e9 else max(reset, 0.0)
+
+        return None
+
+    def get_wait(self, attempt: int, resp: Optional[requests.Response] = None) -> float:
+        """
+        Gets the number of seconds to wait before the next attempt.
+
+        Parameters
+        ----------
+        attempt: int
+            Number of attempts made so far.
+        resp: requests.Response, optional, default None
+            Response of the failed attempt, checked for rate limit headers.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds to wait.
+        """
+        backoff = min(self.max_backoff, self.backoff * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+
+        retry_after = self.get_retry_after(resp)
+        if retry_after is not None:
+            return max(retry_after, backoff)
+
+        return backoff
+
+
+class RetryCounter:
+    """
+    Counts retries by host and reason, e.g. ('https://api.glassnode.com', '429'), for instrumentation.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self._lock = threading.Lock()
+        self.counts: Counter = Counter()
+
+    @staticmethod
+    def get_reason(error: Exception) -> str:
+        """
+        Gets the reason of a failed attempt, i.e. the status code for HTTP errors or the exception name.
+        """
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            return str(error.response.status_code)
+
+        return type(error).__name__
+
+    def add(self, url: str, error: Exception) -> None:
+        """
+        Counts a retry.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url of the request.
+        error: Exception
+            Exception raised by the failed attempt.
+        """
+        with self._lock:
+            self.counts[(HTTPClient.get_host(url), self.get_reason(error))] += 1
+
+    def get(self, host: Optional[str] = None, reason: Optional[Union[str, int]] = None) -> int:
+        """
+        Gets the number of retries, optionally for a host and/or reason.
+
+        Parameters
+        ----------
+        host: str, optional, default None
+            Host, e.g. 'https://api.glassnode.com'.
+        reason: str or int, optional, default None
+            Status code or exception name, e.g. 429 or 'ConnectionError'.
+
+        Returns
+        -------
+        count: int
+            Number of retries.
+        """
+        with self._lock:
+            return sum(
+                count for (count_host, count_reason), count in self.counts.items()
+                if (host is None or count_host == host) and (reason is None or count_reason == str(reason))
+            )
+
+    def reset(self) -> None:
+        """
+        Resets the counts.
+        """
+        with self._lock:
+            self.counts.clear()
+
+
+# retries made by all data requests
+retry_counter = RetryCounter()
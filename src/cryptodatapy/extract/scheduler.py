@@ -0,0 +1,260 @@
+import asyncio
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from cryptodatapy.extract.ratelimiter import RateLimiter
+
+# priority classes, dispatched in ascending order
+priorities = {'interactive': 0, 'backfill': 1}
+
+# priority of tasks submitted from the current context
+current_priority: ContextVar[str] = ContextVar('current_priority', default='interactive')
+
+
+class Scheduler:
+    """
+    Dispatches HTTP tasks from all data sources under each data source's rate limiter.
+
+    Tasks are queued by priority class and dispatched to a shared pool of workers as soon as their rate limiter
+    has a token, so a throttled data source doesn't hold up tasks for other data sources.
+    """
+
+    def __init__(self, max_workers: int = 16):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        max_workers: int, default 16
+            Maximum number of tasks running at the same time, across data sources.
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("Max workers must be a positive integer.")
+        self.max_workers = max_workers
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[int, int, Callable, RateLimiter, Future]] = []
+        self._seq = itertools.count()
+        self._running = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._local = threading.local()
+
+    @staticmethod
+    def get_priority(priority: Optional[str] = None) -> int:
+        """
+        Gets the rank of a priority class, defaulting to the priority of the current context.
+
+        Parameters
+        ----------
+        priority: str, {'interactive', 'backfill'}, optional, default None
+            Priority class.
+
+        Returns
+        -------
+        rank: int
+            Rank of priority class, lower ranks are dispatched first.
+        """
+        if priority is None:
+            priority = current_priority.get()
+        if priority not in priorities:
+            raise ValueError(f"Priority must be one of {list(priorities)}.")
+
+        return priorities[priority]
+
+    @staticmethod
+    @contextmanager
+    def priority(priority: Optional[str]) -> Iterator[None]:
+        """
+        Sets the priority class of tasks submitted from the current context, e.g. with scheduler.priority('backfill').
+
+        Parameters
+        ----------
+        priority: str, {'interactive', 'backfill'}, optional
+            Priority class. If None, the current priority is kept.
+        """
+        if priority is None:
+            yield
+            return
+
+        Scheduler.get_priority(priority)
+        token = current_priority.set(priority)
+        try:
+            yield
+        finally:
+            current_priority.reset(token)
+
+    def start(self) -> None:
+        """
+        Starts the worker pool and dispatcher thread, if not already running. Must be called with the lock held.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='cryptodatapy-worker')
+            self._thread = threading.Thread(target=self._dispatch, name='cryptodatapy-scheduler', daemon=True)
+            self._thread.start()
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        rate_limiter: Optional[RateLimiter] = None,
+        priority: Optional[str] = None,
+        **kwargs
+    ) -> Future:
+        """
+        Queues a task.
+
+        Parameters
+        ----------
+        fn: Callable
+            Function to call, e.g. http_client.get.
+        *args
+            Positional arguments of the function.
+        rate_limiter: RateLimiter, optional, default None
+            Rate limiter of the data source. A token is taken before the task is dispatched.
+        priority: str, {'interactive', 'backfill'}, optional, default None
+            Priority class of the task. If None, the priority of the current context is used.
+        **kwargs
+            Keyword arguments of the function.
+
+        Returns
+        -------
+        future: Future
+            Future holding the result of the function.
+        """
+        rank, future = self.get_priority(priority), Future()
+        with self._cond:
+            self.start()
+            self._queue.append((rank, next(self._seq), lambda: fn(*args, **kwargs), rate_limiter, future))
+            self._cond.notify()
+
+        return future
+
+    def run(
+        self,
+        fn: Callable,
+        *args,
+        rate_limiter: Optional[RateLimiter] = None,
+        priority: Optional[str] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Queues a task and waits for its result.
+
+        Tasks run from a worker, i.e. nested tasks, are run directly to avoid waiting on the worker pool.
+
+        Parameters
+        ----------
+        fn: Callable
+            Function to call, e.g. http_client.get.
+        *args
+            Positional arguments of the function.
+        rate_limiter: RateLimiter, optional, default None
+            Rate limiter of the data source.
+        priority: str, {'interactive', 'backfill'}, optional, default None
+            Priority class of the task. If None, the priority of the current context is used.
+        **kwargs
+            Keyword arguments of the function.
+
+        Returns
+        -------
+        result: Any
+            Result of the function.
+        """
+        if getattr(self._local, 'worker', False):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            return fn(*args, **kwargs)
+
+        return self.submit(fn, *args, rate_limiter=rate_limiter, priority=priority, **kwargs).result()
+
+    async def acquire_async(self, rate_limiter: Optional[RateLimiter] = None, priority: Optional[str] = None) -> None:
+        """
+        Suspends the calling coroutine until the scheduler dispatches its turn, for async clients which send
+        requests themselves, e.g. CCXT.
+
+        Parameters
+        ----------
+        rate_limiter: RateLimiter, optional, default None
+            Rate limiter of the data source.
+        priority: str, {'interactive', 'backfill'}, optional, default None
+            Priority class of the request. If None, the priority of the current context is used.
+        """
+        await asyncio.wrap_future(self.submit(lambda: None, rate_limiter=rate_limiter, priority=priority))
+
+    def _next_task(self) -> Tuple[Optional[Tuple], Optional[float]]:
+        """
+        Gets the highest priority task whose rate limiter has a token. Must be called with the lock held.
+
+        Returns
+        -------
+        task, wait: tuple
+            Task to dispatch, or None, and number of seconds until a throttled task can be dispatched, or None.
+        """
+        throttled, wait = set(), None
+
+        for task in sorted(self._queue, key=lambda task: task[:2]):
+            rate_limiter, future = task[3], task[4]
+
+            # drop cancelled tasks
+            if future.cancelled():
+                self._queue.remove(task)
+                continue
+
+            # skip data sources already throttled, keeping their tasks in priority order
+            if rate_limiter is None:
+                return task, None
+            if id(rate_limiter) in throttled:
+                continue
+
+            task_wait = rate_limiter.try_acquire()
+            if task_wait == 0:
+                return task, None
+            throttled.add(id(rate_limiter))
+            wait = task_wait if wait is None else min(wait, task_wait)
+
+        return None, wait
+
+    def _dispatch(self) -> None:
+        """
+        Dispatches queued tasks to the worker pool.
+        """
+        while True:
+            with self._cond:
+                # wait for a task and a free worker
+                while not self._queue or self._running >= self.max_workers:
+                    self._cond.wait()
+
+                task, wait = self._next_task()
+                if task is None:
+                    self._cond.wait(wait)
+                    continue
+
+                self._queue.remove(task)
+                self._running += 1
+
+            self._executor.submit(self._execute, task[2], task[4])
+
+    def _execute(self, fn: Callable, future: Future) -> None:
+        """
+        Runs a task on a worker and sets the result of its future.
+        """
+        self._local.worker = True
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn())
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            self._local.worker = False
+            with self._cond:
+                self._running -= 1
+                self._cond.notify()
+
+
+# scheduler shared by all data sources
+scheduler = Scheduler()
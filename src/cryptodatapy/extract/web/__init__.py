@@ -1,2 +1,15 @@
-from cryptodatapy.extract.web.aqr import AQR
-from cryptodatapy.extract.web.web import Web
\ No newline at end of file
+from cryptodatapy.extract.registry import lazy_getattr
+
+# exports imported on first access, so importing one data source doesn't import the others
+exports = {
+    "AQR": "aqr",
+    "Web": "web",
+}
+
+
+def __getattr__(name):
+    return lazy_getattr(__name__, exports, name)
+
+
+def __dir__():
+    return sorted(list(globals()) + list(exports))
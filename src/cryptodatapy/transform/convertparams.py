@@ -1,11 +1,59 @@
+import copy
 import logging
+import time
+import weakref
 from datetime import datetime, timedelta
-from importlib import resources
-from typing import Dict, List, Union
+from functools import partial, wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 
 from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.util.confcatalog import conf_catalog
+
+# latest converted params by data request and conversion, with the key they were converted for
+conversions: "weakref.WeakKeyDictionary[DataRequest, Dict[str, Tuple[Any, Any]]]" = weakref.WeakKeyDictionary()
+
+
+def memoize(to_source: Optional[Callable] = None, time_relative: bool = False) -> Callable:
+    """
+    Memoizes a data request conversion, so it runs once per data request unless its parameters change.
+
+    Parameters
+    ----------
+    to_source: Callable
+        ConvertParams conversion method, e.g. to_cryptocompare.
+    time_relative: bool, default False
+        Conversion resolves dates relative to the current time, e.g. a missing end date to now. Conversions of
+        requests without an end date, or for minute data, are then also keyed by the current time in seconds, so
+        a long-lived data request doesn't keep the first call's dates.
+
+    Returns
+    -------
+    wrapper: Callable
+        Conversion method which returns a copy of the cached conversion for the data request's fingerprint.
+    """
+    if to_source is None:
+        return partial(memoize, time_relative=time_relative)
+
+    def get_key(data_req: DataRequest) -> Tuple[str, Optional[int]]:
+        if time_relative and (data_req.end_date is None or str(data_req.freq)[-3:] == 'min'):
+            return data_req.fingerprint, int(time.time())
+        return data_req.fingerprint, None
+
+    @wraps(to_source)
+    def wrapper(self):
+        cache = conversions.setdefault(self.data_req, {})
+        key, params = cache.get(to_source.__name__, (None, None))
+
+        if key != get_key(self.data_req):
+            params = to_source(self)
+            # keyed after conversion, which may update the data request, e.g. tickers to source tickers
+            cache[to_source.__name__] = (get_key(self.data_req), params)
+
+        return copy.deepcopy(params)
+
+    return wrapper
 
 
 class ConvertParams:
@@ -24,6 +72,7 @@ class ConvertParams:
         """
         self.data_req = data_req
 
+    @memoize(time_relative=True)
     def to_cryptocompare(self) -> Dict[str, Union[list, str, int, float, None]]:
         """
         Convert tickers from CryptoDataPy to CryptoCompare format.
@@ -56,16 +105,15 @@ class ConvertParams:
         else:
             exch = self.data_req.exch
         # convert start date
-        if self.data_req.freq[-3:] == "min":  # limit to higher frequency data responses
-            start_date = round((datetime.now() - timedelta(days=7)).timestamp())
-        # no start date
-        elif self.data_req.start_date is None:
+        if self.data_req.start_date is None:
             start_date = round(pd.Timestamp("2009-01-03 00:00:00").timestamp())
         else:
             start_date = round(pd.Timestamp(self.data_req.start_date).timestamp())
+        if self.data_req.freq[-3:] == "min":  # limit to higher frequency data responses
+            start_date = max(start_date, round((datetime.now() - timedelta(days=7)).timestamp()))
         # convert end date
         if self.data_req.end_date is None:
-            end_date = round(pd.Timestamp.utcnow()).timestamp()
+            end_date = round(pd.Timestamp.utcnow().timestamp())
         else:
             end_date = round(pd.Timestamp(self.data_req.end_date).timestamp())
         # fields
@@ -101,6 +149,7 @@ class ConvertParams:
             "source_fields": self.data_req.source_fields,
         }
 
+    @memoize
     def to_coinmetrics(self) -> Dict[str, Union[list, str, int, float, None]]:
         """
         Convert tickers from CryptoDataPy to CoinMetrics format.
@@ -255,6 +304,7 @@ class ConvertParams:
             "source_fields": self.data_req.source_fields,
         }
 
+    @memoize
     def to_glassnode(self) -> Dict[str, Union[list, str, int, float, None]]:
         """
         Convert tickers from CryptoDataPy to Glassnode format.
@@ -339,6 +389,7 @@ class ConvertParams:
             "source_fields": self.data_req.source_fields,
         }
 
+    @memoize(time_relative=True)
     def to_tiingo(self) -> Dict[str, Union[list, str, int, float, datetime, None]]:
         """
         Convert tickers from CryptoDataPy to Tiingo format.
@@ -542,9 +593,7 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to DBnomics format.
         """
         # convert tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df, tickers = pd.read_csv(tickers_path, index_col=0, encoding="latin1"), []
+        tickers = []
 
         if self.data_req.source_tickers is not None:
             tickers = self.data_req.source_tickers
@@ -552,7 +601,7 @@ class ConvertParams:
         else:
             for ticker in self.data_req.tickers:
                 try:
-                    tickers.append(tickers_df.loc[ticker, "dbnomics_id"])
+                    tickers.append(conf_catalog.lookup("tickers", ticker, "dbnomics_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for DBnomics source. Check tickers in"
@@ -600,9 +649,7 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to InvestPy format.
         """
         # convert tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df, tickers = pd.read_csv(tickers_path, index_col=0, encoding="latin1"), []
+        tickers = []
 
         if self.data_req.source_tickers is not None:
             tickers = self.data_req.source_tickers
@@ -610,7 +657,7 @@ class ConvertParams:
         else:
             for ticker in self.data_req.tickers:
                 try:
-                    tickers.append(tickers_df.loc[ticker, "investpy_id"])
+                    tickers.append(conf_catalog.lookup("tickers", ticker, "investpy_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for InvestPy data source. Check tickers in "
@@ -632,7 +679,7 @@ class ConvertParams:
         ctys_list = []
         for ticker in self.data_req.tickers:
             try:
-                ctys_list.append(tickers_df.loc[ticker, "country_name"].lower())
+                ctys_list.append(conf_catalog.lookup("tickers", ticker, "country_name").lower())
             except KeyError:
                 logging.warning(
                     f"{ticker} not found for {self.data_req.source} source. Check tickers in "
@@ -686,15 +733,11 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to Fred format.
         """
         # convert tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
-
         if self.data_req.source_tickers is None:
             self.data_req.source_tickers = []
             for ticker in self.data_req.tickers:
                 try:
-                    self.data_req.source_tickers.append(tickers_df.loc[ticker, "fred_id"])
+                    self.data_req.source_tickers.append(conf_catalog.lookup("tickers", ticker, "fred_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for Fred source. Check tickers in"
@@ -732,15 +775,11 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to Yahoo Finance format.
         """
         # tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
-
         if self.data_req.source_tickers is None:
             self.data_req.source_tickers = []
             for ticker in self.data_req.tickers:
                 try:
-                    self.data_req.source_tickers.append(tickers_df.loc[ticker, "wb_id"])
+                    self.data_req.source_tickers.append(conf_catalog.lookup("tickers", ticker, "wb_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for World Bank source. Check tickers in"
@@ -764,7 +803,7 @@ class ConvertParams:
         if self.data_req.cat == "macro":
             for ticker in self.data_req.tickers:
                 try:
-                    ctys_list.append(tickers_df.loc[ticker, "country_id_3"].upper())
+                    ctys_list.append(conf_catalog.lookup("tickers", ticker, "country_id_3").upper())
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for {self.data_req.source} source. Check tickers in "
@@ -795,10 +834,6 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to Yahoo Finance format.
         """
         # tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
-
         if self.data_req.source_tickers is None:
             if self.data_req.cat == 'eqty':
                 self.data_req.source_tickers = [ticker.upper() for ticker in self.data_req.tickers]
@@ -809,7 +844,7 @@ class ConvertParams:
                     self.data_req.tickers = [ticker.upper() for ticker in self.data_req.tickers]
                 for ticker in self.data_req.tickers:
                     try:
-                        self.data_req.source_tickers.append(tickers_df.loc[ticker, "yahoo_id"])
+                        self.data_req.source_tickers.append(conf_catalog.lookup("tickers", ticker, "yahoo_id"))
                     except KeyError:
                         logging.warning(
                             f"{ticker} not found for Yahoo Finance data source. Check tickers in"
@@ -847,15 +882,11 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to Fama-French format.
         """
         # tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
-
         if self.data_req.source_tickers is None:
             self.data_req.source_tickers = []
             for ticker in self.data_req.tickers:
                 try:
-                    self.data_req.source_tickers.append(tickers_df.loc[ticker, "famafrench_id"])
+                    self.data_req.source_tickers.append(conf_catalog.lookup("tickers", ticker, "famafrench_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for Fama-French source. Check tickers in"
@@ -1021,13 +1052,7 @@ class ConvertParams:
             List of fields in data source format.
 
         """
-        # get fields
-        with resources.path("cryptodatapy.conf", "fields.csv") as f:
-            fields_dict_path = f
-        fields_df, fields_list = (
-            pd.read_csv(fields_dict_path, index_col=0, encoding="latin1"),
-            [],
-        )
+        fields_list = []
 
         # when source fields already provided in data req
         if self.data_req.source_fields is not None:
@@ -1037,7 +1062,7 @@ class ConvertParams:
         else:
             for field in self.data_req.fields:
                 try:
-                    fields_list.append(fields_df.loc[field, data_source + "_id"])
+                    fields_list.append(conf_catalog.lookup("fields", field, data_source + "_id"))
                 except KeyError as e:
                     logging.warning(e)
                     logging.warning(
@@ -3,8 +3,6 @@ from typing import Dict, Optional, Union
 import numpy as np
 np.float_ = np.float64
 import pandas as pd
-from prophet import Prophet
-from statsmodels.tsa.seasonal import STL, seasonal_decompose
 
 
 class OutlierDetection:
@@ -438,6 +436,8 @@ class OutlierDetection:
         filtered_df: pd.DataFrame - MultiIndex
             Filtered dataframe with DatetimeIndex (level 0), tickers (level 1) and fields (cols) with outliers removed.
         """
+        # import statsmodels on use, as it is slow to import
+        from statsmodels.tsa.seasonal import seasonal_decompose
         # unstack
         df0 = self.df.unstack().copy()
         # original idx, unstacked idx
@@ -574,6 +574,8 @@ class OutlierDetection:
         filtered_df: pd.DataFrame - MultiIndex
             Filtered dataframe with DatetimeIndex (level 0), tickers (level 1) and fields (cols) with outliers removed.
         """
+        # import statsmodels on use, as it is slow to import
+        from statsmodels.tsa.seasonal import STL
         # unstack
         df0 = self.df.unstack().copy()
         # original idx, unstacked idx
@@ -674,6 +676,8 @@ class OutlierDetection:
         filtered_df: pd.DataFrame - MultiIndex
             Filtered dataframe with DatetimeIndex (level 0), tickers (level 1) and fields (cols) with outliers removed.
         """
+        # import prophet on use, as it is slow to import
+        from prophet import Prophet
         # unstack
         df0 = self.raw_df.unstack().copy()
         # original idx, unstacked idx
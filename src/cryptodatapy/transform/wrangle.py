@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import Union, Dict, List, Optional, Any
-from importlib import resources
+from typing import Union, Dict, List, Optional, Any, Tuple
 
 import pandas as pd
 
+from cryptodatapy.extract.accumulator import Accumulator
 from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.util.confcatalog import conf_catalog
 
 
 class WrangleInfo:
@@ -469,6 +470,9 @@ class WrangleData:
     """
     Wrangles time series data responses from various APIs into tidy data format.
     """
+    # field maps by data source, shared across instances
+    fields_maps: Dict[str, Dict[str, Tuple[int, str]]] = {}
+
     def __init__(self, data_req: DataRequest, data_resp: Union[Dict[str, pd.DataFrame], pd.DataFrame]):
         """
         Constructor
@@ -753,10 +757,12 @@ class WrangleData:
         cols = ["date", "open", "high", "low", "close", "volume"]
 
         # add tickers
+        dfs = Accumulator(columns=cols + ['ticker'])
         for i in range(len(self.data_req.source_markets)):
             df = pd.DataFrame(self.data_resp[i], columns=cols)
             df['ticker'] = self.data_req.source_markets[i]
-            self.tidy_data = pd.concat([self.tidy_data, df])
+            dfs.add(df)
+        self.tidy_data = dfs.to_frame()
 
         # convert to datetime
         self.tidy_data['date'] = pd.to_datetime(self.tidy_data['date'], unit='ms')
@@ -776,9 +782,10 @@ class WrangleData:
             Dataframe with tidy data format.
         """
         # add tickers
+        records = Accumulator()
         for i in range(len(self.data_req.source_markets)):
-            df = pd.DataFrame(self.data_resp[i])
-            self.tidy_data = pd.concat([self.tidy_data, df])
+            records.add(self.data_resp[i])
+        self.tidy_data = records.to_frame()
         self.tidy_data = self.tidy_data[['symbol', 'fundingRate', 'datetime']]
         self.data_resp = self.tidy_data
 
@@ -813,9 +820,10 @@ class WrangleData:
             Dataframe with tidy data format.
         """
         # add tickers
+        records = Accumulator()
         for i in range(len(self.data_req.source_markets)):
-            df = pd.DataFrame(self.data_resp[i])
-            self.tidy_data = pd.concat([self.tidy_data, df])
+            records.add(self.data_resp[i])
+        self.tidy_data = records.to_frame()
         self.tidy_data = self.tidy_data[['symbol', 'openInterestAmount', 'datetime']]
         self.data_resp = self.tidy_data
 
@@ -1005,16 +1013,10 @@ class WrangleData:
 
         """
         # convert tickers to cryptodatapy format
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        tickers_index = conf_catalog.get_reverse_index('tickers', ('country_name', 'wb_id'))
         self.data_resp = self.data_resp.stack().to_frame()  # stack df
         # create list of tickers using tickers csv
-        tickers = []
-        for row in self.data_resp.iterrows():
-            tickers.append(
-                tickers_df[(tickers_df.country_name == row[0][0]) & (tickers_df.wb_id == row[0][2])].index[0])
-        self.data_resp['ticker'] = tickers
+        self.data_resp['ticker'] = [tickers_index[(idx[0], idx[2])] for idx in self.data_resp.index]
         # convert fields
         self.data_resp = self.data_resp.reset_index().rename(columns={0: 'actual', 'year': 'date'})
         # convert date
@@ -1072,8 +1074,8 @@ class WrangleData:
             'US_Rates_Long_ER': 'GOVT_XS',
             'US_Rates_1M_RF': 'Risk Free Rate'
         }
-        # empty df
-        df = pd.DataFrame()
+        # ticker dfs
+        dfs = Accumulator()
         # loop through dfs dict
         for ticker in self.data_resp.keys():
             # keep ticker col and rename col
@@ -1084,10 +1086,10 @@ class WrangleData:
             # resample
             if self.data_req.freq != 'd':
                 df1 = df1.resample(self.data_req.freq).sum()
-            # concat to df
-            df = pd.concat([df, df1], join='outer', axis=1)
+            # add to dfs
+            dfs.add(df1)
         # filter dates
-        self.data_resp = df
+        self.data_resp = dfs.to_frame(join='outer', axis=1)
         self.filter_dates()
         # stack df
         self.data_resp = self.data_resp.stack().to_frame('er')
@@ -1101,6 +1103,31 @@ class WrangleData:
 
         return self.data_resp
 
+    @classmethod
+    def get_fields_map(cls, data_source: str) -> Dict[str, Tuple[int, str]]:
+        """
+        Gets map of data source field ids to CryptoDataPy fields, built once per data source and process.
+
+        Parameters
+        ----------
+        data_source: str
+            Name of data source.
+
+        Returns
+        -------
+        fields_map: dict
+            Dictionary with data source field ids as keys and (row position, CryptoDataPy field) as values.
+        """
+        if data_source not in cls.fields_maps:
+            # first field for each source id
+            fields_map = {}
+            for pos, (field, source_id) in enumerate(conf_catalog.fields[str(data_source) + '_id'].items()):
+                if isinstance(source_id, str) and source_id not in fields_map:
+                    fields_map[source_id] = (pos, field)
+            cls.fields_maps[data_source] = fields_map
+
+        return cls.fields_maps[data_source]
+
     def convert_fields_to_lib(self, data_source: str) -> WrangleData:
         """
         Convert cols/fields from data source data resp to CryptoDataPy format.
@@ -1116,32 +1143,25 @@ class WrangleData:
             WrangleData object with data_resp fields converted to CryptoDataPy format.
 
         """
-        # fields dictionary
-        with resources.path('cryptodatapy.conf', 'fields.csv') as f:
-            fields_dict_path = f
-        # get fields and data resp
-        fields_df = pd.read_csv(fields_dict_path, index_col=0, encoding='latin1').copy()
-        fields_list = fields_df[str(data_source) + '_id'].to_list()
+        # get fields map
+        fields_map = self.get_fields_map(data_source)
+        other_cols = {'index': 'ticker', 'asset': 'ticker', 'level': 'close', 'institution': 'institution'}
+        rename_cols, drop_cols = {}, []
 
-        # loop through data resp cols
+        # map data resp cols
         for col in self.data_resp.columns:
-            # if self.data_req.source_fields is not None and col in self.data_req.source_fields:
-            #     pass
-            if col in fields_list or col.title() in fields_list or col.lower() in fields_list:
-                self.data_resp.rename(columns={col: fields_df[(fields_df[str(data_source) + '_id']
-                                      == col.title()) |
-                                    (fields_df[str(data_source) + '_id'] == col.lower()) |
-                                    (fields_df[str(data_source) + '_id'] == col)].index[0]}, inplace=True)
-            elif col == 'index':
-                self.data_resp.rename(columns={'index': 'ticker'}, inplace=True)  # rename index col
-            elif col == 'asset':
-                self.data_resp.rename(columns={'asset': 'ticker'}, inplace=True)  # rename asset col
-            elif col == 'level':
-                self.data_resp.rename(columns={'level': 'close'}, inplace=True)  # rename level col
-            elif col == 'institution':
-                pass
+            # first field matching col, title or lower case col
+            matches = [fields_map[field_id] for field_id in (col, col.title(), col.lower()) if field_id in fields_map]
+            if matches:
+                rename_cols[col] = min(matches)[1]
+            elif col in other_cols:
+                rename_cols[col] = other_cols[col]
             else:
-                self.data_resp.drop(columns=[col], inplace=True)
+                drop_cols.append(col)
+
+        # rename and drop cols
+        self.data_resp.drop(columns=drop_cols, inplace=True)
+        self.data_resp.rename(columns=rename_cols, inplace=True)
 
         return self
 
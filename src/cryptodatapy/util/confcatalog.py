@@ -0,0 +1,197 @@
+import threading
+from importlib import resources
+from typing import Any, Dict, Hashable, Tuple, Union
+
+import pandas as pd
+
+from cryptodatapy.util.diskcache import disk_cache
+
+
+class ConfCatalog:
+    """
+    Process-wide catalog of the tickers and fields config files, loaded once and indexed for fast lookups.
+    """
+
+    # config files
+    names = ['tickers', 'fields']
+
+    def __init__(self, use_snapshot: bool = True):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        use_snapshot: bool, default True
+            Loads config files from a pickled snapshot in the disk cache, refreshed when the csv file changes.
+        """
+        self.use_snapshot = use_snapshot
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._columns: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._reverse: Dict[Tuple[str, Tuple[str, ...]], Dict[Any, str]] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def tickers(self) -> pd.DataFrame:
+        """
+        Returns tickers metadata, indexed by ticker. Treat as read-only.
+        """
+        return self.get_frame('tickers')
+
+    @property
+    def fields(self) -> pd.DataFrame:
+        """
+        Returns fields metadata, indexed by field. Treat as read-only.
+        """
+        return self.get_frame('fields')
+
+    def load_frame(self, name: str) -> pd.DataFrame:
+        """
+        Loads a config file from its snapshot, or from the csv file if the snapshot is missing or stale.
+
+        Parameters
+        ----------
+        name: str, {'tickers', 'fields'}
+            Name of config file.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with config file.
+        """
+        if name not in self.names:
+            raise ValueError(f"{name} is not a config file. Select from: {self.names}.")
+
+        with resources.path('cryptodatapy.conf', f"{name}.csv") as f:
+            path = f
+        # modification time and size of csv file, to validate snapshot
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        # snapshot
+        if self.use_snapshot:
+            snapshot = disk_cache.get(f"conf_{name}")
+            if snapshot is not None and snapshot[0] == signature:
+                return snapshot[1]
+
+        # csv
+        df = pd.read_csv(path, index_col=0, encoding='latin1')
+        if self.use_snapshot:
+            disk_cache.set(f"conf_{name}", (signature, df))
+
+        return df
+
+    def get_frame(self, name: str) -> pd.DataFrame:
+        """
+        Gets a config file, loading it on first use.
+
+        Parameters
+        ----------
+        name: str, {'tickers', 'fields'}
+            Name of config file.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with config file. Treat as read-only.
+        """
+        if name not in self._frames:
+            with self._lock:
+                if name not in self._frames:
+                    self._frames[name] = self.load_frame(name)
+
+        return self._frames[name]
+
+    def get_column(self, name: str, col: str) -> Dict[str, Any]:
+        """
+        Gets hashed index of a config file column, keyed by ticker or field.
+
+        Parameters
+        ----------
+        name: str, {'tickers', 'fields'}
+            Name of config file.
+        col: str
+            Name of column, e.g. 'fred_id', 'country_name'.
+
+        Returns
+        -------
+        column: dict
+            Dictionary with tickers or fields as keys and column values as values. Duplicated keys map to a series,
+            as with df.loc.
+        """
+        if (name, col) not in self._columns:
+            with self._lock:
+                column = self.get_frame(name)[col]
+                dupes = column.index.duplicated(keep=False)
+                index = column[~dupes].to_dict()
+                for key in column.index[dupes].unique():
+                    index[key] = column.loc[key]
+                self._columns[(name, col)] = index
+
+        return self._columns[(name, col)]
+
+    def lookup(self, name: str, key: str, col: str) -> Any:
+        """
+        Looks up the value of a ticker or field in a config file column.
+
+        Parameters
+        ----------
+        name: str, {'tickers', 'fields'}
+            Name of config file.
+        key: str
+            Ticker or field, e.g. 'US_UE_Rate', 'close'.
+        col: str
+            Name of column, e.g. 'fred_id'.
+
+        Returns
+        -------
+        value: Any
+            Column value, NaN if the ticker or field has no value for the column.
+
+        Raises
+        ------
+        KeyError
+            If the ticker or field or column is not in the config file.
+        """
+        return self.get_column(name, col)[key]
+
+    def get_reverse_index(self, name: str, cols: Union[str, Tuple[str, ...]]) -> Dict[Hashable, str]:
+        """
+        Gets hashed index from column values, e.g. vendor ids, to tickers or fields.
+
+        Parameters
+        ----------
+        name: str, {'tickers', 'fields'}
+            Name of config file.
+        cols: str or tuple
+            Name of column, e.g. 'wb_id', or tuple of columns, e.g. ('country_name', 'wb_id').
+
+        Returns
+        -------
+        reverse_index: dict
+            Dictionary with column values (or tuples of values) as keys and the first matching ticker or field as
+            values. Missing values are excluded.
+        """
+        cols = (cols,) if isinstance(cols, str) else tuple(cols)
+
+        if (name, cols) not in self._reverse:
+            with self._lock:
+                df = self.get_frame(name).loc[:, list(cols)].dropna()
+                reverse_index = {}
+                for key, values in zip(df.index, df.itertuples(index=False, name=None)):
+                    reverse_index.setdefault(values[0] if len(cols) == 1 else values, key)
+                self._reverse[(name, cols)] = reverse_index
+
+        return self._reverse[(name, cols)]
+
+    def clear(self) -> None:
+        """
+        Clears loaded config files and indexes, so they are reloaded on next use.
+        """
+        with self._lock:
+            self._frames.clear()
+            self._columns.clear()
+            self._reverse.clear()
+
+
+# shared config catalog
+conf_catalog = ConfCatalog()
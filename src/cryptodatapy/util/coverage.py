@@ -0,0 +1,183 @@
+import json
+from typing import Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+# date range of open-ended requests, i.e. from inception
+earliest_date = pd.Timestamp.min.ceil('D')
+
+Interval = Tuple[pd.Timestamp, pd.Timestamp]
+
+
+class CoverageIndex:
+    """
+    Date intervals held for each field of a time series, e.g. {'close': [(2018-01-01, 2023-12-31)]}.
+
+    Intervals record the date ranges which were requested from the data source, not the dates of the observations
+    returned, so periods without data, e.g. before an asset was listed, aren't requested again.
+    """
+
+    def __init__(self, intervals: Optional[Dict[str, List[Interval]]] = None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        intervals: dict, optional, default None
+            Dictionary with fields as keys and lists of (start, end) date intervals as values.
+        """
+        self.intervals: Dict[str, List[Interval]] = {}
+        for field, field_intervals in (intervals or {}).items():
+            for start, end in field_intervals:
+                self.add([field], start, end)
+
+    @staticmethod
+    def to_date(date: Union[str, pd.Timestamp]) -> pd.Timestamp:
+        """
+        Converts a date to a tz-naive UTC timestamp, so dates from different sources can be compared.
+        """
+        date = pd.Timestamp(date)
+        if date.tz is not None:
+            date = date.tz_convert(None)
+
+        return date
+
+    @staticmethod
+    def merge_intervals(intervals: List[Interval]) -> List[Interval]:
+        """
+        Merges overlapping or adjacent intervals.
+
+        Parameters
+        ----------
+        intervals: list
+            List of (start, end) date intervals.
+
+        Returns
+        -------
+        intervals: list
+            Sorted list of disjoint (start, end) date intervals.
+        """
+        merged: List[Interval] = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+        return merged
+
+    def add(self, fields: List[str], start: Union[str, pd.Timestamp], end: Union[str, pd.Timestamp]) -> None:
+        """
+        Records a date interval as held for fields.
+
+        Parameters
+        ----------
+        fields: list
+            Fields in CryptoDataPy format.
+        start: str or pd.Timestamp
+            Start date of interval.
+        end: str or pd.Timestamp
+            End date of interval.
+        """
+        start, end = self.to_date(start), self.to_date(end)
+        if start > end:
+            raise ValueError(f"Start date {start} is after end date {end}.")
+
+        for field in fields:
+            self.intervals[field] = self.merge_intervals(self.intervals.get(field, []) + [(start, end)])
+
+    def update(self, other: 'CoverageIndex') -> None:
+        """
+        Records the intervals of another coverage index.
+
+        Parameters
+        ----------
+        other: CoverageIndex
+            Coverage index to merge.
+        """
+        for field, intervals in other.intervals.items():
+            self.intervals[field] = self.merge_intervals(self.intervals.get(field, []) + intervals)
+
+    def get_missing(
+        self, fields: List[str], start: Union[str, pd.Timestamp], end: Union[str, pd.Timestamp]
+    ) -> List[Interval]:
+        """
+        Gets the date ranges missing for any of the fields.
+
+        Missing ranges include the boundary dates of the held intervals next to them, so the last, possibly
+        incomplete, observation is requested again.
+
+        Parameters
+        ----------
+        fields: list
+            Fields in CryptoDataPy format.
+        start: str or pd.Timestamp
+            Start date of requested range.
+        end: str or pd.Timestamp
+            End date of requested range.
+
+        Returns
+        -------
+        missing: list
+            Sorted list of disjoint (start, end) date ranges to request, empty if the range is fully held.
+        """
+        start, end = self.to_date(start), self.to_date(end)
+        missing: List[Interval] = []
+
+        for field in fields:
+            gap_start = start
+            for held_start, held_end in self.intervals.get(field, []):
+                if held_end < gap_start or held_start > end:
+                    continue
+                if held_start > gap_start:
+                    missing.append((gap_start, held_start))
+                gap_start = max(gap_start, held_end)
+            if gap_start < end or (gap_start == start and not self.contains(field, start)):
+                missing.append((gap_start, end))
+
+        return self.merge_intervals(missing)
+
+    def contains(self, field: str, date: pd.Timestamp) -> bool:
+        """
+        Checks whether a date is held for a field.
+        """
+        return any(start <= date <= end for start, end in self.intervals.get(field, []))
+
+    def to_json(self) -> str:
+        """
+        Serializes the coverage index to JSON, with ISO format dates.
+        """
+        return json.dumps({
+            field: [[start.isoformat(), end.isoformat()] for start, end in intervals]
+            for field, intervals in self.intervals.items()
+        })
+
+    @classmethod
+    def from_json(cls, value: Union[str, bytes]) -> 'CoverageIndex':
+        """
+        Deserializes a coverage index from JSON.
+        """
+        return cls({field: [tuple(interval) for interval in intervals] for field, intervals in json.loads(value).items()})
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'CoverageIndex':
+        """
+        Infers a coverage index from the first and last observations of each field.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Dataframe with DatetimeIndex and fields (cols).
+
+        Returns
+        -------
+        coverage: CoverageIndex
+            Coverage index.
+        """
+        coverage = cls()
+        for field in df.columns:
+            dates = df[field].dropna().index
+            if not dates.empty:
+                coverage.add([field], dates.min(), dates.max())
+
+        return coverage
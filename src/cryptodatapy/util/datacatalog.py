@@ -1,11 +1,9 @@
 from dataclasses import dataclass, field
-from importlib import resources
 from typing import Dict, List, Optional, Union
 
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+from cryptodatapy.util.confcatalog import conf_catalog
 
 
 @dataclass
@@ -83,10 +81,8 @@ class DataCatalog:
         tickers_df: pd.DataFrame
             DataFrame with requested tickers metadata.
         """
-        # get tickers csv file
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        # get tickers from config catalog
+        tickers_df = conf_catalog.tickers.copy()
 
         # filter by tickers
         if tickers is not None:
@@ -140,10 +136,8 @@ class DataCatalog:
         tickers_df: pd.DataFrame
             DataFrame with requested tickers metadata.
         """
-        # get tickers csv file
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        # get tickers from config catalog
+        tickers_df = conf_catalog.tickers.copy()
 
         if by_col is None or keyword is None:
             raise ValueError("Provide values to search for 'by_col' and 'keyword' parameters.")
@@ -181,10 +175,8 @@ class DataCatalog:
         fields_df: pd.DataFrame
             DataFrame with requested fields metadata.
         """
-        # get fields csv file
-        with resources.path("cryptodatapy.conf", "fields.csv") as f:
-            fields_path = f
-        fields_df = pd.read_csv(fields_path, index_col=0, encoding="latin1")
+        # get fields from config catalog
+        fields_df = conf_catalog.fields.copy()
 
         # filter by field ids
         if fields is not None:
@@ -223,10 +215,8 @@ class DataCatalog:
         fields_df: pd.DataFrame
             DataFrame with fields metadata.
         """
-        # get fields csv file
-        with resources.path("cryptodatapy.conf", "fields.csv") as f:
-            fields_path = f
-        fields_df = pd.read_csv(fields_path, index_col=0, encoding="latin1")
+        # get fields from config catalog
+        fields_df = conf_catalog.fields.copy()
 
         if by_col is None or keyword is None:
             raise ValueError("Provide values to search for 'by_col' and 'keyword' parameters.")
@@ -256,6 +246,11 @@ class DataCatalog:
         sc: Pd.Dataframe or list
             DataFrame with stablecoin info or list of stablecoin tickers.
         """
+        # import selenium on use, as it is slow to import
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
         # chrome driver
         driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
         # urls
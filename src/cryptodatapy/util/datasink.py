@@ -0,0 +1,111 @@
+import itertools
+import uuid
+from pathlib import Path
+from typing import Iterable, Iterator, List, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+
+class ParquetSink:
+    """
+    Streams dataframes to a partitioned Parquet dataset, one record batch at a time, so data larger than memory can
+    be written and then read lazily, e.g. tick trades and quotes.
+
+    Files are written in hive layout, e.g. path/market=binance-btc-usdt-spot/date=2024-01-01/part-....parquet, and
+    new files are added next to existing ones, so the sink can be written to many times.
+    """
+
+    def __init__(self, path: Union[str, Path], partition_cols: List[str], max_rows_per_group: int = 100000):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        path: str or Path
+            Root directory of the dataset.
+        partition_cols: list
+            Columns to partition files by, e.g. ['market', 'date'].
+        max_rows_per_group: int, default 100,000
+            Maximum number of rows buffered per file before a row group is written.
+        """
+        self.path = Path(path)
+        self.partition_cols = partition_cols
+        self.max_rows_per_group = max_rows_per_group
+
+    @staticmethod
+    def to_batches(dfs: Iterable[pd.DataFrame]) -> Iterator[pa.RecordBatch]:
+        """
+        Converts dataframes to record batches with the schema of the first non-empty dataframe.
+
+        Columns missing from later dataframes are filled with nulls and new columns are dropped, so all batches can
+        be written to the same dataset.
+
+        Parameters
+        ----------
+        dfs: iterable
+            Dataframes to convert.
+
+        Yields
+        ------
+        batch: pa.RecordBatch
+            Record batch of a dataframe.
+        """
+        schema = None
+        for df in dfs:
+            if df is None or df.empty:
+                continue
+            if schema is None:
+                batch = pa.RecordBatch.from_pandas(df, preserve_index=False)
+                schema = batch.schema.remove_metadata()
+                yield batch.replace_schema_metadata()
+            else:
+                yield pa.RecordBatch.from_pandas(df.reindex(columns=schema.names), schema=schema, preserve_index=False)
+
+    def write(self, dfs: Iterable[pd.DataFrame]) -> ds.Dataset:
+        """
+        Writes dataframes to the dataset as they are generated, holding one record batch in memory at a time.
+
+        Parameters
+        ----------
+        dfs: iterable
+            Dataframes to write, e.g. pages of a data response. Must include the partition columns.
+
+        Returns
+        -------
+        dataset: ds.Dataset
+            Lazy handle on the dataset, including previously written files.
+        """
+        batches = self.to_batches(dfs)
+        first = next(batches, None)
+
+        if first is not None:
+            reader = pa.RecordBatchReader.from_batches(first.schema, itertools.chain([first], batches))
+            partitioning = ds.partitioning(
+                pa.schema([first.schema.field(col) for col in self.partition_cols]), flavor='hive'
+            )
+            ds.write_dataset(
+                reader,
+                self.path,
+                format='parquet',
+                partitioning=partitioning,
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior='overwrite_or_ignore',
+                max_rows_per_group=self.max_rows_per_group,
+            )
+
+        return self.to_dataset()
+
+    def to_dataset(self) -> ds.Dataset:
+        """
+        Gets a lazy handle on the dataset, e.g. to filter partitions and columns before loading with to_table().
+
+        Returns
+        -------
+        dataset: ds.Dataset
+            Parquet dataset with partition columns.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        return ds.dataset(self.path, format='parquet', partitioning='hive')
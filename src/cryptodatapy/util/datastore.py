@@ -0,0 +1,507 @@
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import List, Optional, Union
+from urllib.parse import quote, unquote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from cryptodatapy.extract.accumulator import Accumulator
+from cryptodatapy.util.coverage import CoverageIndex, Interval, earliest_date
+
+# parquet schema metadata key of coverage index
+coverage_key = b'cryptodatapy_coverage'
+
+
+class DataStore:
+    """
+    Local Parquet store of time series, partitioned by data source, frequency and ticker, with fields in CryptoDataPy
+    format as columns.
+
+    Each ticker is stored in its own file, which is replaced atomically on write, so readers always see a complete
+    file, even while another process writes to the store. The date ranges held for each field are recorded in the
+    file's schema metadata as a coverage index, written together with the data.
+    """
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        root: str or Path, optional, default None
+            Directory of the store. If None, the 'CRYPTODATAPY_STORE_DIR' environment variable is used, or 'store' in
+            the cache directory ('CRYPTODATAPY_CACHE_DIR' or '~/.cache/cryptodatapy') if it is not set.
+        """
+        if root is None:
+            root = os.environ.get(
+                'CRYPTODATAPY_STORE_DIR',
+                Path(os.environ.get('CRYPTODATAPY_CACHE_DIR', Path.home() / '.cache' / 'cryptodatapy')) / 'store'
+            )
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    def get_path(self, source: str, freq: str, ticker: str) -> Path:
+        """
+        Gets the file path of a ticker's time series.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source, e.g. 'glassnode'.
+        freq: str
+            Frequency of time series, e.g. 'd'.
+        ticker: str
+            Ticker, e.g. 'BTC'.
+
+        Returns
+        -------
+        path: Path
+            Path of Parquet file.
+        """
+        return self.root / quote(source, safe='') / quote(freq, safe='') / f"{quote(ticker, safe='')}.parquet"
+
+    def get_tickers(self, source: str, freq: str) -> List[str]:
+        """
+        Gets tickers held in the store for a data source and frequency.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of time series.
+
+        Returns
+        -------
+        tickers: list
+            List of stored tickers.
+        """
+        path = self.root / quote(source, safe='') / quote(freq, safe='')
+        if not path.exists():
+            return []
+
+        return sorted(unquote(file.stem) for file in path.glob('*.parquet'))
+
+    def find_ticker(self, source: str, freq: str, ticker: str) -> Optional[str]:
+        """
+        Finds the stored name of a ticker, ignoring case, e.g. 'BTC' for 'btc'.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of time series.
+        ticker: str
+            Ticker in data request.
+
+        Returns
+        -------
+        ticker: str
+            Stored ticker, or None if the ticker isn't stored.
+        """
+        if self.get_path(source, freq, ticker).exists():
+            return ticker
+
+        for stored_ticker in self.get_tickers(source, freq):
+            if stored_ticker.lower() == ticker.lower():
+                return stored_ticker
+
+        return None
+
+    def read_ticker(self, source: str, freq: str, ticker: str) -> Optional[pd.DataFrame]:
+        """
+        Reads a ticker's time series.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of time series.
+        ticker: str
+            Stored ticker.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with DatetimeIndex and fields (cols), or None if the ticker isn't stored or can't be read.
+        """
+        path = self.get_path(source, freq, ticker)
+        if not path.exists():
+            return None
+
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            logging.warning(f"Failed to read {ticker} from data store: {e}")
+            return None
+
+    def get_last_date(self, source: str, freq: str, ticker: str) -> Optional[pd.Timestamp]:
+        """
+        Gets the last stored timestamp of a ticker, reading the date index only.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of time series.
+        ticker: str
+            Ticker. Matched to stored tickers ignoring case.
+
+        Returns
+        -------
+        last_date: pd.Timestamp
+            Last stored timestamp, or None if the ticker isn't stored.
+        """
+        stored_ticker = self.find_ticker(source, freq, ticker)
+        if stored_ticker is None:
+            return None
+
+        try:
+            dates = pd.read_parquet(self.get_path(source, freq, stored_ticker), columns=[]).index
+        except Exception as e:
+            logging.warning(f"Failed to read {ticker} from data store: {e}")
+            return None
+
+        return None if dates.empty else dates.max()
+
+    def read(
+        self,
+        source: str,
+        freq: str,
+        tickers: List[str],
+        fields: Optional[List[str]] = None,
+        start_date: Optional[Union[str, pd.Timestamp]] = None,
+        end_date: Optional[Union[str, pd.Timestamp]] = None,
+    ) -> pd.DataFrame:
+        """
+        Reads time series from the store.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of time series.
+        tickers: list
+            Tickers to read. Matched to stored tickers ignoring case.
+        fields: list, optional, default None
+            Fields to read. If None, all stored fields are read.
+        start_date: str or pd.Timestamp, optional, default None
+            Start date of time series.
+        end_date: str or pd.Timestamp, optional, default None
+            End date of time series.
+
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            Dataframe with DatetimeIndex (level 0), ticker (level 1) and fields (cols), empty if nothing is stored.
+        """
+        dfs = Accumulator()
+
+        for ticker in tickers:
+            stored_ticker = self.find_ticker(source, freq, ticker)
+            df = None if stored_ticker is None else self.read_ticker(source, freq, stored_ticker)
+            if df is None:
+                continue
+            # filter fields and dates
+            if fields is not None:
+                df = df.loc[:, [field for field in fields if field in df.columns]]
+            if start_date is not None:
+                df = df[df.index >= self.to_index_tz(start_date, df.index)]
+            if end_date is not None:
+                df = df[df.index <= self.to_index_tz(end_date, df.index)]
+            dfs.add(pd.concat({stored_ticker: df}, names=['ticker']).swaplevel(0, 1))
+
+        df = dfs.to_frame()
+        if df.empty:
+            return df
+
+        return df.sort_index()
+
+    @staticmethod
+    def to_index_tz(date: Union[str, pd.Timestamp], index: pd.DatetimeIndex) -> pd.Timestamp:
+        """
+        Converts a date to the time zone of a DatetimeIndex, so they can be compared.
+
+        Parameters
+        ----------
+        date: str or pd.Timestamp
+            Date to convert.
+        index: pd.DatetimeIndex
+            Index with time zone to convert to, or tz-naive.
+
+        Returns
+        -------
+        date: pd.Timestamp
+            Converted date.
+        """
+        date = pd.Timestamp(date)
+        if index.tz is None and date.tz is not None:
+            return date.tz_convert(None)
+        elif index.tz is not None and date.tz is None:
+            return date.tz_localize(index.tz)
+
+        return date
+
+    def write(
+        self,
+        source: str,
+        freq: str,
+        df: pd.DataFrame,
+        coverage: Optional[CoverageIndex] = None,
+        tickers: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Writes time series to the store, merged with stored time series. New values replace stored values.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of time series.
+        df: pd.DataFrame - MultiIndex
+            Dataframe with DatetimeIndex (level 0), ticker (level 1) and fields (cols).
+        coverage: CoverageIndex, optional, default None
+            Date ranges requested for each ticker. If None, the ranges are inferred from the first and last
+            observations.
+        tickers: list, optional, default None
+            Requested tickers. The coverage of tickers without observations in the dataframe, e.g. before an asset
+            was listed, is recorded too, in an empty file if the ticker isn't stored, so their date ranges aren't
+            requested again.
+        """
+        if df is None:
+            return
+        if not df.empty and not isinstance(df.index, pd.MultiIndex):
+            raise TypeError("Dataframe must have a MultiIndex with date (level 0) and ticker (level 1).")
+
+        written = []
+        if not df.empty:
+            for ticker, df_ticker in df.groupby(level=1):
+                self.write_ticker(source, freq, str(ticker), df_ticker.droplevel(1), coverage=coverage)
+                written.append(str(ticker).lower())
+
+        # record coverage of tickers without observations
+        if coverage is None or tickers is None:
+            return
+        for ticker in tickers:
+            if ticker.lower() not in written:
+                stored_ticker = self.find_ticker(source, freq, ticker) or ticker
+                self.write_ticker(source, freq, stored_ticker, pd.DataFrame(), coverage=coverage)
+
+    def write_ticker(
+        self, source: str, freq: str, ticker: str, df: pd.DataFrame, coverage: Optional[CoverageIndex] = None
+    ) -> None:
+        """
+        Writes a ticker's time series to the store, merged with its stored time series. A ticker stored under a
+        different case, e.g. 'ada' for 'ADA', is merged and renamed.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of time series.
+        ticker: str
+            Ticker.
+        df: pd.DataFrame
+            Dataframe with DatetimeIndex and fields (cols).
+        coverage: CoverageIndex, optional, default None
+            Date ranges requested. If None, the ranges are inferred from the first and last observations.
+        """
+        path = self.get_path(source, freq, ticker)
+        if coverage is None:
+            new_coverage = CoverageIndex.from_frame(df)
+        else:
+            # fields missing from observations weren't returned by the data source
+            new_coverage = CoverageIndex({
+                field: intervals for field, intervals in coverage.intervals.items() if df.empty or field in df.columns
+            })
+
+        with self._lock:
+            # merge with stored data and coverage
+            stored_ticker = self.find_ticker(source, freq, ticker) or ticker
+            stored_df = self.read_ticker(source, freq, stored_ticker)
+            coverage = self.get_coverage(source, freq, stored_ticker) if stored_df is not None else CoverageIndex()
+            coverage.update(new_coverage)
+            if stored_df is not None and not stored_df.empty:
+                df = stored_df if df.empty else df.combine_first(stored_df)
+            # tickers without observations are stored with an empty date index
+            if df.empty and not isinstance(df.index, pd.DatetimeIndex):
+                df.index = pd.DatetimeIndex([])
+            df = df[~df.index.duplicated(keep='last')].sort_index()
+            df.index.name = 'date'
+            table = pa.Table.from_pandas(df)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), coverage_key: coverage.to_json().encode()}
+            )
+
+            # write to temp file and rename, so readers never see a partial file
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{uuid.uuid4().hex}.tmp")
+            try:
+                pq.write_table(table, tmp_path)
+                os.replace(tmp_path, path)
+                if stored_ticker != ticker:
+                    self.get_path(source, freq, stored_ticker).unlink(missing_ok=True)
+            except Exception as e:
+                tmp_path.unlink(missing_ok=True)
+                logging.warning(f"Failed to write {ticker} to data store: {e}")
+
+    def delete(self, source: str, freq: Optional[str] = None, ticker: Optional[str] = None) -> None:
+        """
+        Removes time series from the store.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str, optional, default None
+            Frequency of time series. If None, all frequencies are removed.
+        ticker: str, optional, default None
+            Ticker. If None, all tickers are removed.
+        """
+        path = self.root / quote(source, safe='')
+        if freq is not None:
+            path = path / quote(freq, safe='')
+        pattern = '*.parquet' if ticker is None else f"{quote(ticker, safe='')}.parquet"
+
+        with self._lock:
+            for file in path.rglob(pattern) if path.exists() else []:
+                file.unlink(missing_ok=True)
+
+    def get_coverage(self, source: str, freq: str, ticker: str) -> CoverageIndex:
+        """
+        Gets the coverage index of a ticker, i.e. the date ranges held for each field.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of time series.
+        ticker: str
+            Stored ticker.
+
+        Returns
+        -------
+        coverage: CoverageIndex
+            Coverage index, empty if the ticker isn't stored. Inferred from the data for files written without one.
+        """
+        path = self.get_path(source, freq, ticker)
+        if not path.exists():
+            return CoverageIndex()
+
+        try:
+            metadata = pq.read_schema(path).metadata or {}
+            if coverage_key in metadata:
+                return CoverageIndex.from_json(metadata[coverage_key])
+        except Exception as e:
+            logging.warning(f"Failed to read coverage of {ticker} from data store: {e}")
+
+        df = self.read_ticker(source, freq, ticker)
+
+        return CoverageIndex() if df is None else CoverageIndex.from_frame(df)
+
+    @staticmethod
+    def get_date_range(
+        start_date: Optional[Union[str, pd.Timestamp]], end_date: Optional[Union[str, pd.Timestamp]]
+    ) -> Interval:
+        """
+        Gets the date range of a request, with open-ended dates set to inception and now.
+
+        Parameters
+        ----------
+        start_date: str or pd.Timestamp, optional
+            Start date of time series. If None, from inception.
+        end_date: str or pd.Timestamp, optional
+            End date of time series. If None, until now.
+
+        Returns
+        -------
+        date_range: tuple
+            Start and end dates, tz-naive UTC.
+        """
+        start = earliest_date if start_date is None else CoverageIndex.to_date(start_date)
+        end = pd.Timestamp.utcnow().tz_convert(None) if end_date is None else CoverageIndex.to_date(end_date)
+
+        return start, end
+
+    def get_missing(
+        self,
+        source: str,
+        freq: str,
+        ticker: str,
+        fields: List[str],
+        start_date: Optional[Union[str, pd.Timestamp]],
+        end_date: Optional[Union[str, pd.Timestamp]],
+    ) -> List[Interval]:
+        """
+        Gets the date ranges of a ticker's fields missing from the store.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of time series.
+        ticker: str
+            Ticker. Matched to stored tickers ignoring case.
+        fields: list
+            Fields in CryptoDataPy format.
+        start_date: str or pd.Timestamp, optional
+            Start date of time series. If None, from inception.
+        end_date: str or pd.Timestamp, optional
+            End date of time series. If None, until now.
+
+        Returns
+        -------
+        missing: list
+            Sorted list of (start, end) date ranges to request, empty if the store holds all fields and dates.
+        """
+        stored_ticker = self.find_ticker(source, freq, ticker)
+        coverage = CoverageIndex() if stored_ticker is None else self.get_coverage(source, freq, stored_ticker)
+
+        return coverage.get_missing(fields, *self.get_date_range(start_date, end_date))
+
+    def covers(
+        self,
+        source: str,
+        freq: str,
+        ticker: str,
+        fields: List[str],
+        start_date: Optional[Union[str, pd.Timestamp]],
+        end_date: Optional[Union[str, pd.Timestamp]],
+    ) -> bool:
+        """
+        Checks whether the store holds a ticker's fields over a date range.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of time series.
+        ticker: str
+            Ticker. Matched to stored tickers ignoring case.
+        fields: list
+            Fields in CryptoDataPy format.
+        start_date: str or pd.Timestamp, optional
+            Start date of time series. If None, from inception.
+        end_date: str or pd.Timestamp, optional
+            End date of time series. If None, until now.
+
+        Returns
+        -------
+        covers: bool
+            True if all fields and dates are stored.
+        """
+        return not self.get_missing(source, freq, ticker, fields, start_date, end_date)
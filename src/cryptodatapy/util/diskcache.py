@@ -0,0 +1,172 @@
+import logging
+import os
+import pickle
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+class DiskCache:
+    """
+    Persistent key-value cache which pickles values to disk, with a time-to-live and an in-memory layer.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        ttl: Optional[float] = 86400,
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        cache_dir: str or Path, optional, default None
+            Directory where cached values are stored. If None, the 'CRYPTODATAPY_CACHE_DIR' environment variable
+            is used, or '~/.cache/cryptodatapy' if it is not set.
+        ttl: float, optional, default 86,400
+            Time-to-live of cached values in seconds, e.g. 86,400 for one day. If None, values never expire.
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get('CRYPTODATAPY_CACHE_DIR', Path.home() / '.cache' / 'cryptodatapy')
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self._memory: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_path(self, key: str) -> Path:
+        """
+        Gets the file path of a cache key.
+
+        Parameters
+        ----------
+        key: str
+            Cache key, e.g. 'cryptocompare_assets'.
+
+        Returns
+        -------
+        path: Path
+            Path of pickle file for key.
+        """
+        return self.cache_dir / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', key)}.pkl"
+
+    def is_expired(self, timestamp: float, ttl: Optional[float] = None) -> bool:
+        """
+        Checks whether a value stored at timestamp has expired.
+
+        Parameters
+        ----------
+        timestamp: float
+            Time at which the value was stored, in seconds since epoch.
+        ttl: float, optional, default None
+            Time-to-live in seconds. If None, the cache's ttl is used.
+
+        Returns
+        -------
+        expired: bool
+            True if the value is older than its time-to-live.
+        """
+        ttl = self.ttl if ttl is None else ttl
+
+        return ttl is not None and time.time() - timestamp > ttl
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        Gets a value from the cache.
+
+        Parameters
+        ----------
+        key: str
+            Cache key.
+        ttl: float, optional, default None
+            Time-to-live in seconds. If None, the cache's ttl is used.
+
+        Returns
+        -------
+        value: Any
+            Cached value, or None if the key is missing, expired or unreadable.
+        """
+        with self._lock:
+            # memory
+            if key in self._memory:
+                timestamp, value = self._memory[key]
+                if not self.is_expired(timestamp, ttl):
+                    return value
+
+            # disk
+            path = self.get_path(key)
+            if not path.exists():
+                return None
+            try:
+                with open(path, 'rb') as f:
+                    timestamp, value = pickle.load(f)
+            except Exception as e:
+                logging.warning(f"Failed to read {key} from cache: {e}")
+                return None
+
+            if self.is_expired(timestamp, ttl):
+                return None
+            self._memory[key] = (timestamp, value)
+
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores a value in the cache.
+
+        Parameters
+        ----------
+        key: str
+            Cache key.
+        value: Any
+            Picklable value to store.
+        """
+        timestamp = time.time()
+
+        with self._lock:
+            self._memory[key] = (timestamp, value)
+            path = self.get_path(key)
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                # write to temp file and rename, so readers never see a partial file
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump((timestamp, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logging.warning(f"Failed to write {key} to cache: {e}")
+
+    def delete(self, key: str) -> None:
+        """
+        Removes a value from the cache.
+
+        Parameters
+        ----------
+        key: str
+            Cache key.
+        """
+        with self._lock:
+            self._memory.pop(key, None)
+            self.get_path(key).unlink(missing_ok=True)
+
+    def clear(self, prefix: str = '') -> None:
+        """
+        Removes all values whose key starts with prefix from the cache.
+
+        Parameters
+        ----------
+        prefix: str, default ''
+            Key prefix, e.g. 'cryptocompare_'. If empty, the entire cache is cleared.
+        """
+        with self._lock:
+            for key in [key for key in self._memory if key.startswith(prefix)]:
+                del self._memory[key]
+            if self.cache_dir.exists():
+                for path in self.cache_dir.glob(f"{prefix}*.pkl"):
+                    path.unlink(missing_ok=True)
+
+
+# shared disk cache used for metadata
+disk_cache = DiskCache()
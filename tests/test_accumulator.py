@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from cryptodatapy.extract.accumulator import Accumulator
+
+
+def test_records() -> None:
+    """
+    Test pages of records are materialised into a single dataframe.
+    """
+    dfs = Accumulator(columns=['date', 'close'])
+    dfs.add([[1, 10.0], [2, 11.0]])
+    dfs.add(None)
+    dfs.add([[3, 12.0]])
+    df = dfs.to_frame()
+    assert list(df.columns) == ['date', 'close']
+    assert df.date.tolist() == [1, 2, 3]
+
+
+def test_frames() -> None:
+    """
+    Test dataframe pages are concatenated once, in order, and empty pages are skipped.
+    """
+    dfs = Accumulator()
+    dfs.add(pd.DataFrame({'close': [1.0]}, index=[0]))
+    dfs.add(pd.DataFrame())
+    dfs.add(pd.DataFrame({'close': [2.0]}, index=[1]))
+    assert len(dfs) == 2
+    assert dfs.to_frame().close.tolist() == [1.0, 2.0]
+
+    dfs = Accumulator()
+    dfs.add(pd.Series([1.0, 2.0], name='BTC'))
+    dfs.add(pd.Series([3.0], name='ETH'))
+    df = dfs.to_frame(axis=1)
+    assert list(df.columns) == ['BTC', 'ETH']
+    assert df.shape == (2, 2)
+
+
+def test_empty() -> None:
+    """
+    Test empty accumulator returns empty dataframe with columns.
+    """
+    dfs = Accumulator(columns=['date', 'close'])
+    assert dfs.empty
+    df = dfs.to_frame()
+    assert df.empty and list(df.columns) == ['date', 'close']
+    with pytest.raises(TypeError):
+        dfs.add('BTC')
+
+
+if __name__ == "__main__":
+    pytest.main()
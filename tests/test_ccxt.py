@@ -1,3 +1,5 @@
+import asyncio
+
 import pandas as pd
 import pytest
 from unittest.mock import AsyncMock, Mock
@@ -7,6 +9,8 @@ import ccxt.async_support as ccxt_async
 from cryptodatapy.transform import ConvertParams
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.libraries.ccxt_api import CCXT
+from cryptodatapy.extract.retry import RetryPolicy
+from cryptodatapy.util.diskcache import disk_cache
 
 
 class TestCCXT:
@@ -178,6 +182,122 @@ class TestCCXT:
         assert data[2]['timestamp'] == 1725149700000
         assert data[0]['datetime'] == '2024-09-01T00:05:00.000Z'
 
+    def test_load_markets_cache(self, tmp_path, monkeypatch):
+        """
+        Test markets are loaded once, cached to disk and shared with the async exchange.
+        """
+        monkeypatch.setattr(disk_cache, 'cache_dir', tmp_path)
+        monkeypatch.setattr(disk_cache, '_memory', {})
+        markets = [{'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC',
+                    'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True, 'precision': {}, 'limits': {},
+                    'info': {}}]
+        calls = []
+
+        def load_markets(exchange, reload=False, params={}):
+            calls.append(exchange.id)
+            return exchange.set_markets(markets)
+
+        monkeypatch.setattr(ccxt.binance, 'load_markets', load_markets)
+
+        self.ccxt_instance.exchange = ccxt.binance()
+        self.ccxt_instance.exchange_async = ccxt_async.binance()
+        assert 'BTC/USDT' in self.ccxt_instance.load_markets('binance')
+        assert 'BTC/USDT' in self.ccxt_instance.exchange_async.markets
+        assert len(calls) == 1
+
+        # new instance, e.g. in another process, reads markets from disk
+        ccxt_instance = CCXT()
+        ccxt_instance.exchange = ccxt.binance()
+        ccxt_instance.exchange_async = ccxt_async.binance()
+        monkeypatch.setattr(disk_cache, '_memory', {})
+        assert 'BTC/USDT' in ccxt_instance.load_markets('binance')
+        assert 'BTC/USDT' in ccxt_instance.exchange_async.markets
+        assert len(calls) == 1
+
+    def test_get_time_shards(self):
+        """
+        Test date range is split into contiguous shards spanning whole calls.
+        """
+        self.ccxt_instance.max_obs_per_call = 10
+        hour = 3600 * 1000
+        start = 1625097600000
+
+        shards = self.ccxt_instance.get_time_shards('1h', start, start + 95 * hour)
+
+        assert len(shards) == self.ccxt_instance.max_concurrency
+        assert shards[0] == [start, start + 10 * hour]
+        assert shards[-1] == [start + 90 * hour, start + 95 * hour]
+        assert all(shards[i][1] == shards[i + 1][0] for i in range(len(shards) - 1))
+        assert self.ccxt_instance.get_time_shards('1h', start, start + hour) == [[start, start + hour]]
+
+    @pytest.mark.asyncio
+    async def test_fetch_ohlcv_shards(self):
+        """
+        Test shards are fetched and merged without duplicates at shard boundaries.
+        """
+        self.ccxt_instance.max_obs_per_call = 10
+        self.ccxt_instance.exchange_async.rateLimit = 1
+        hour = 3600 * 1000
+        start, end = 1625097600000, 1625097600000 + 100 * hour
+
+        async def fetch_ohlcv(ticker, freq, since=None, limit=None, params=None):
+            # bars open on the hour and until is inclusive, so shards overlap at their boundaries
+            first = since + (-since) % hour
+            stop = min(first + limit * hour, params['until'] + 1)
+            return [[ts, 1.0, 1.0, 1.0, 1.0, 1.0] for ts in range(first, stop, hour)]
+
+        self.ccxt_instance.exchange_async.fetchOHLCV.side_effect = fetch_ohlcv
+
+        data = await self.ccxt_instance._fetch_ohlcv('BTC/USDT', '1h', start, end, exch='kraken')
+
+        assert [row[0] for row in data] == list(range(start, end + 1, hour))
+        assert self.ccxt_instance.exchange_async.fetchOHLCV.call_count > 10
+
+    @pytest.mark.asyncio
+    async def test_fetch_ohlcv_retry_pause(self, monkeypatch):
+        """
+        Test failed requests are retried after backing off from the data request pause.
+        """
+        self.ccxt_instance.exchange_async.rateLimit = 50
+        ohlcv = self.ccxt_instance.exchange_async.fetchOHLCV.return_value
+        self.ccxt_instance.exchange_async.fetchOHLCV.side_effect = [ccxt.NetworkError('timeout'), ohlcv, []]
+        waits = []
+        monkeypatch.setattr(RetryPolicy, 'get_wait', lambda policy, attempt, resp=None: waits.append(
+            (policy.backoff, attempt)) or 0)
+
+        data = await self.ccxt_instance._fetch_ohlcv_shard('BTC/USDT', '1h', ohlcv[0][0], ohlcv[-1][0], 'bybit',
+                                                           trials=3, pause=2.0)
+
+        assert data == ohlcv
+        assert waits == [(2.0, 1)]
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_ohlcv_concurrent(self):
+        """
+        Test tickers are fetched concurrently and returned in order.
+        """
+        self.ccxt_instance.exchange_async.rateLimit = 50
+        ohlcv = self.ccxt_instance.exchange_async.fetchOHLCV.return_value
+        active, peak = 0, 0
+
+        async def fetch_ohlcv(ticker, freq, since=None, limit=None, params=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.1)
+            active -= 1
+            return [[ohlcv[0][0]] + [ticker]]
+
+        self.ccxt_instance.exchange_async.fetchOHLCV.side_effect = fetch_ohlcv
+        tickers = [f"{ticker}/USDT" for ticker in ['BTC', 'ETH', 'SOL', 'XRP', 'ADA']]
+
+        data = await self.ccxt_instance.fetch_all_ohlcv(
+            tickers, '1h', start_date=1625097600000, end_date=1625097660000, exch='bybit'
+        )
+
+        assert [resp[0][1] for resp in data] == tickers
+        assert 1 < peak <= self.ccxt_instance.max_concurrency
+
     @pytest.mark.asyncio
     async def test_fetch_tidy_ohlcv(self, exch='binance'):
         """
@@ -1,10 +1,14 @@
 from datetime import datetime
 import pandas as pd
+import pyarrow.dataset as ds
 import pytest
+import threading
 from time import sleep
 
+from cryptodatapy.extract.data_vendors import coinmetrics_api
 from cryptodatapy.extract.data_vendors.coinmetrics_api import CoinMetrics
 from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.util.diskcache import DiskCache
 
 
 @pytest.fixture
@@ -189,6 +193,129 @@ class TestCoinMetrics:
         # shape
         assert df.shape[1] == 10, "Dataframe should have 10 columns."
 
+    def test_iter_pages(self, monkeypatch):
+        """
+        Test iter_pages yields each page, following next page urls.
+        """
+        pages = {
+            self.cm.base_url + '/timeseries/market-candles': {
+                'data': [{'market': 'a', 'time': '2020-01-01'}], 'next_page_url': 'page2'
+            },
+            'page2': {'data': [{'market': 'a', 'time': '2020-01-02'}]},
+        }
+        monkeypatch.setattr(DataRequest, 'get_req', lambda self, url, params, **kwargs: pages.get(url))
+
+        dfs = list(self.cm.iter_pages('/timeseries/market-candles', params={'markets': 'a'}))
+        assert [df.time.iloc[0] for df in dfs] == ['2020-01-01', '2020-01-02']
+        df = self.cm.req_data('/timeseries/market-candles', params={'markets': 'a'})
+        assert df.shape == (2, 2) and isinstance(df.index, pd.RangeIndex)
+
+    def test_catalog_cache(self, monkeypatch, tmp_path):
+        """
+        Test catalog lookups are served from the cached, indexed metadata until it expires.
+        """
+        calls = []
+
+        class Client:
+            def catalog_assets(self):
+                calls.append('catalog_assets')
+                return [{'asset': 'btc', 'metrics': []}, {'asset': 'eth', 'metrics': []}]
+
+        monkeypatch.setattr(coinmetrics_api, 'client', Client())
+        monkeypatch.setattr(coinmetrics_api, 'disk_cache', DiskCache(tmp_path))
+        monkeypatch.setattr(coinmetrics_api, 'catalog_indexes', {})
+        data_req = DataRequest(source='coinmetrics', tickers=['btc', 'sol', 'eth'])
+
+        assert self.cm.check_tickers(data_req, data_type='asset_metrics') == ['btc', 'eth']
+        assert self.cm.get_catalog_index('catalog_assets') == {'btc', 'eth'}
+        assert CoinMetrics().get_assets_info(as_list=True) == ['btc', 'eth']
+        assert calls == ['catalog_assets']
+
+        self.cm.catalog_ttl = 0
+        sleep(0.01)
+        self.cm.get_catalog_index('catalog_assets')
+        assert calls == ['catalog_assets'] * 2
+
+    def test_get_data_catalogs(self, monkeypatch, tmp_path):
+        """
+        Test get_data routes requests using the catalog id columns, without looking up institution fields.
+        """
+        class Client:
+            def catalog_assets(self):
+                return [{'full_name': 'Bitcoin', 'asset': 'btc'}]
+
+            def catalog_indexes(self):
+                return [{'description': 'CMBI Bitcoin', 'index': 'CMBIBTC'}]
+
+            def catalog_metrics(self):
+                return [{'full_name': 'Active addresses', 'metric': 'AdrActCnt'}]
+
+        def get_inst_info(self, as_dict=False):
+            raise AssertionError('institutions catalog requested')
+
+        idx = pd.MultiIndex.from_tuples([(pd.Timestamp('2020-01-01'), 'BTC')], names=['date', 'ticker'])
+        monkeypatch.setattr(coinmetrics_api, 'client', Client())
+        monkeypatch.setattr(coinmetrics_api, 'disk_cache', DiskCache(tmp_path))
+        monkeypatch.setattr(coinmetrics_api, 'catalog_indexes', {})
+        monkeypatch.setattr(CoinMetrics, 'get_inst_info', get_inst_info)
+        monkeypatch.setattr(CoinMetrics, 'get_onchain', lambda self, data_req: pd.DataFrame({'add_act': [1.0]}, index=idx))
+
+        assert self.cm.get_catalog_index('catalog_indexes') == {'CMBIBTC'}
+        data_req = DataRequest(source='coinmetrics', tickers=['btc'], fields=['add_act'])
+        df = self.cm.get_data(data_req)
+        assert list(df.columns) == ['add_act'] and df.add_act.iloc[0] == 1.0
+
+    def test_get_shards(self):
+        """
+        Test get_shards splits date range and entities into shards.
+        """
+        params = {'assets': 'btc,eth,sol', 'frequency': '1d', 'start_time': '2020-01-01', 'end_time': '2020-12-31'}
+        shards = self.cm.get_shards(params, time_shards=4, entity_shards=2)
+
+        assert len(shards) == 8
+        assert [shard['assets'] for shard in shards[::4]] == ['btc,eth', 'sol']
+        assert [shard['start_time'][:10] for shard in shards[:4]] == ['2020-01-01', '2020-04-01', '2020-07-01',
+                                                                      '2020-09-30']
+        assert shards[0]['end_time'] == shards[1]['start_time'] and shards[0]['end_inclusive'] == 'false'
+        assert shards[3]['end_time'] == '2020-12-31' and 'end_inclusive' not in shards[3]
+        assert self.cm.get_shards({**params, 'start_time': None}, time_shards=4) == [{**params, 'start_time': None}]
+
+    def test_req_data_shards(self, monkeypatch):
+        """
+        Test req_data fetches shards concurrently and concatenates them in shard order.
+        """
+        # all shards must be in flight at once to pass the barrier
+        barrier = threading.Barrier(6, timeout=5)
+
+        def iter_pages(data_type, params):
+            barrier.wait()
+            yield pd.DataFrame({'asset': params['assets'].split(','), 'time': params['start_time']})
+
+        monkeypatch.setattr(self.cm, 'iter_pages', iter_pages)
+        params = {'assets': 'btc,eth', 'frequency': '1d', 'start_time': '2020-01-01', 'end_time': '2020-01-31'}
+
+        df = self.cm.req_data('/timeseries/asset-metrics', params, time_shards=3, entity_shards=2)
+        assert df.shape == (6, 2) and isinstance(df.index, pd.RangeIndex)
+        assert list(df.asset) == ['btc'] * 3 + ['eth'] * 3
+
+    def test_sink_data(self, monkeypatch, tmp_path):
+        """
+        Test sink_data streams pages to a parquet dataset partitioned by market and date.
+        """
+        pages = [
+            pd.DataFrame({'market': ['a', 'b'], 'time': ['2024-01-01T23:59:59Z'] * 2, 'coin_metrics_id': ['1', '2'],
+                          'amount': ['0.5', '1'], 'price': ['100', '200'], 'side': ['buy', 'sell']}),
+            pd.DataFrame({'market': ['a'], 'time': ['2024-01-02T00:00:01Z'], 'coin_metrics_id': ['3'],
+                          'amount': ['2'], 'price': ['101'], 'side': ['buy']}),
+        ]
+        monkeypatch.setattr(self.cm, 'iter_pages', lambda data_type, params: iter(pages))
+
+        dataset = self.cm.sink_data('/timeseries/market-trades', params={'markets': 'a,b'}, path=tmp_path)
+        assert (tmp_path / 'market=a' / 'date=2024-01-02').is_dir()
+        df = dataset.to_table(filter=ds.field('market') == 'a').to_pandas().sort_values('time')
+        assert list(df.price) == [100.0, 101.0] and list(df.date) == ['2024-01-01', '2024-01-02']
+        assert df.time.dt.tz is not None and list(df.coin_metrics_id) == ['1', '3']
+
     def test_wrangle_data_resp(self, data_req):
         """
         Test wrangle_data_resp method.
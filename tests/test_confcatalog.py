@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from cryptodatapy.util.confcatalog import ConfCatalog
+from cryptodatapy.util.diskcache import disk_cache
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, 'cache_dir', tmp_path)
+    monkeypatch.setattr(disk_cache, '_memory', {})
+    return ConfCatalog()
+
+
+def test_lookup(catalog) -> None:
+    """
+    Test hashed lookups match the config files.
+    """
+    assert catalog.lookup('fields', 'close', 'cryptocompare_id') == 'close'
+    assert catalog.lookup('tickers', 'US_UE_Rate', 'fred_id') == catalog.tickers.loc['US_UE_Rate', 'fred_id']
+    assert pd.isna(catalog.lookup('tickers', 'US_UE_Rate', 'famafrench_id'))
+    with pytest.raises(KeyError):
+        catalog.lookup('tickers', 'not_a_ticker', 'fred_id')
+
+
+def test_reverse_index(catalog) -> None:
+    """
+    Test reverse index maps vendor ids to the first matching ticker.
+    """
+    fred_index = catalog.get_reverse_index('tickers', 'fred_id')
+    fred_id = catalog.tickers.loc['US_UE_Rate', 'fred_id']
+    assert fred_index[fred_id] == catalog.tickers[catalog.tickers.fred_id == fred_id].index[0]
+
+
+def test_snapshot(catalog) -> None:
+    """
+    Test config files are loaded from the snapshot by a new catalog.
+    """
+    tickers = catalog.tickers
+    assert disk_cache.get('conf_tickers') is not None
+    pd.testing.assert_frame_equal(ConfCatalog().tickers, tickers)
+    assert ConfCatalog(use_snapshot=False).tickers.shape == tickers.shape
+
+
+if __name__ == "__main__":
+    pytest.main()
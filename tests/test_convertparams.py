@@ -1,9 +1,11 @@
 from datetime import datetime
+from types import SimpleNamespace
 
 import pandas as pd
 import pytest
 
 from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.transform import convertparams
 from cryptodatapy.transform.convertparams import ConvertParams
 
 
@@ -906,5 +908,49 @@ def test_convert_gn_inst(dr_inst, gn_inst) -> None:
     assert gn_params["inst"] == gn_inst, "Institution parameter conversion failed."
 
 
+def test_memoize_conversion(monkeypatch) -> None:
+    """
+    Test conversion runs once per data request, and again when its parameters change.
+    """
+    calls = []
+    convert_fields = ConvertParams.convert_fields
+    monkeypatch.setattr(ConvertParams, 'convert_fields',
+                        lambda self, **kwargs: calls.append(kwargs) or convert_fields(self, **kwargs))
+
+    data_req = DataRequest(tickers=["btc", "eth"], start_date="2020-01-01", end_date="2021-01-01")
+    cc_params = ConvertParams(data_req).to_cryptocompare()
+    assert ConvertParams(data_req).to_cryptocompare() == cc_params
+    assert len(calls) == 1
+
+    # copies can be mutated without changing later conversions
+    cc_params["tickers"].append("SOL")
+    cc_params["exch"] = "Binance"
+    assert ConvertParams(data_req).to_cryptocompare()["exch"] == "CCCAGG"
+    assert ConvertParams(data_req).to_cryptocompare()["tickers"] == ["BTC", "ETH"]
+
+    data_req.tickers = ["sol"]
+    assert ConvertParams(data_req).to_cryptocompare()["tickers"] == ["SOL"]
+    assert len(calls) == 2
+
+
+def test_memoize_time_relative(monkeypatch) -> None:
+    """
+    Test conversions of requests without an end date are resolved again as time passes.
+    """
+    now = [1700000000.0]
+    monkeypatch.setattr(convertparams, 'time', SimpleNamespace(time=lambda: now[0]))
+
+    data_req = DataRequest(tickers=["btc"], start_date="2020-01-01")
+    cc_params = ConvertParams(data_req).to_cryptocompare()
+    assert ConvertParams(data_req).to_cryptocompare() == cc_params
+
+    now[0] += 86400
+    monkeypatch.setattr(pd.Timestamp, 'utcnow', classmethod(lambda cls: pd.Timestamp(now[0], unit='s', tz='UTC')))
+    assert ConvertParams(data_req).to_cryptocompare()["end_date"] == round(now[0])
+    # dates fixed by the request stay cached
+    assert ConvertParams(data_req).to_glassnode() is not ConvertParams(data_req).to_glassnode()
+    assert ConvertParams(data_req).to_glassnode() == ConvertParams(data_req).to_glassnode()
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from cryptodatapy.util.coverage import CoverageIndex
+
+
+def test_add_merges_intervals() -> None:
+    """
+    Test overlapping and adjacent intervals are merged.
+    """
+    coverage = CoverageIndex()
+    coverage.add(['close'], '2018-01-01', '2019-01-01')
+    coverage.add(['close'], '2019-01-01', '2020-01-01')
+    coverage.add(['close', 'volume'], '2021-01-01', '2022-01-01')
+    assert coverage.intervals['close'] == [
+        (pd.Timestamp('2018-01-01'), pd.Timestamp('2020-01-01')),
+        (pd.Timestamp('2021-01-01'), pd.Timestamp('2022-01-01')),
+    ]
+    assert list(coverage.intervals) == ['close', 'volume']
+    with pytest.raises(ValueError):
+        coverage.add(['close'], '2022-01-01', '2021-01-01')
+
+
+def test_get_missing() -> None:
+    """
+    Test only ranges outside held intervals are missing, for any requested field.
+    """
+    coverage = CoverageIndex({'close': [('2018-01-01', '2023-12-31')]})
+    assert coverage.get_missing(['close'], '2017-01-01', '2024-06-30') == [
+        (pd.Timestamp('2017-01-01'), pd.Timestamp('2018-01-01')),
+        (pd.Timestamp('2023-12-31'), pd.Timestamp('2024-06-30')),
+    ]
+    assert coverage.get_missing(['close'], '2019-01-01', '2020-01-01') == []
+    assert coverage.get_missing(['close', 'volume'], '2019-01-01', '2020-01-01') == [
+        (pd.Timestamp('2019-01-01'), pd.Timestamp('2020-01-01'))
+    ]
+    assert coverage.get_missing(['close'], pd.Timestamp('2024-01-01', tz='UTC'), '2024-01-01') == [
+        (pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-01'))
+    ]
+
+
+def test_json() -> None:
+    """
+    Test coverage index round trip through JSON.
+    """
+    coverage = CoverageIndex({'close': [('2018-01-01', '2019-01-01 12:00')]})
+    assert CoverageIndex.from_json(coverage.to_json()).intervals == coverage.intervals
+
+
+if __name__ == "__main__":
+    pytest.main()
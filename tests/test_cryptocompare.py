@@ -3,6 +3,7 @@ import pandas as pd
 import pytest
 import responses
 import json
+import threading
 
 from cryptodatapy.extract.data_vendors.cryptocompare_api import CryptoCompare
 from cryptodatapy.extract.datarequest import DataRequest
@@ -257,6 +258,16 @@ def test_req_data(ohlcv_data_req, cc):
     assert data_resp == ohlcv_data_req
 
 
+def test_get_limit(cc) -> None:
+    """
+    Test number of observations per call is limited to the requested date range.
+    """
+    cc_data_req = {'freq': 'histoday', 'start_date': 1663027200, 'end_date': 1663200000}
+    assert cc.get_limit(cc_data_req, 'ohlcv') == 3
+    assert cc.get_limit({**cc_data_req, 'freq': 'histohour'}, 'on-chain') == 3
+    assert cc.get_limit({**cc_data_req, 'start_date': 0}, 'ohlcv') == cc.max_obs_per_call
+
+
 def test_integration_get_all_data_hist(cc, data_req) -> None:
     """
     Test integration of set_urls_params and req_data to request data in a loop
@@ -376,6 +387,62 @@ def test_integration_get_all_tickers(cc) -> None:
     assert set(df.index.droplevel(0).unique()) == {'BTC', 'ETH', 'ADA'}
 
 
+def test_get_windows() -> None:
+    """
+    Test planning of page windows from frequency, start and end dates and max obs per call.
+    """
+    cc = CryptoCompare(api_key='test_key', max_obs_per_call=100)
+    data_req = DataRequest(tickers=['btc'], freq='1h', start_date='2022-01-01', end_date='2022-01-10')
+    windows = cc.get_windows(data_req, data_type='ohlcv')
+    end_ts = int(pd.Timestamp('2022-01-10').timestamp())
+    assert windows == [end_ts, end_ts - 360000, end_ts - 720000]
+
+
+@responses.activate
+def test_get_all_data_hist_windows() -> None:
+    """
+    Test concurrent fetching of page windows, stitched and deduplicated.
+    """
+    cc = CryptoCompare(api_key='test_key', max_obs_per_call=100)
+
+    def callback(request):
+        to_ts = int(request.params['toTs'])
+        data = [{'time': to_ts - i * 3600, 'close': 1.0} for i in range(100, -1, -1)]
+        return 200, {}, json.dumps({'Data': {'Data': data}})
+
+    responses.add_callback(responses.GET, base_url + 'v2/histohour', callback=callback)
+
+    data_req = DataRequest(tickers=['btc'], freq='1h', start_date='2022-01-01', end_date='2022-01-10')
+    df = cc.get_all_data_hist(data_req, data_type='ohlcv', ticker='BTC', parallel=True)
+    assert len(responses.calls) == 3
+    assert df.time.is_unique and df.time.is_monotonic_increasing
+    assert df.time.iloc[-1] == int(pd.Timestamp('2022-01-10').timestamp())
+    assert df.time.diff().dropna().eq(3600).all()
+    assert df.time.iloc[0] <= int(pd.Timestamp('2022-01-01').timestamp())
+
+
+def test_get_all_tickers_concurrent(monkeypatch) -> None:
+    """
+    Test tickers are fetched concurrently, keeping ticker order and skipping failed tickers.
+    """
+    cc = CryptoCompare(api_key='test_key')
+    # all tickers must be in flight at once to pass the barrier
+    barrier = threading.Barrier(4, timeout=5)
+
+    def get_tidy_data(data_req, data_type, ticker):
+        barrier.wait()
+        if ticker == 'ADA':
+            raise Exception("Failed to get data.")
+        return pd.DataFrame({'close': [1.0, 2.0]}, index=pd.date_range('2022-01-01', periods=2, name='date'))
+
+    monkeypatch.setattr(cc, 'get_tidy_data', get_tidy_data)
+    data_req = DataRequest(tickers=['sol', 'btc', 'ada', 'eth'], end_date='2022-01-03')
+
+    df = cc.get_all_tickers(data_req, data_type='ohlcv', max_workers=4)
+    assert list(df.index.droplevel(0).unique()) == ['SOL', 'BTC', 'ETH']
+    assert df.index.names == ['date', 'ticker']
+
+
 def test_check_params(cc) -> None:
     """
     Test parameter values before calling API.
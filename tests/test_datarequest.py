@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pytest
 
 from cryptodatapy.extract.datarequest import DataRequest
@@ -161,5 +163,16 @@ def test_source_fields_error(datarequest) -> None:
         dr.source_fields = {"crypto": ["close_price"]}
 
 
+def test_fingerprint() -> None:
+    """
+    Test fingerprint is stable for equal parameters and changes with parameters.
+    """
+    dr1 = DataRequest(tickers=["btc", "eth"], start_date="2020-01-01")
+    dr2 = DataRequest(tickers=["btc", "eth"], start_date=datetime(2020, 1, 1))
+    assert dr1.fingerprint == dr2.fingerprint
+    dr2.fields = ["close", "volume"]
+    assert dr1.fingerprint != dr2.fingerprint
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,36 @@
+import pandas as pd
+import pyarrow.dataset as ds
+
+from cryptodatapy.util.datasink import ParquetSink
+
+
+def test_write(tmp_path) -> None:
+    """
+    Test dataframes are appended to the partitioned dataset with the schema of the first dataframe.
+    """
+    sink = ParquetSink(tmp_path, partition_cols=['market', 'date'])
+    dfs = [
+        pd.DataFrame({'market': ['a', 'b'], 'date': ['2024-01-01'] * 2, 'price': [1.0, 2.0], 'amount': [1.0, 1.0]}),
+        pd.DataFrame(),
+        pd.DataFrame({'market': ['a'], 'date': ['2024-01-02'], 'price': [3.0], 'extra': ['x']}),
+    ]
+    dataset = sink.write(iter(dfs))
+
+    assert isinstance(dataset, ds.Dataset)
+    assert (tmp_path / 'market=a' / 'date=2024-01-02').is_dir()
+    df = dataset.to_table().to_pandas().sort_values('price')
+    assert list(df.price) == [1.0, 2.0, 3.0]
+    assert df.amount.isna().tolist() == [False, False, True] and 'extra' not in df
+
+    # append
+    sink.write([dfs[0]])
+    assert sink.to_dataset().count_rows() == 5
+    assert dataset.to_table(filter=ds.field('market') == 'b').num_rows == 1
+
+
+def test_write_empty(tmp_path) -> None:
+    """
+    Test writing no data returns an empty dataset.
+    """
+    dataset = ParquetSink(tmp_path / 'trades', partition_cols=['market', 'date']).write([])
+    assert dataset.count_rows() == 0
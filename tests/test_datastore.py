@@ -0,0 +1,232 @@
+import pandas as pd
+import pytest
+
+from cryptodatapy.extract.data_vendors.glassnode_api import Glassnode
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.extract.getdata import GetData
+from cryptodatapy.util.coverage import CoverageIndex
+from cryptodatapy.util.datastore import DataStore
+
+
+def make_series(tickers, start, periods, fields=('close',)):
+    idx = pd.MultiIndex.from_product(
+        [pd.date_range(start, periods=periods, freq='D'), tickers], names=['date', 'ticker']
+    )
+    return pd.DataFrame({field: range(i, i + len(idx)) for i, field in enumerate(fields)}, index=idx, dtype=float)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DataStore(tmp_path)
+
+
+def test_write_read(store) -> None:
+    """
+    Test series round trip through the store, merging new rows and fields with stored ones.
+    """
+    store.write('glassnode', 'd', make_series(['BTC', 'ETH'], '2020-01-01', 5))
+    store.write('glassnode', 'd', make_series(['BTC'], '2020-01-04', 5, fields=('close', 'volume')))
+
+    df = store.read('glassnode', 'd', ['btc', 'eth'], start_date='2020-01-02')
+    assert df.index.names == ['date', 'ticker']
+    assert list(df.columns) == ['close', 'volume']
+    assert df.loc[('2020-01-08', 'BTC'), 'volume'] == 5
+    assert df.loc['2020-01-02':'2020-01-05'].shape[0] == 8
+    assert store.get_tickers('glassnode', 'd') == ['BTC', 'ETH']
+    assert not list(store.root.rglob('*.tmp'))
+
+    store.delete('glassnode', ticker='ETH')
+    assert store.get_tickers('glassnode', 'd') == ['BTC']
+
+
+def test_covers(store) -> None:
+    """
+    Test coverage check on fields and dates.
+    """
+    store.write('tiingo', 'd', make_series(['BTC'], '2020-01-01', 10))
+    assert store.covers('tiingo', 'd', 'btc', ['close'], '2020-01-02', '2020-01-10')
+    assert not store.covers('tiingo', 'd', 'btc', ['close', 'volume'], '2020-01-02', '2020-01-10')
+    assert not store.covers('tiingo', 'd', 'btc', ['close'], '2019-12-31', '2020-01-10')
+    assert not store.covers('tiingo', 'd', 'btc', ['close'], '2020-01-02', None)
+    assert not store.covers('tiingo', 'd', 'eth', ['close'], '2020-01-02', '2020-01-10')
+
+
+def test_get_series_read_through(store, monkeypatch) -> None:
+    """
+    Test GetData only requests tickers missing from the store.
+    """
+    requested = []
+
+    def fetch_series(self, data_req, method='get_data'):
+        requested.append(data_req.tickers)
+        return make_series([ticker.upper() for ticker in data_req.tickers], '2020-01-01', 10)
+
+    monkeypatch.setattr(GetData, 'fetch_series', fetch_series)
+    data_req = DataRequest(source='glassnode', tickers=['btc'], start_date='2020-01-01', end_date='2020-01-10')
+    df = GetData(data_req, store=store).get_series()
+    assert df.shape == (10, 1)
+
+    data_req = DataRequest(source='glassnode', tickers=['btc', 'eth'], start_date='2020-01-03', end_date='2020-01-10')
+    df = GetData(data_req, store=store).get_series()
+    assert requested == [['btc'], ['eth']]
+    assert df.shape == (16, 1)
+    assert list(df.index.get_level_values('ticker').unique()) == ['BTC', 'ETH']
+
+    GetData(data_req, store=store).get_series()
+    assert len(requested) == 2
+
+
+def test_get_series_no_observations(store, monkeypatch) -> None:
+    """
+    Test tickers without observations are recorded as covered, so their date ranges aren't requested again.
+    """
+    requested = []
+
+    def fetch_series(self, data_req, method='get_data'):
+        requested.append(data_req.tickers)
+        return make_series(['BTC'], '2020-01-01', 10) if 'btc' in data_req.tickers else pd.DataFrame()
+
+    monkeypatch.setattr(GetData, 'fetch_series', fetch_series)
+    data_req = DataRequest(source='glassnode', tickers=['ada'], start_date='2020-01-01', end_date='2020-01-10')
+    df = GetData(data_req, store=store).get_series()
+    assert df.empty
+    assert store.covers('glassnode', 'd', 'ada', ['close'], '2020-01-01', '2020-01-10')
+    assert store.get_last_date('glassnode', 'd', 'ada') is None
+
+    GetData(data_req, store=store).get_series()
+    assert requested == [['ada']]
+
+    # observations replace the empty file, under the data source's ticker
+    store.write('glassnode', 'd', make_series(['ADA'], '2020-01-11', 2),
+                coverage=CoverageIndex({'close': [(pd.Timestamp('2020-01-10'), pd.Timestamp('2020-01-12'))]}))
+    assert store.get_tickers('glassnode', 'd') == ['ADA']
+    assert store.covers('glassnode', 'd', 'ada', ['close'], '2020-01-01', '2020-01-12')
+    assert store.read('glassnode', 'd', ['ada']).shape == (2, 1)
+
+
+def test_get_series_partial_range(store, monkeypatch) -> None:
+    """
+    Test GetData only requests date ranges missing from the store.
+    """
+    requested = []
+
+    def fetch_series(self, data_req, method='get_data'):
+        requested.append((data_req.start_date, data_req.end_date))
+        periods = (data_req.end_date - data_req.start_date).days + 1
+        return make_series(['BTC'], data_req.start_date, periods)
+
+    monkeypatch.setattr(GetData, 'fetch_series', fetch_series)
+    data_req = DataRequest(source='tiingo', tickers=['btc'], start_date='2020-01-05', end_date='2020-01-10')
+    GetData(data_req, store=store).get_series()
+    data_req = DataRequest(source='tiingo', tickers=['btc'], start_date='2020-01-01', end_date='2020-01-15')
+    df = GetData(data_req, store=store).get_series()
+
+    assert requested[1:] == [
+        (pd.Timestamp('2020-01-01'), pd.Timestamp('2020-01-05')),
+        (pd.Timestamp('2020-01-10'), pd.Timestamp('2020-01-15')),
+    ]
+    assert df.shape == (15, 1)
+    assert store.covers('tiingo', 'd', 'BTC', ['close'], '2020-01-01', '2020-01-15')
+
+
+def test_iter_series_coverage(store, monkeypatch) -> None:
+    """
+    Test iter_series records the requested date range, so empty leading ranges aren't requested again.
+    """
+    def call_data_source(self, data_req, method='get_data'):
+        # btc listed on 2020-01-05, no eth observations
+        return iter([make_series(['BTC'], '2020-01-05', 6)])
+
+    monkeypatch.setattr(GetData, 'call_data_source', call_data_source)
+    store.write('glassnode', 'd', make_series(['ETH'], '2019-12-20', 5))
+    data_req = DataRequest(source='glassnode', tickers=['btc', 'eth'], start_date='2020-01-01', end_date='2020-01-10')
+    get_data = GetData(data_req, store=store)
+
+    stream = get_data.iter_series()
+    next(stream)
+    assert store.covers('glassnode', 'd', 'btc', ['close'], '2020-01-01', '2020-01-10')
+    assert not store.covers('glassnode', 'd', 'eth', ['close'], '2020-01-01', '2020-01-10')
+    assert list(stream) == []
+    assert store.covers('glassnode', 'd', 'eth', ['close'], '2020-01-01', '2020-01-10')
+    assert get_data.get_missing_requests() == []
+
+
+def test_get_updates(store, monkeypatch) -> None:
+    """
+    Test GetData requests each ticker from its last stored timestamp and returns only newer observations.
+    """
+    requested = []
+
+    def fetch_series(self, data_req, method='get_data'):
+        requested.append((data_req.tickers, data_req.start_date))
+        start = '2020-01-01' if data_req.start_date is None else data_req.start_date
+        return make_series([ticker.upper() for ticker in data_req.tickers], start, 3)
+
+    monkeypatch.setattr(GetData, 'fetch_series', fetch_series)
+    store.write('glassnode', 'd', make_series(['BTC', 'ETH'], '2020-01-01', 5))
+    store.write('glassnode', 'd', make_series(['SOL'], '2020-01-01', 3))
+    assert store.get_last_date('glassnode', 'd', 'btc') == pd.Timestamp('2020-01-05')
+
+    data_req = DataRequest(source='glassnode', tickers=['btc', 'eth', 'sol', 'ada'])
+    df = GetData(data_req, store=store).get_updates()
+
+    assert requested == [
+        (['btc', 'eth'], pd.Timestamp('2020-01-05')), (['sol'], pd.Timestamp('2020-01-03')), (['ada'], None)
+    ]
+    assert df.loc[(slice(None), 'BTC'), :].index.get_level_values(0).min() == pd.Timestamp('2020-01-06')
+    assert df.shape == (2 + 2 + 2 + 3, 1)
+    assert store.get_last_date('glassnode', 'd', 'btc') == pd.Timestamp('2020-01-07')
+
+    with pytest.raises(ValueError):
+        GetData(data_req).get_updates()
+    df = GetData(data_req).get_updates(last_dates={'BTC': '2020-01-06'})
+    assert df.index.get_level_values(0).min() == pd.Timestamp('2020-01-01')
+    assert df.loc[(slice(None), 'BTC'), :].shape == (2, 1)
+
+
+
+def test_get_updates_vendor(store, monkeypatch) -> None:
+    """
+    Test get_updates through the Glassnode data source: tickers sharing a last stored timestamp are requested
+    together from it, using the 's' cursor, and only newer observations are returned.
+    """
+    requested, groups = [], []
+    fetch_series = GetData.fetch_series
+
+    def fetch(self, data_req, method='get_data'):
+        groups.append((data_req.tickers, data_req.start_date))
+        return fetch_series(self, data_req, method=method)
+
+    def get_req(self, url, params, **kwargs):
+        # daily observations from the cursor, inclusive, to 2020-01-10
+        requested.append((params['a'], pd.to_datetime(params['s'], unit='s')))
+        dates = pd.date_range(pd.to_datetime(params['s'], unit='s'), '2020-01-10')
+        return [{'t': int(date.timestamp()), 'v': date.day} for date in dates]
+
+    monkeypatch.setattr(Glassnode, 'check_params', lambda self, data_req: None)
+    monkeypatch.setattr(DataRequest, 'get_req', get_req)
+    monkeypatch.setattr(GetData, 'fetch_series', fetch)
+    data_req = DataRequest(source='glassnode', tickers=['btc', 'eth', 'sol'], fields=['add_act'],
+                           start_date='2020-01-01')
+    get_data = GetData(data_req, api_key='test_key', store=store)
+    stored = make_series(['BTC', 'ETH'], '2020-01-01', 5, fields=('add_act',)) + 1
+    store.write(get_data.store_source, 'd', stored)
+    store.write(get_data.store_source, 'd', stored.loc[:'2020-01-03'].xs('BTC', level=1, drop_level=False)
+                .rename(index={'BTC': 'SOL'}))
+
+    df = get_data.get_updates()
+
+    assert groups == [(['btc', 'eth'], pd.Timestamp('2020-01-05')), (['sol'], pd.Timestamp('2020-01-03'))]
+    assert sorted(requested) == [
+        ('btc', pd.Timestamp('2020-01-05')), ('eth', pd.Timestamp('2020-01-05')), ('sol', pd.Timestamp('2020-01-03'))
+    ]
+    first_dates = df.reset_index(level=0).groupby(level=0).date.min()
+    assert first_dates.to_dict() == {
+        'BTC': pd.Timestamp('2020-01-06'), 'ETH': pd.Timestamp('2020-01-06'), 'SOL': pd.Timestamp('2020-01-04')
+    }
+    assert df.shape == (5 + 5 + 7, 1)
+    assert list(df.xs('SOL', level=1).add_act) == list(range(4, 11))
+    assert store.get_last_date(get_data.store_source, 'd', 'sol') == pd.Timestamp('2020-01-10')
+
+if __name__ == "__main__":
+    pytest.main()
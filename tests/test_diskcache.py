@@ -0,0 +1,82 @@
+import json
+import time
+
+import pytest
+import responses
+
+from cryptodatapy.extract.data_vendors.cryptocompare_api import CryptoCompare
+from cryptodatapy.util.diskcache import DiskCache, disk_cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DiskCache(cache_dir=tmp_path, ttl=60)
+
+
+@pytest.fixture
+def shared_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, 'cache_dir', tmp_path)
+    monkeypatch.setattr(disk_cache, '_memory', {})
+    return disk_cache
+
+
+@pytest.fixture
+def idx_req():
+    with open('data/cc_indexes_req.json') as f:
+        return json.load(f)
+
+
+def test_get_set(cache) -> None:
+    """
+    Test values persist to disk and are read back by a new cache instance.
+    """
+    cache.set('cryptocompare_assets', ['BTC', 'ETH'])
+    assert cache.get('cryptocompare_assets') == ['BTC', 'ETH']
+    assert DiskCache(cache_dir=cache.cache_dir).get('cryptocompare_assets') == ['BTC', 'ETH']
+    assert cache.get('glassnode_assets') is None
+
+
+def test_ttl(cache) -> None:
+    """
+    Test expired values are not returned.
+    """
+    cache.set('tiingo_assets', ['SPY'])
+    assert cache.get('tiingo_assets', ttl=0.5) == ['SPY']
+    time.sleep(0.6)
+    assert cache.get('tiingo_assets', ttl=0.5) is None
+
+
+def test_clear(cache) -> None:
+    """
+    Test clearing values by key prefix.
+    """
+    cache.set('cryptocompare_assets', ['BTC'])
+    cache.set('glassnode_assets', ['BTC'])
+    cache.clear('cryptocompare_')
+    assert cache.get('cryptocompare_assets') is None
+    assert cache.get('glassnode_assets') == ['BTC']
+
+
+@responses.activate
+def test_lazy_metadata(shared_cache, idx_req) -> None:
+    """
+    Test vendor metadata is requested on first access only, then served from the disk cache.
+    """
+    url = 'https://min-api.cryptocompare.com/data/index/list'
+    responses.add(responses.GET, url, json=idx_req, status=200)
+
+    cc = CryptoCompare(api_key='test_key')
+    assert len(responses.calls) == 0
+    assert 'MVDA' in cc.indexes
+    assert len(responses.calls) == 1
+
+    cc = CryptoCompare(api_key='test_key')
+    assert 'MVDA' in cc.indexes
+    assert len(responses.calls) == 1
+
+    cc.refresh_metadata('indexes')
+    assert len(responses.calls) == 2
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,9 +1,13 @@
+import asyncio
+import threading
+
 import pytest
 import pandas as pd
 import numpy as np
 
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.getdata import GetData
+from cryptodatapy.extract.registry import get_data_source
 
 
 @pytest.fixture
@@ -442,5 +446,63 @@ def test_integration_get_data_tg(data_req_tg) -> None:
     ), "Close is not a numpy float."  # dtypes
 
 
+
+def test_get_batch(monkeypatch) -> None:
+    """
+    Test batch runs requests concurrently across sources, in order, with async and sync data sources.
+    """
+    calls = []
+    # async requests in flight, and sync requests which must be in flight at once to pass the barrier
+    active, peak = 0, 0
+    barrier = threading.Barrier(2, timeout=5)
+
+    async def async_data(data_req):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.1)
+        active -= 1
+        return pd.DataFrame({'source': [data_req.source]})
+
+    def call_data_source(self, data_req, method='get_data'):
+        calls.append(data_req.source)
+        if data_req.source == 'ccxt':
+            return async_data(data_req)
+        if data_req.source == 'tiingo':
+            raise ValueError('Failed request.')
+        barrier.wait()
+        return pd.DataFrame({'source': [data_req.source]})
+
+    monkeypatch.setattr(GetData, 'call_data_source', call_data_source)
+    data_reqs = [DataRequest(source=source) for source in ['ccxt', 'glassnode', 'ccxt', 'glassnode', 'tiingo']]
+    [get_data_source(data_req.source) for data_req in data_reqs]  # import data sources
+
+    dfs = GetData.get_batch(data_reqs)
+    assert peak == 2
+    assert [df.source.iloc[0] for df in dfs[:4]] == ['ccxt', 'glassnode', 'ccxt', 'glassnode']
+    assert dfs[4].empty
+    assert sorted(calls) == sorted(data_req.source for data_req in data_reqs)
+
+    # sync facade resolves async data sources
+    barrier.reset()
+    assert GetData(DataRequest(source='ccxt')).get_series().source.iloc[0] == 'ccxt'
+
+
+
+def test_iter_series(monkeypatch) -> None:
+    """
+    Test iter_series yields data source frames as they are retrieved, and a single frame for other methods.
+    """
+    def call_data_source(self, data_req, method='get_data'):
+        if method == 'iter_data':
+            return (pd.DataFrame({'ticker': [ticker]}) for ticker in data_req.tickers)
+        return pd.DataFrame({'ticker': data_req.tickers})
+
+    monkeypatch.setattr(GetData, 'call_data_source', call_data_source)
+    get_data = GetData(DataRequest(source='glassnode', tickers=['btc', 'eth']))
+    assert [df.ticker.iloc[0] for df in get_data.iter_series()] == ['btc', 'eth']
+    assert len(list(get_data.iter_series(method='get_ohlcv'))) == 1
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -3,6 +3,7 @@ import pandas as pd
 import pytest
 import responses
 import json
+import threading
 
 from cryptodatapy.extract.data_vendors.glassnode_api import Glassnode
 from cryptodatapy.extract.datarequest import DataRequest
@@ -116,6 +117,49 @@ def test_check_params(gn) -> None:
         gn.check_params(data_req)
 
 
+def test_iter_data(gn, monkeypatch) -> None:
+    """
+    Test iter_data yields each ticker's fields as soon as they are retrieved.
+    """
+    def get_all_fields(data_req, ticker):
+        idx = pd.date_range('2020-01-01', periods=3, name='date')
+        return pd.DataFrame({'add_act': range(3), 'tx_count': range(3)}, index=idx)
+
+    monkeypatch.setattr(gn, 'check_params', lambda data_req: None)
+    monkeypatch.setattr(gn, 'get_all_fields', get_all_fields)
+    data_req = DataRequest(source='glassnode', tickers=['btc', 'eth'], fields=['tx_count', 'add_act'])
+
+    dfs = gn.iter_data(data_req)
+    df = next(dfs)
+    assert list(df.index.get_level_values('ticker').unique()) == ['BTC']
+    assert list(df.columns) == ['tx_count', 'add_act']
+    assert list(next(dfs).index.get_level_values('ticker').unique()) == ['ETH']
+    assert gn.get_data(data_req).shape == (6, 2)
+
+
+def test_get_all_fields(gn, monkeypatch) -> None:
+    """
+    Test get_all_fields requests fields concurrently, in order, and OHLC only once.
+    """
+    requested = []
+    # distinct fields must be in flight at once to pass the barrier
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_tidy_data(data_req, ticker, field):
+        barrier.wait()
+        requested.append(field)
+        idx = pd.date_range('2020-01-01', periods=3, name='date')
+        return pd.DataFrame({field: range(3)}, index=idx)
+
+    monkeypatch.setattr(gn, 'get_tidy_data', get_tidy_data)
+    fields = ['market/price_usd_ohlc', 'addresses/active_count', 'market/price_usd_ohlc', 'transactions/count']
+    data_req = DataRequest(source='glassnode', tickers=['btc'], source_fields=fields)
+
+    df = gn.get_all_fields(data_req, 'btc')
+    assert sorted(requested) == sorted(set(fields))
+    assert list(df.columns) == ['market/price_usd_ohlc', 'addresses/active_count', 'transactions/count']
+
+
 def test_get_data_integration(gn) -> None:
     """
     Test integration of data retrieval methods.
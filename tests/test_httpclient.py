@@ -0,0 +1,58 @@
+import pytest
+import responses
+
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.extract.httpclient import HTTPClient, http_client
+
+
+@pytest.fixture
+def client():
+    return HTTPClient(pool_maxsize=5, timeout=5)
+
+
+def test_get_host(client) -> None:
+    """
+    Test host key for session pools.
+    """
+    assert client.get_host('https://api.glassnode.com/v1/metrics/assets?a=btc') == 'https://api.glassnode.com'
+
+
+def test_session_per_host(client) -> None:
+    """
+    Test sessions are reused for the same host and kept separate for different hosts.
+    """
+    s1 = client.get_session('https://min-api.cryptocompare.com/data/v2/histoday')
+    s2 = client.get_session('https://min-api.cryptocompare.com/data/index/list')
+    s3 = client.get_session('https://api.tiingo.com/tiingo/crypto')
+    assert s1 is s2
+    assert s1 is not s3
+    assert s1.get_adapter('https://min-api.cryptocompare.com')._pool_maxsize == 5
+
+
+def test_configure(client) -> None:
+    """
+    Test configure resets sessions with new pool size and timeout.
+    """
+    s1 = client.get_session('https://api.tiingo.com/tiingo/crypto')
+    client.configure(pool_maxsize=50, timeout=(3, 30))
+    s2 = client.get_session('https://api.tiingo.com/tiingo/crypto')
+    assert s1 is not s2
+    assert client.timeout == (3, 30)
+    assert s2.get_adapter('https://api.tiingo.com')._pool_maxsize == 50
+
+
+@responses.activate
+def test_get_req_uses_shared_client() -> None:
+    """
+    Test data request get request goes through the shared pooled session.
+    """
+    url = 'https://api.glassnode.com/v1/metrics/assets'
+    responses.add(responses.GET, url, json={'data': [1, 2, 3]}, status=200)
+
+    resp = DataRequest().get_req(url=url, params={'api_key': 'key'})
+    assert resp == {'data': [1, 2, 3]}
+    assert http_client.get_host(url) in http_client._sessions
+
+
+if __name__ == "__main__":
+    pytest.main()
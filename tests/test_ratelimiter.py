@@ -0,0 +1,157 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from cryptodatapy.extract.data_vendors.cryptocompare_api import CryptoCompare
+from cryptodatapy.extract.ratelimiter import RateLimiter, convert_rate_limit, get_rate_limiter
+
+
+@pytest.fixture
+def cc_rate_limit():
+    return pd.DataFrame({'calls_made': {'second': 1, 'minute': 10, 'hour': 100, 'day': 100, 'month': 100},
+                         'calls_left': {'second': 19, 'minute': 290, 'hour': 2900, 'day': 7400, 'month': 49900}})
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Fake clock for rate limiters, advanced by setting clock.now.
+    """
+    class Clock:
+        now = 0.0
+
+    monkeypatch.setattr(RateLimiter, 'clock', staticmethod(lambda: Clock.now))
+    return Clock
+
+
+def test_rate_limiter_burst(clock) -> None:
+    """
+    Test bucket allows a burst up to capacity, then waits at the refill rate.
+    """
+    rl = RateLimiter(rate=10, capacity=2)
+    assert rl.reserve() == 0
+    assert rl.reserve() == 0
+    assert rl.reserve() == pytest.approx(0.1)
+    assert rl.reserve() == pytest.approx(0.2)
+    clock.now = 0.5
+    assert rl.reserve() == 0
+
+
+def test_try_acquire(clock) -> None:
+    """
+    Test tokens are only taken when available, without queuing behind the bucket.
+    """
+    rl = RateLimiter(rate=10, capacity=1)
+    assert rl.try_acquire() == 0
+    assert rl.try_acquire() == pytest.approx(0.1)
+    assert rl.try_acquire() == pytest.approx(0.1)
+    rl.pause(1)
+    assert rl.try_acquire() == pytest.approx(1.1)
+    clock.now = 1.1
+    assert rl.try_acquire() == 0
+
+
+def test_rate_limiter_params() -> None:
+    """
+    Test rate limiter parameter validation.
+    """
+    assert RateLimiter(rate=0.5).capacity == 1
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, capacity=0.5)
+
+
+def test_acquire_async(clock) -> None:
+    """
+    Test acquire paces concurrent coroutines at the refill rate.
+    """
+    rl = RateLimiter(rate=20, capacity=1)
+
+    async def run():
+        return await asyncio.gather(*[rl.acquire_async() for _ in range(5)])
+
+    assert asyncio.run(run()) == pytest.approx([0, 0.05, 0.1, 0.15, 0.2])
+
+
+def test_windows(clock) -> None:
+    """
+    Test stacked buckets enforce longer quota windows on top of the refill rate.
+    """
+    rl = RateLimiter(rate=10, capacity=10, windows=[{'rate': 1 / 60, 'capacity': 15, 'tokens': 12}])
+    assert [rl.try_acquire() for _ in range(10)] == [0] * 10
+    assert rl.try_acquire() == pytest.approx(0.1)
+
+    # per second bucket refilled, per minute bucket has 2 tokens left
+    clock.now = 1.0
+    assert [rl.try_acquire() for _ in range(2)] == [0, 0]
+    assert rl.try_acquire() == pytest.approx(60 - 1, abs=1)
+    assert rl.tokens == 8
+    assert rl.reserve() == pytest.approx(60 - 1, abs=1)
+
+    # windows updated in place
+    window = rl.windows[0]
+    rl.set_rate(10, windows=[{'rate': 1, 'capacity': 60, 'tokens': 60}])
+    assert rl.windows[0] is window and rl.try_acquire() == 0
+
+
+def test_convert_rate_limit(cc_rate_limit) -> None:
+    """
+    Test conversion of rate limit attributes to token bucket parameters.
+    """
+    assert convert_rate_limit(None) is None
+    assert convert_rate_limit(5) == {'rate': 5.0, 'capacity': None, 'tokens': None, 'windows': None}
+    assert convert_rate_limit({'calls': 10, 'period': 6}) == {'rate': 10 / 6, 'capacity': 10, 'tokens': None,
+                                                             'windows': None}
+    params = convert_rate_limit(cc_rate_limit)
+    assert params['rate'] == 20
+    assert params['capacity'] == 20
+    assert params['tokens'] == 19
+    assert [window['rate'] for window in params['windows']] == pytest.approx([5, 3000 / 3600, 7500 / 86400,
+                                                                              50000 / 2592000])
+    assert [window['tokens'] for window in params['windows']] == [290, 2900, 7400, 49900]
+
+
+def test_get_rate_limiter() -> None:
+    """
+    Test rate limiters are shared by source and key.
+    """
+    rl = get_rate_limiter('test', 'key1', rate=5)
+    assert get_rate_limiter('test', 'key1', rate=1) is rl
+    assert get_rate_limiter('test', 'key2') is not rl
+    assert rl.rate == 5
+
+
+def test_vendor_rate_limiter(cc_rate_limit) -> None:
+    """
+    Test data vendor rate limiter is configured from the rate limit attribute.
+    """
+    cc = CryptoCompare(exchanges=['binance'], indexes=['mvda'], assets=['btc'], markets=['btcusdt'],
+                       fields=['close'], api_key='test_key', rate_limit=cc_rate_limit)
+    assert cc.rate_limiter is CryptoCompare(exchanges=['binance'], indexes=['mvda'], assets=['btc'],
+                                            markets=['btcusdt'], fields=['close'], api_key='test_key',
+                                            rate_limit=cc_rate_limit).rate_limiter
+    assert cc.rate_limiter.capacity == 20
+    assert cc.rate_limiter.rate == 20
+    assert [window.capacity for window in cc.rate_limiter.windows] == [300, 3000, 7500, 50000]
+    # calls only wait on the per second quota while longer quotas have calls left
+    assert [cc.rate_limiter.try_acquire() for _ in range(19)] == [0] * 19
+
+
+
+def test_vendor_rate_limiter_live(cc_rate_limit, monkeypatch) -> None:
+    """
+    Test a new data vendor rate limiter is seeded from live rate limit info.
+    """
+    calls = []
+    monkeypatch.setattr(CryptoCompare, 'get_rate_limit_info', lambda self: calls.append(1) or cc_rate_limit)
+
+    cc = CryptoCompare(api_key='live_key')
+    assert cc.rate_limiter.rate == 20
+    assert len(cc.rate_limiter.windows) == 4 and cc.rate_limiter.tokens <= 19
+    assert CryptoCompare(api_key='live_key').rate_limiter is cc.rate_limiter
+    assert len(calls) == 1
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pytest
+
+from cryptodatapy.extract.registry import data_sources, get_data_source
+
+
+def test_get_data_source() -> None:
+    """
+    Test data sources resolve to their classes.
+    """
+    from cryptodatapy.extract.data_vendors.glassnode_api import Glassnode
+    from cryptodatapy.extract.libraries import PandasDataReader
+
+    assert get_data_source('glassnode') is Glassnode
+    assert get_data_source('fred') is get_data_source('yahoo') is PandasDataReader
+    assert all(isinstance(get_data_source(source), type) for source in data_sources)
+    with pytest.raises(ValueError):
+        get_data_source('bloomberg')
+
+
+def test_lazy_imports() -> None:
+    """
+    Test importing the package and a single data source doesn't import other data sources' dependencies.
+    """
+    code = (
+        "import sys, cryptodatapy\n"
+        "from cryptodatapy.extract.registry import get_data_source\n"
+        "get_data_source('glassnode')\n"
+        "print([mod for mod in ['ccxt', 'investpy', 'dbnomics', 'yfinance', 'coinmetrics', 'selenium', 'prophet',"
+        " 'statsmodels'] if mod in sys.modules])"
+    )
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == '[]'
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,85 @@
+import pytest
+import requests
+import responses
+
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.extract.ratelimiter import RateLimiter
+from cryptodatapy.extract.retry import RetryPolicy, retry_counter
+
+url = 'https://api.glassnode.com/v1/metrics/market/price_usd_close'
+
+
+def make_resp(status_code, headers=None):
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp.headers.update(headers or {})
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    retry_counter.reset()
+
+
+def test_is_retryable() -> None:
+    """
+    Test classification of errors as retryable or fatal.
+    """
+    policy = RetryPolicy()
+    assert policy.is_retryable(requests.exceptions.HTTPError(response=make_resp(429)))
+    assert policy.is_retryable(requests.exceptions.HTTPError(response=make_resp(503)))
+    assert policy.is_retryable(requests.exceptions.ConnectionError())
+    assert not policy.is_retryable(requests.exceptions.HTTPError(response=make_resp(404)))
+    assert not policy.is_retryable(requests.exceptions.HTTPError(response=make_resp(401)))
+    assert not policy.is_retryable(KeyError('data'))
+
+
+def test_get_wait() -> None:
+    """
+    Test jittered exponential backoff, capped unless the data source asks to wait longer.
+    """
+    policy = RetryPolicy(backoff=1, max_backoff=3)
+    assert 0 <= policy.get_wait(1) <= 1
+    assert all(0 <= policy.get_wait(5) <= 3 for _ in range(20))
+    assert RetryPolicy(backoff=1, jitter=False).get_wait(3) == 4
+    assert policy.get_wait(1, make_resp(429, {'Retry-After': '10'})) == 10
+    assert policy.get_retry_after(make_resp(429, {'X-RateLimit-Reset': '5'})) == 5
+    assert policy.get_retry_after(make_resp(503, {'X-RateLimit-Reset': '5'})) is None
+    assert policy.get_retry_after(make_resp(429, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+@responses.activate
+def test_get_req_fail_fast() -> None:
+    """
+    Test client errors aren't retried.
+    """
+    responses.add(responses.GET, url, json={'message': 'not found'}, status=404)
+    assert DataRequest(trials=5).get_req(url=url, params={}) is None
+    assert len(responses.calls) == 1
+    assert retry_counter.get() == 0
+
+
+@responses.activate
+def test_get_req_retry_after() -> None:
+    """
+    Test rate limited requests are retried after the Retry-After delay, pausing the rate limiter, and counted.
+    """
+    responses.add(responses.GET, url, status=429, headers={'Retry-After': '0.2'})
+    responses.add(responses.GET, url, status=503)
+    responses.add(responses.GET, url, json={'data': [1, 2, 3]}, status=200)
+    rl = RateLimiter(rate=10)
+
+    assert DataRequest(trials=3, pause=0).get_req(url=url, params={}, rate_limiter=rl) == {'data': [1, 2, 3]}
+    assert len(responses.calls) == 3
+    assert retry_counter.get(host='https://api.glassnode.com') == 2
+    assert retry_counter.get(reason=429) == 1
+
+    responses.replace(responses.GET, url, status=500)
+    assert DataRequest(trials=2, pause=0).get_req(url=url, params={}) is None
+    assert retry_counter.get(reason='500') == 1
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+
+import pytest
+
+from cryptodatapy.extract.ratelimiter import RateLimiter
+from cryptodatapy.extract.scheduler import Scheduler, current_priority
+
+
+@pytest.fixture
+def sched():
+    return Scheduler(max_workers=2)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Fake clock for rate limiters, advanced by setting clock.now.
+    """
+    class Clock:
+        now = 0.0
+
+    monkeypatch.setattr(RateLimiter, 'clock', staticmethod(lambda: Clock.now))
+    return Clock
+
+
+def test_priority(sched) -> None:
+    """
+    Test interactive tasks are dispatched before queued backfill tasks.
+    """
+    sched.max_workers = 1
+    release, order = threading.Event(), []
+    blocker = sched.submit(release.wait)
+
+    futures = [sched.submit(order.append, f"backfill_{i}", priority='backfill') for i in range(2)]
+    with sched.priority('interactive'):
+        futures += [sched.submit(order.append, f"interactive_{i}") for i in range(2)]
+    release.set()
+
+    for future in [blocker] + futures:
+        future.result(timeout=5)
+    assert order == ['interactive_0', 'interactive_1', 'backfill_0', 'backfill_1']
+
+
+def test_throttled_source(sched, clock) -> None:
+    """
+    Test a throttled data source doesn't hold up tasks for other data sources.
+    """
+    slow, fast = RateLimiter(rate=2, capacity=1), RateLimiter(rate=100, capacity=5)
+
+    slow_futures = [sched.submit(lambda i: i, i, rate_limiter=slow) for i in range(3)]
+    fast_futures = [sched.submit(lambda i: i, i, rate_limiter=fast) for i in range(5)]
+
+    # fast tasks run while the clock is stopped and slow tasks wait for tokens
+    assert [future.result(timeout=5) for future in fast_futures] == list(range(5))
+    assert slow_futures[0].result(timeout=5) == 0
+    assert not slow_futures[1].done() and not slow_futures[2].done()
+
+    # slow tasks are dispatched at the refill rate
+    clock.now += 0.5
+    assert slow_futures[1].result(timeout=5) == 1
+    assert not slow_futures[2].done()
+    clock.now += 0.5
+    assert slow_futures[2].result(timeout=5) == 2
+
+
+def test_run(sched) -> None:
+    """
+    Test results, exceptions and nested tasks are returned to the caller.
+    """
+    rl = RateLimiter(rate=10)
+    assert sched.run(sum, [1, 2], rate_limiter=rl) == 3
+    assert sched.run(lambda: sched.run(max, 1, 2, rate_limiter=rl)) == 2
+    with pytest.raises(ZeroDivisionError):
+        sched.run(lambda: 1 / 0)
+
+    async def acquire():
+        await sched.acquire_async(rl, priority='backfill')
+        return current_priority.get()
+
+    assert asyncio.run(acquire()) == 'interactive'
+
+
+def test_params(sched) -> None:
+    """
+    Test scheduler parameter validation.
+    """
+    with pytest.raises(ValueError):
+        Scheduler(max_workers=0)
+    with pytest.raises(ValueError):
+        sched.submit(print, priority='urgent')
+    with pytest.raises(ValueError):
+        with sched.priority('urgent'):
+            pass
+
+
+if __name__ == "__main__":
+    pytest.main()
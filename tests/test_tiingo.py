@@ -167,6 +167,42 @@ def test_wrangle_fx_data_resp(tg, tg_req_fx) -> None:
     assert isinstance(df.close.iloc[-1], np.float64), "Close price should be a numpy float."  # dtypes
 
 
+def test_get_batches(tg) -> None:
+    """
+    Test tickers are batched within ticker count, url length and response size limits.
+    """
+    tickers = [f"coin{i}usd" for i in range(250)]
+    data_req = DataRequest(tickers=['btc'], cat='crypto', start_date='2020-01-01', end_date='2020-12-31')
+    assert [len(batch) for batch in tg.get_batches(data_req, tickers)] == [100, 100, 50]
+
+    tg.max_batch_chars = 100
+    assert max(len(','.join(batch)) for batch in tg.get_batches(data_req, tickers)) <= 100
+
+    data_req = DataRequest(tickers=['btc'], cat='crypto', freq='1min', start_date='2020-01-01',
+                           end_date='2020-12-31')
+    assert all(len(batch) == 1 for batch in tg.get_batches(data_req, tickers[:3]))
+
+
+def test_iter_tickers_batch(tg, tg_req_crypto, monkeypatch) -> None:
+    """
+    Test crypto tickers are requested together and the response is split into tidy frames for each ticker.
+    """
+    requested = []
+
+    def req_data(data_req, data_type, ticker):
+        requested.append(ticker)
+        return [dict(tg_req_crypto[0], ticker=tg_ticker) for tg_ticker in ticker.split(',') if tg_ticker != 'adausd']
+
+    monkeypatch.setattr(tg, 'req_data', req_data)
+    data_req = DataRequest(tickers=['btc', 'eth', 'ada'], cat='crypto', start_date='2015-01-01',
+                           end_date='2021-12-31')
+    df = tg.get_all_tickers(data_req, data_type='crypto')
+
+    assert requested == ['btcusd,ethusd,adausd']
+    assert list(df.index.get_level_values('ticker').unique()) == ['BTC', 'ETH']
+    assert df.xs('ETH', level='ticker').equals(df.xs('BTC', level='ticker'))
+
+
 def test_integration_get_all_tickers(tg) -> None:
     """
     Test integration of req_data, wrangle_data_resp and get_tidy_data to retrieve data for all tickers